@@ -13,11 +13,14 @@ import math
 import numpy as np
 import csv
 import re
+import warnings
 import mathutils
 from bpy.props import FloatProperty, CollectionProperty, StringProperty
 from bpy.types import Operator, Panel, PropertyGroup
 from bpy_extras.io_utils import ImportHelper
 
+from .keyframes import keyframe_channels, last_value_per_frame
+
 # Conversion constants
 MPH_TO_MPS = 0.44704  # Convert mph to m/s
 DEG_TO_RAD = np.pi / 180  # Convert degrees to radians
@@ -124,6 +127,82 @@ def integrate_step(x, y, psi, v, r, dt, a, rdot, beta_prev=0.0, beta_next=0.0):
     return x_next, y_next, psi_next, v_next, r_next
 
 
+def integrate_samples(time, speed, yaw_rate, fps, x0, y0, psi0, beta=None):
+    """Integrate time/speed/yaw-rate samples into per-frame poses.
+
+    Each forward segment is split across the frames it spans and stepped with
+    :func:`integrate_step`, ``beta`` (per-sample slip angle, rad) being
+    interpolated linearly within the segment. Output arrays are preallocated
+    from the frame count, so the loop only does scalar arithmetic.
+
+    Returns ``(frames, xs, ys, psis)``: the initial pose at frame 0, one entry
+    per integrated frame, then the end pose at the final sample time.
+    """
+    time = np.asarray(time, dtype=float)
+    speed = np.asarray(speed, dtype=float)
+    yaw_rate = np.asarray(yaw_rate, dtype=float)
+    if beta is None:
+        beta = np.zeros_like(time)
+    else:
+        beta = np.asarray(beta, dtype=float)
+
+    # frame 0 corresponds to t=0; np.rint rounds half-to-even like round()
+    sample_frames = np.rint(time * fps).astype(np.int64)
+    dt_intervals = np.diff(time)
+    # Ensure at least 1 step so something happens even for tiny dt;
+    # non-forward intervals are skipped.
+    num_steps = np.maximum(np.diff(sample_frames), 1)
+    num_steps[dt_intervals <= 0] = 0
+
+    total = int(num_steps.sum()) + 2
+    frames = np.empty(total, dtype=np.int64)
+    xs = np.empty(total)
+    ys = np.empty(total)
+    psis = np.empty(total)
+
+    x, y, psi = float(x0), float(y0), float(psi0)
+    frames[0], xs[0], ys[0], psis[0] = 0, x, y, psi
+    k = 1
+
+    for i in range(len(time) - 1):
+        n = int(num_steps[i])
+        if n == 0:
+            continue
+
+        dt_interval = float(dt_intervals[i])
+        # Distribute dt exactly across steps to match the interval duration
+        dt = dt_interval / n
+
+        # Snap to the sample values at the start of the segment
+        v = float(speed[i])
+        r = float(yaw_rate[i])
+
+        # Per-interval constant rates (linear interpolation of v and r over the segment)
+        a = (float(speed[i + 1]) - v) / dt_interval
+        rdot = (float(yaw_rate[i + 1]) - r) / dt_interval
+
+        beta_start = float(beta[i])
+        beta_delta = float(beta[i + 1]) - beta_start
+        f0 = int(sample_frames[i])
+
+        for step in range(n):
+            beta_prev = beta_start + beta_delta * (step / n)
+            beta_next = beta_start + beta_delta * ((step + 1) / n)
+            x, y, psi, v, r = integrate_step(x, y, psi, v, r, dt, a, rdot, beta_prev, beta_next)
+
+            frames[k] = f0 + step + 1  # +1 so motion begins after initial key at frame 0
+            xs[k], ys[k], psis[k] = x, y, psi
+            k += 1
+
+    # Ensure a key at the final sample time (exact end); if rounding put it
+    # behind the last keyed frame, keep the last keyed frame instead.
+    frames[k] = max(int(sample_frames[-1]), int(frames[:k].max()))
+    xs[k], ys[k], psis[k] = x, y, psi
+    k += 1
+
+    return frames[:k], xs[:k], ys[:k], psis[:k]
+
+
 def import_csv_data(filepath, context):
     """Reads CSV and fills the Speed-Time table"""
     scene = context.scene
@@ -136,52 +215,48 @@ def import_csv_data(filepath, context):
     # Clear existing entries
     entries.clear()
 
-    times = []
     mode = scene.anim_settings.edr_input_mode
 
-    # Read CSV file without relying on headers
+    # Quoted numeric cells ("1.5") must still parse, so drop the quotes first.
     with open(filepath, newline='') as csvfile:
-        reader = csv.reader(csvfile)  # Read raw rows
-        valid_rows = []
-
-        for row in reader:
-            if len(row) < 3:  # Ensure there are at least three columns
-                continue
-
-            try:
-                # Attempt to parse the first three columns as floats
-                time_val = float(row[0])
-                speed_val = float(row[1])
-                third_col_val = float(row[2])
-
-                valid_rows.append((time_val, speed_val, third_col_val))
-            except ValueError:
-                # Skip any row that can't be converted to numbers
-                continue
+        lines = csvfile.read().replace('"', '').splitlines()
+
+    # Parse the first three columns in one vectorized pass without relying on
+    # headers. Short rows are skipped and non-numeric cells (headers, notes)
+    # come back as NaN, so those rows are dropped afterwards.
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        data = np.genfromtxt(
+            lines, delimiter=',', usecols=(0, 1, 2), invalid_raise=False, ndmin=2,
+        )
+    if data.size:
+        data = data[~np.isnan(data).any(axis=1)]
 
     # If no valid data was found
-    if not valid_rows:
+    if not len(data):
         print("ERROR: No valid numerical data found in CSV file. Check formatting.")
         return
 
-    # Populate scene properties
-    for time_val, speed_val, third_col_val in valid_rows:
-        entry = entries.add()
-        entry.time = time_val
-        entry.speed = speed_val
-        if mode == 'STEERING_WHEEL_ANGLE':
-            entry.steering_wheel_angle = third_col_val
-            entry.yaw_rate = 0.0
-        else:
-            entry.yaw_rate = third_col_val
-            entry.steering_wheel_angle = 0.0
-        times.append(time_val)
-
     # Offset time if the first entry is negative
-    min_time = min(times)
+    min_time = float(data[:, 0].min())
     if min_time < 0:
-        for entry in entries:
-            entry.time -= min_time  # Shift all times so the first is at 0
+        data[:, 0] -= min_time  # Shift all times so the first is at 0
+
+    # Populate scene properties, writing each column in a single call
+    num_rows = len(data)
+    for _ in range(num_rows):
+        entries.add()
+
+    third_col = np.ascontiguousarray(data[:, 2], dtype=np.float32)
+    zeros = np.zeros(num_rows, dtype=np.float32)
+    entries.foreach_set("time", np.ascontiguousarray(data[:, 0], dtype=np.float32))
+    entries.foreach_set("speed", np.ascontiguousarray(data[:, 1], dtype=np.float32))
+    if mode == 'STEERING_WHEEL_ANGLE':
+        entries.foreach_set("steering_wheel_angle", third_col)
+        entries.foreach_set("yaw_rate", zeros)
+    else:
+        entries.foreach_set("yaw_rate", third_col)
+        entries.foreach_set("steering_wheel_angle", zeros)
 
     # Adjust Blender timeline to start at frame 0
     context.scene.frame_start = 0
@@ -478,91 +553,38 @@ def animate_vehicle(self, context):
     x0, y0, z0 = obj.location
     psi0 = obj.rotation_euler.z
 
-    x = float(x0)
-    y = float(y0)
-    psi = float(psi0)
-
-    # Keyframe initial pose at frame 0
-    obj.location = (x, y, 0.0)
-    obj.rotation_euler.z = psi
-    obj.keyframe_insert(data_path="location", frame=0)
-    obj.keyframe_insert(data_path="rotation_euler", frame=0)
-
-    # Helper: map seconds -> frame index (keep consistent)
-    def t_to_frame(tsec: float) -> int:
-        # frame 0 corresponds to t=0
-        return int(round(tsec * fps))
-
-    last_keyed_frame = 0
-
-    # Integrate segment-by-segment
-    for i in range(len(time) - 1):
-        t0 = float(time[i])
-        t1 = float(time[i + 1])
-        dt_interval = t1 - t0
-        if dt_interval <= 0:
-            # Skip non-forward intervals
-            continue
-
-        # Frames spanning this interval
-        f0 = t_to_frame(t0)
-        f1 = t_to_frame(t1)
+    rot_x = float(obj.rotation_euler.x)
+    rot_y = float(obj.rotation_euler.y)
 
-        # Ensure at least 1 step so something happens even for tiny dt
-        num_steps = max(f1 - f0, 1)
-
-        # Distribute dt exactly across steps to match the interval duration
-        dt = dt_interval / num_steps
-
-        # Snap to the sample values at the start of the segment
-        v = float(speed[i])
-        r = float(yaw_rate[i])
-
-        # Per-interval constant rates (linear interpolation of v and r over the segment)
-        a = (float(speed[i + 1]) - float(speed[i])) / dt_interval
-        rdot = (float(yaw_rate[i + 1]) - float(yaw_rate[i])) / dt_interval
-
-        if use_slip:
-            # Use a single beta model for both input modes based on yaw-rate.
-            # In steering mode, yaw_rate was already estimated from steering above.
-            beta_start = float(estimate_slip_angle_from_yaw_rate(
-                speed[i], yaw_rate[i], wheelbase, slip_gain, slip_max_deg
-            ))
-            beta_end = float(estimate_slip_angle_from_yaw_rate(
-                speed[i + 1], yaw_rate[i + 1], wheelbase, slip_gain, slip_max_deg
-            ))
-        else:
-            beta_start = 0.0
-            beta_end = 0.0
-
-        # Step through frames within this segment
-        for step in range(num_steps):
-            frac_prev = step / num_steps
-            frac_next = (step + 1) / num_steps
-            beta_prev = beta_start + (beta_end - beta_start) * frac_prev
-            beta_next = beta_start + (beta_end - beta_start) * frac_next
-            x, y, psi, v, r = integrate_step(x, y, psi, v, r, dt, a, rdot, beta_prev, beta_next)
-
-            frame_num = f0 + step + 1  # +1 so motion begins after initial key at frame 0
-            obj.location = (x, y, 0.0)
-            obj.rotation_euler.z = psi
-            obj.keyframe_insert(data_path="location", frame=frame_num)
-            obj.keyframe_insert(data_path="rotation_euler", frame=frame_num)
-
-            last_keyed_frame = max(last_keyed_frame, frame_num)
-
-        # Optional: update motion path after each segment (can be slow on large data)
-        update_motion_path(obj)
+    if use_slip:
+        # Use a single beta model for both input modes based on yaw-rate.
+        # In steering mode, yaw_rate was already estimated from steering above.
+        beta = estimate_slip_angle_from_yaw_rate(speed, yaw_rate, wheelbase, slip_gain, slip_max_deg)
+    else:
+        beta = None
 
-    # Ensure a key at the final sample time (exact end)
-    final_frame = t_to_frame(float(time[-1]))
-    # If final_frame is behind last keyed because of rounding, keep last_keyed_frame
-    final_frame = max(final_frame, last_keyed_frame)
+    key_frames, key_x, key_y, key_psi = integrate_samples(
+        time, speed, yaw_rate, fps, float(x0), float(y0), float(psi0), beta
+    )
+    final_frame = int(key_frames[-1])
+    x = float(key_x[-1])
+    y = float(key_y[-1])
+    psi = float(key_psi[-1])
+
+    # Later samples on the same frame replace earlier ones, as keyframe_insert would.
+    frames, xs, ys, headings = last_value_per_frame(key_frames, key_x, key_y, key_psi)
+    num_keys = len(frames)
+    keyframe_channels(obj, "location", frames, (xs, ys, np.zeros(num_keys)))
+    keyframe_channels(
+        obj, "rotation_euler", frames,
+        (np.full(num_keys, rot_x), np.full(num_keys, rot_y), headings),
+    )
 
     obj.location = (x, y, 0.0)
     obj.rotation_euler.z = psi
-    obj.keyframe_insert(data_path="location", frame=final_frame)
-    obj.keyframe_insert(data_path="rotation_euler", frame=final_frame)
+
+    # Recalculate an existing motion path once, now that every key is written.
+    update_motion_path(obj)
 
     # Extend timeline if needed
     if final_frame > scene.frame_end:
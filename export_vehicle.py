@@ -479,7 +479,6 @@ def export(file, dirname,
                         #IF NODES ARE THERE FOR HVE
                         hveTexture = nodes.get("hveTexture", None)
                         if hveTexture is not None:
-                            hveTexture = nodes.get("hveTexture")
                             print(hveTexture)
                             mesh_material_mtex[i] = tex_principled
                             mesh_material_images[i] = hveTexture.image
@@ -806,40 +805,40 @@ def export(file, dirname,
                 
                 diffuseColor = nodes.get("diffuseColor", None)
                 if diffuseColor is not None:
-                    diffuseColor = nodes.get("diffuseColor", None).outputs[0].default_value
+                    diffuseColor = diffuseColor.outputs[0].default_value
                     diffuseColor = diffuseColor[0], diffuseColor[1], diffuseColor[2]
                 else:
                     diffuseColor = diffColor
                 ambientColor = nodes.get("ambientColor", None)
                 if ambientColor is not None:
-                    ambientColor = nodes.get("ambientColor", None).outputs[0].default_value
+                    ambientColor = ambientColor.outputs[0].default_value
                     ambientColor = ambientColor[0], ambientColor[1], ambientColor[2]
                 else:
                     ambientColor = ambiColor
                     
                 specularColor = nodes.get("specularColor", None)
                 if specularColor is not None:
-                    specularColor = nodes.get("specularColor", None).outputs[0].default_value
+                    specularColor = specularColor.outputs[0].default_value
                     specularColor = specularColor[0], specularColor[1], specularColor[2]   
                 else:
                     specularColor = specColor
                     
                 emissiveColor = nodes.get("emissiveColor", None)
                 if emissiveColor is not None:
-                    emissiveColor = nodes.get("emissiveColor", None).outputs[0].default_value
+                    emissiveColor = emissiveColor.outputs[0].default_value
                     emissiveColor = emissiveColor[0], emissiveColor[1], emissiveColor[2]
                 else:
                     emissiveColor = emisColor
                     
                 shininess = nodes.get("shininess", None)
                 if shininess is not None:
-                    shininess = nodes.get("shininess", None).inputs[0].default_value
+                    shininess = shininess.inputs[0].default_value
                 else:
                     shininess = shine
                     
                 transparency = nodes.get("transparency", None)
                 if transparency is not None:
-                    transparency = nodes.get("transparency", None).inputs[0].default_value
+                    transparency = transparency.inputs[0].default_value
                     print('transparency')
                     print(transparency)
                 else:
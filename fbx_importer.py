@@ -4,8 +4,10 @@ import re
 import math
 import struct
 import time
+from collections import defaultdict
 from contextlib import contextmanager
 import mathutils  # Blender's math utilities library
+from .keyframes import set_keyframe_interpolation
 bl_info = {
     "name": "HVE FBX Import",
     "category": "Import-Export",
@@ -25,6 +27,11 @@ ROTATION_AXIS_KEYWORDS = {
     "Z": ["Steering", "Yaw"],   # Z-axis rotation
 }
 
+# Blender's duplicate-name suffix ("Car.001"), compiled once for the many
+# per-object and per-vehicle name comparisons below.
+_DUP_SUFFIX_RE = re.compile(r"\.\d+$")
+_SHAPE_KEY_PATH_RE = re.compile(r'key_blocks\["([^"]+)"\]')
+
 
 class ImportTimingReport:
     """Collect and print coarse timings for the HVE FBX import pipeline."""
@@ -121,7 +128,7 @@ def normalize_name(name: str) -> str:
 
 def normalize_root_name(name: str) -> str:
     """Return the base vehicle identifier without numeric suffixes or colon paths."""
-    name = re.sub(r"\.\d+$", "", name)
+    name = _DUP_SUFFIX_RE.sub('', name)
     return name.split(":")[0]
 
 
@@ -155,7 +162,20 @@ def get_root_vehicle_names(imported_objects):
     return vehicle_names
 
 
-def belongs_to_vehicle(obj_name: str, vehicle_name: str) -> bool:
+def vehicle_name_tokens(vehicle_name: str) -> list:
+    """Return the lowercase tokens :func:`belongs_to_vehicle` matches for ``vehicle_name``.
+
+    Callers testing many objects against one vehicle can compute this once and
+    pass it as ``vehicle_tokens``.
+    """
+    return [
+        t
+        for t in re.split(r"[\W_]+", vehicle_name.replace("_", " ").lower())
+        if t
+    ]
+
+
+def belongs_to_vehicle(obj_name: str, vehicle_name: str, vehicle_tokens=None) -> bool:
     """Return ``True`` if ``obj_name`` appears to belong to ``vehicle_name``.
 
     Both names are normalized by replacing underscores with spaces and splitting
@@ -174,16 +194,20 @@ def belongs_to_vehicle(obj_name: str, vehicle_name: str) -> bool:
     False
     """
 
-    vehicle_tokens = [
-        t
-        for t in re.split(r"[\W_]+", vehicle_name.replace("_", " ").lower())
-        if t
-    ]
+    if vehicle_tokens is None:
+        vehicle_tokens = vehicle_name_tokens(vehicle_name)
     obj_name = obj_name.replace("_", " ")
 
+    # Every matched token is a substring of the lowercased name, so a missing
+    # token rules the object out before any per-segment tokenizing.
+    lowered_name = obj_name.lower()
+    for token in vehicle_tokens:
+        if token not in lowered_name:
+            return False
+
     for segment in obj_name.split(":"):
         # Strip Blender numeric suffixes like ".001" before tokenizing
-        segment = re.sub(r"\.\d+$", "", segment).lower()
+        segment = _DUP_SUFFIX_RE.sub('', segment).lower()
         tokens = [t for t in re.split(r"[\W_]+", segment) if t]
         for i in range(len(tokens) - len(vehicle_tokens) + 1):
             if tokens[i : i + len(vehicle_tokens)] == vehicle_tokens:
@@ -610,6 +634,38 @@ def remove_from_all_collections(obj):
     if obj.name in active_root.objects:
         active_root.objects.unlink(obj)
 
+def move_objects_to_collection(objects, target_collection):
+    """Move ``objects`` into ``target_collection`` with batched unlinking.
+
+    Objects are first grouped by the collections that currently hold them so
+    each source collection's ``objects`` accessor is resolved once, then
+    unlinked and relinked in two flat passes instead of one RNA roundtrip
+    sequence per object.
+    """
+    if not objects:
+        return
+
+    by_source = defaultdict(list)
+    active_root = bpy.context.scene.collection
+    root_objects = active_root.objects
+    for obj in objects:
+        users = obj.users_collection
+        for collection in users:
+            by_source[collection].append(obj)
+        # The scene master collection is not reported by ``users_collection``
+        # (see remove_from_all_collections), so check it explicitly.
+        if active_root not in users and obj.name in root_objects:
+            by_source[active_root].append(obj)
+
+    for source, source_objects in by_source.items():
+        unlink = source.objects.unlink
+        for obj in source_objects:
+            unlink(obj)
+
+    link = target_collection.objects.link
+    for obj in objects:
+        link(obj)
+
 def assign_objects_to_subcollection(collection_name, parent_collection, objects):
     """
     Create a subcollection under the given parent collection and assign objects to it.
@@ -708,7 +764,7 @@ def _iter_collection_tree(collection):
 
 def strip_blender_numeric_suffix(name: str) -> str:
     """Remove Blender's trailing numeric suffix (e.g. ``.001``) from ``name``."""
-    return re.sub(r"\.\d+$", "", name)
+    return _DUP_SUFFIX_RE.sub('', name)
 
 
 def get_existing_fbx_collections(filename):
@@ -801,8 +857,7 @@ def bake_shape_keys_to_keyframes(obj):
         # foreach_set writes all coordinates in one C-level call — much faster than a Python loop.
         coords = [coord for pair in zip(frames, values) for coord in (float(pair[0]), pair[1])]
         kps.foreach_set("co", coords)
-        for kp in kps:
-            kp.interpolation = 'LINEAR'
+        set_keyframe_interpolation(fcurve, 'LINEAR')
         fcurve.update()
 
     print(f"✅ Shape keys baked for {obj.name}")
@@ -928,8 +983,7 @@ def read_shape_key_frames_directly(obj):
             if not dp.endswith('.value'):
                 continue
             # Extract key name from data path like key_blocks["Name"].value
-            import re as _re
-            m = _re.search(r'key_blocks\["([^"]+)"\]', dp)
+            m = _SHAPE_KEY_PATH_RE.search(dp)
             if not m:
                 continue
             key_name = m.group(1)
@@ -1099,8 +1153,7 @@ def set_shape_key_fcurve_interpolation(shape_keys, key_name, interpolation="LINE
     for fcurve in action_fcurves:
         if getattr(fcurve, "data_path", None) != data_path:
             continue
-        for keyframe in getattr(fcurve, "keyframe_points", []):
-            keyframe.interpolation = interpolation
+        set_keyframe_interpolation(fcurve, interpolation)
 
 
 def trim_sample_indices(frame_numbers, frame_vertex_positions, selected_indices, max_samples):
@@ -1196,12 +1249,13 @@ def reduce_shape_key_meshes_with_adaptive_samples(
             ]
 
         if not mesh_objects:
-            clean_vehicle_name = re.sub(r"\.\d+$", "", vehicle_name)
+            clean_vehicle_name = _DUP_SUFFIX_RE.sub('', vehicle_name)
+            clean_vehicle_tokens = vehicle_name_tokens(clean_vehicle_name)
             source_objects = imported_objects if imported_objects is not None else bpy.context.scene.objects
             mesh_objects = [
                 obj
                 for obj in source_objects
-                if obj.type == "MESH" and belongs_to_vehicle(obj.name, clean_vehicle_name)
+                if obj.type == "MESH" and belongs_to_vehicle(obj.name, clean_vehicle_name, clean_vehicle_tokens)
                 and (not imported_pointer_set or (obj.as_pointer() if hasattr(obj, "as_pointer") else id(obj)) in imported_pointer_set)
             ]
 
@@ -1270,7 +1324,8 @@ def object_pointer(obj):
 
 def get_body_mesh_objects_for_vehicle(vehicle_name, imported_objects=None, imported_pointer_set=None):
     """Collect imported non-wheel body mesh objects for ``vehicle_name``."""
-    clean_vehicle_name = re.sub(r"\.\d+$", "", vehicle_name)
+    clean_vehicle_name = _DUP_SUFFIX_RE.sub('', vehicle_name)
+    clean_vehicle_tokens = vehicle_name_tokens(clean_vehicle_name)
 
     if imported_objects is None:
         imported_objects = list(getattr(getattr(bpy.context, "scene", None), "objects", []))
@@ -1300,7 +1355,7 @@ def get_body_mesh_objects_for_vehicle(vehicle_name, imported_objects=None, impor
             if (
                 obj.type == "MESH"
                 and object_pointer(obj) in imported_pointer_set
-                and belongs_to_vehicle(obj.name, clean_vehicle_name)
+                and belongs_to_vehicle(obj.name, clean_vehicle_name, clean_vehicle_tokens)
                 and not (
                     re.search(r"wheel", obj.name, re.IGNORECASE)
                     or any(
@@ -1463,7 +1518,7 @@ def join_mesh_objects_per_vehicle(vehicle_names, imported_objects=None, imported
     """Joins all imported MESH objects per vehicle separately, after baking shape keys."""
 
     for vehicle_name in vehicle_names:
-        clean_vehicle_name = re.sub(r'\.\d+$', '', vehicle_name)
+        clean_vehicle_name = _DUP_SUFFIX_RE.sub('', vehicle_name)
         mesh_objects = get_body_mesh_objects_for_vehicle(
             vehicle_name,
             imported_objects,
@@ -1613,10 +1668,11 @@ def materials_are_equal(mat1, mat2, tol=1e-4):
 
 def find_duplicate_materials_for_vehicle(vehicle_name):
     """Find duplicate materials within a single vehicle's objects."""
-    clean_vehicle_name = re.sub(r'\.\d+$', '', vehicle_name)
+    clean_vehicle_name = _DUP_SUFFIX_RE.sub('', vehicle_name)
+    clean_vehicle_tokens = vehicle_name_tokens(clean_vehicle_name)
     materials = []
     for obj in bpy.data.objects:
-        if obj.type == 'MESH' and belongs_to_vehicle(obj.name, clean_vehicle_name):
+        if obj.type == 'MESH' and belongs_to_vehicle(obj.name, clean_vehicle_name, clean_vehicle_tokens):
             materials.extend([slot.material for slot in obj.material_slots if slot.material and slot.material.name.startswith("meshMaterial")])
 
     unique_materials = []
@@ -1634,9 +1690,10 @@ def find_duplicate_materials_for_vehicle(vehicle_name):
 
 def replace_materials_for_vehicle(vehicle_name, material_map):
     """Replace duplicate materials within a single vehicle's objects."""
-    clean_vehicle_name = re.sub(r'\.\d+$', '', vehicle_name)
+    clean_vehicle_name = _DUP_SUFFIX_RE.sub('', vehicle_name)
+    clean_vehicle_tokens = vehicle_name_tokens(clean_vehicle_name)
     for obj in bpy.data.objects:
-        if obj.type == 'MESH' and belongs_to_vehicle(obj.name, clean_vehicle_name):
+        if obj.type == 'MESH' and belongs_to_vehicle(obj.name, clean_vehicle_name, clean_vehicle_tokens):
             for slot in obj.material_slots:
                 if slot.material in material_map:
                     slot.material = material_map[slot.material]
@@ -1650,14 +1707,15 @@ def remove_unused_materials():
 def merge_duplicate_materials_per_vehicle(vehicle_names):
     """Runs material merging separately for each vehicle."""
     for vehicle_name in vehicle_names:
-        clean_vehicle_name = re.sub(r'\.\d+$', '', vehicle_name)
+        clean_vehicle_name = _DUP_SUFFIX_RE.sub('', vehicle_name)
+        clean_vehicle_tokens = vehicle_name_tokens(clean_vehicle_name)
         print(f"🔍 Processing materials for {clean_vehicle_name}...")
         material_map = find_duplicate_materials_for_vehicle(clean_vehicle_name)
         if material_map:
             replace_materials_for_vehicle(clean_vehicle_name, material_map)
 
             for obj in bpy.data.objects:
-                if obj.type == 'MESH' and belongs_to_vehicle(obj.name, clean_vehicle_name):
+                if obj.type == 'MESH' and belongs_to_vehicle(obj.name, clean_vehicle_name, clean_vehicle_tokens):
                     collapse_material_slots(obj)
 
             remove_unused_materials()
@@ -1882,13 +1940,14 @@ def import_fbx(
         with timing_report.phase("detect vehicles and force preroll pose"):
             # Determine root vehicle names after any renaming or cleanup
             vehicle_names = get_root_vehicle_names(imported_objects)
+            clean_vehicle_names = {_DUP_SUFFIX_RE.sub('', vn) for vn in vehicle_names}
 
             # Force vehicle root empties to be zeroed at frame -1
             for obj in imported_objects:
                 if obj.type == "EMPTY" and obj.parent is None:
                     # Only apply to the top-level vehicle empties we detected
                     root = normalize_root_name(obj.name)
-                    if root in [re.sub(r'\.\d+$', '', vn) for vn in vehicle_names]:
+                    if root in clean_vehicle_names:
                         force_zero_preroll_pose(obj, frame=-1)
 
         report_import_progress(progress, "Replacing previous matching FBX imports")
@@ -1903,11 +1962,7 @@ def import_fbx(
         event_collection = ensure_collection_exists(event_collection_name, bpy.context.scene.collection, hide = False, dont_render=False)
 
         # Ensure the layer collection exists before setting it as active
-        layer_collection = None
-        for lc in bpy.context.view_layer.layer_collection.children:
-            if lc.name == event_collection.name:
-                layer_collection = lc
-                break
+        layer_collection = bpy.context.view_layer.layer_collection.children.get(event_collection.name)
 
         if layer_collection:
             bpy.context.view_layer.active_layer_collection = layer_collection
@@ -1919,28 +1974,27 @@ def import_fbx(
         # Move all selected objects to a new collection
         for vehicle_name in vehicle_names:
             # Remove any trailing '.###' from vehicle_name (e.g., 'Car.001' -> 'Car')
-            clean_vehicle_name = re.sub(r'\.\d+$', '', vehicle_name)
+            clean_vehicle_name = _DUP_SUFFIX_RE.sub('', vehicle_name)
+            clean_vehicle_tokens = vehicle_name_tokens(clean_vehicle_name)
 
 
             fbx_collection_name = f"HVE: {filename}: {vehicle_name}: FBX"
             fbx_collection = ensure_collection_exists(fbx_collection_name, event_collection, hide = False, dont_render=False)
 
             # Ensure the layer collection exists before setting it as active
-            layer_collection = None
-            for lc in bpy.context.view_layer.layer_collection.children:
-                if lc.name == fbx_collection.name:
-                    layer_collection = lc
-                    break
+            layer_collection = bpy.context.view_layer.layer_collection.children.get(fbx_collection.name)
 
             if layer_collection:
                 bpy.context.view_layer.active_layer_collection = layer_collection
 
             # Move objects to the collection
-            for obj in imported_objects:
-                if belongs_to_vehicle(obj.name, clean_vehicle_name):
-                    remove_from_all_collections(obj)
-                    fbx_collection.objects.link(obj)
-                    object_collections[obj.as_pointer()] = fbx_collection
+            vehicle_objects = [
+                obj for obj in imported_objects
+                if belongs_to_vehicle(obj.name, clean_vehicle_name, clean_vehicle_tokens)
+            ]
+            move_objects_to_collection(vehicle_objects, fbx_collection)
+            for obj in vehicle_objects:
+                object_collections[obj.as_pointer()] = fbx_collection
 
 
             # Create subcollections
@@ -1950,20 +2004,16 @@ def import_fbx(
             mesh_collection_name = f"Body Mesh: {vehicle_name}: {filename}: FBX"
             mesh_collection = ensure_collection_exists(mesh_collection_name, fbx_collection, hide = False, dont_render=False)
 
-            # Loop through imported objects
-            for obj in imported_objects:
-                existing_collection = object_collections.get(obj.as_pointer())
+            # Only objects matched to this vehicle above are considered, so a
+            # vehicle can't "claim" wheel-related helpers from other vehicles.
+            for obj in vehicle_objects:
+                pointer = obj.as_pointer()
+                existing_collection = object_collections.get(pointer)
                 if existing_collection and existing_collection != fbx_collection:
                     continue
-                # Don't let a vehicle "claim" wheel-related helpers from other vehicles
-                if not belongs_to_vehicle(obj.name, clean_vehicle_name):
-                    continue
                 if is_wheel_object(obj):
                     assign_objects_to_subcollection(wheels_collection_name, fbx_collection, obj)
-                    object_collections[obj.as_pointer()] = wheels_collection
-                    continue
-
-                if not belongs_to_vehicle(obj.name, clean_vehicle_name):
+                    object_collections[pointer] = wheels_collection
                     continue
 
                 if "Mesh" in obj.name:
@@ -1991,6 +2041,7 @@ def import_fbx(
                 print(f"WARNING: Could not find root empty for vehicle '{vehicle_name}' to rename to '{new_name}'")
 
         # Ensure any remaining imported objects follow their parent's collection
+        objects_by_target = defaultdict(list)
         for obj in imported_objects:
             if obj.as_pointer() in object_collections:
                 continue
@@ -2001,9 +2052,10 @@ def import_fbx(
                 parent_collection = object_collections.get(parent.as_pointer())
                 parent = parent.parent
 
-            target_collection = parent_collection or event_collection
-            remove_from_all_collections(obj)
-            target_collection.objects.link(obj)
+            objects_by_target[parent_collection or event_collection].append(obj)
+
+        for target_collection, target_objects in objects_by_target.items():
+            move_objects_to_collection(target_objects, target_collection)
 
         timing_report.finish_phase(collection_phase)
 
@@ -2035,26 +2087,45 @@ def import_fbx(
 
 
 
-def add_merge_by_distance_modifier(obj):
-    """Add a Weld (merge by distance) modifier to a mesh object if not already present."""
-    for mod in obj.modifiers:
-        if mod.type == 'WELD':
-            return
+def add_merge_by_distance_modifier(obj, existing_types=None):
+    """Add a Weld (merge by distance) modifier to a mesh object if not already present.
+
+    ``existing_types`` may hold the object's modifier types when the caller
+    already collected them, skipping another scan of ``obj.modifiers``.
+    """
+    if existing_types is None:
+        existing_types = {mod.type for mod in obj.modifiers}
+    if 'WELD' in existing_types:
+        return
     mod = obj.modifiers.new(name="Merge by Distance", type='WELD')
     mod.merge_threshold = 0.0001
 
 
-def add_smooth_by_angle_modifier(obj):
-    """Add an Edge Split (smooth by angle) modifier to a mesh object if not already present."""
-    for mod in obj.modifiers:
-        if mod.type == 'EDGE_SPLIT':
-            return
+def add_smooth_by_angle_modifier(obj, existing_types=None):
+    """Add an Edge Split (smooth by angle) modifier to a mesh object if not already present.
+
+    ``existing_types`` works as in :func:`add_merge_by_distance_modifier`.
+    """
+    if existing_types is None:
+        existing_types = {mod.type for mod in obj.modifiers}
+    if 'EDGE_SPLIT' in existing_types:
+        return
     mod = obj.modifiers.new(name="Smooth by Angle", type='EDGE_SPLIT')
     mod.split_angle = 0.523599  # 30 degrees in radians
     mod.use_edge_angle = True
     mod.use_edge_sharp = True
 
 
+def add_mesh_cleanup_modifiers(obj):
+    """Add whichever merge-by-distance / smooth-by-angle modifiers ``obj`` is missing.
+
+    The object's modifier stack is scanned once and shared by both checks.
+    """
+    existing_types = {mod.type for mod in obj.modifiers}
+    add_merge_by_distance_modifier(obj, existing_types)
+    add_smooth_by_angle_modifier(obj, existing_types)
+
+
 
 
 def load(context, filepath, operator=None):
@@ -2062,8 +2133,6 @@ def load(context, filepath, operator=None):
     if bpy.ops.object.mode_set.poll():
         bpy.ops.object.mode_set(mode='OBJECT')
 
-    dirname = os.path.dirname(filepath)
-
     import_fbx(context, filepath, operator=operator)
 
     return {'FINISHED'}
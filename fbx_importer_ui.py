@@ -110,8 +110,7 @@ def apply_mesh_cleanup_to_vehicles(vehicle_names):
     from . import fbx_importer
     count = 0
     for obj in iter_body_mesh_objects(vehicle_names):
-        fbx_importer.add_merge_by_distance_modifier(obj)
-        fbx_importer.add_smooth_by_angle_modifier(obj)
+        fbx_importer.add_mesh_cleanup_modifiers(obj)
         count += 1
     return count
 
@@ -10,9 +10,8 @@ bl_info = {
 
 import bpy
 import csv
-import os
-from mathutils import Euler
-from math import radians
+import warnings
+import numpy as np
 from bpy_extras.io_utils import ImportHelper
 from bpy.props import FloatProperty
 from bpy.types import PropertyGroup
@@ -20,6 +19,7 @@ from bpy.types import PropertyGroup
 # Reuse the bpy-free CSV helpers from the EDR importer so the column-mapping
 # behaviour (header detection, normalisation, file reading) stays consistent.
 from .edr_importer import normalize_header, detect_header_row, read_csv_headers
+from .keyframes import keyframe_channels, last_value_per_frame
 
 
 class MotionDataEntry(PropertyGroup):
@@ -40,28 +40,50 @@ def get_target_object(context):
     return context.object
 
 
-def import_motion_data_entries(filepath, target_obj):
-    """Import motion rows into the target object's stored entry collection."""
-    target_obj.motion_data_entries.clear()
+def read_motion_rows(filepath):
+    """Read the numeric rows of a Time, X, Y, Z, Roll, Pitch, Yaw motion CSV.
 
+    Returns an ``(N, 7)`` float array. Rows that do not hold exactly seven
+    numbers (headers, blank or partial lines) are skipped.
+    """
+    # Quoted numeric cells ("1.5") must still parse, so drop the quotes first.
     with open(filepath, 'r', newline='') as file:
-        reader = csv.reader(file)
-        for row in reader:
-            if len(row) < 7:
-                continue
-            try:
-                time, x, y, z, roll, pitch, yaw = map(float, row)
-            except ValueError:
-                continue
+        lines = [line for line in file.read().replace('"', '').splitlines() if line.count(',') == 6]
+    # A leading header is the usual non-numeric row; leave it out up front so
+    # the rest can go through np.loadtxt's compiled parser.
+    if lines:
+        try:
+            float(lines[0].split(',', 1)[0])
+        except ValueError:
+            lines = lines[1:]
+    if not lines:
+        return np.empty((0, 7))
+
+    try:
+        rows = np.loadtxt(lines, delimiter=',', comments=None, dtype=np.float64, ndmin=2)
+    except ValueError:
+        # Some other cell is not numeric; genfromtxt reads such cells as NaN.
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            rows = np.genfromtxt(lines, delimiter=',', comments=None, dtype=np.float64, ndmin=2)
+    return rows[~np.isnan(rows).any(axis=1)]
+
+
+def store_motion_data_entries(target_obj, rows):
+    """Replace ``target_obj.motion_data_entries`` with ``(N, 7)`` rows, one bulk write per field."""
+    entries = target_obj.motion_data_entries
+    entries.clear()
+    for _ in range(len(rows)):
+        entries.add()
+    for column, field in enumerate(MOTION_COLUMN_FIELDS):
+        entries.foreach_set(field, rows[:, column].tolist())
 
-            entry = target_obj.motion_data_entries.add()
-            entry.time = time
-            entry.x = x
-            entry.y = y
-            entry.z = z
-            entry.roll = roll
-            entry.pitch = pitch
-            entry.yaw = yaw
+
+def import_motion_data_entries(filepath, target_obj):
+    """Import motion rows into the target object's stored entry collection and return them."""
+    rows = read_motion_rows(filepath)
+    store_motion_data_entries(target_obj, rows)
+    return rows
 
 
 # ---------------------------------------------------------------------------
@@ -154,10 +176,9 @@ def import_mapped_motion_data(filepath, mapping, has_header, target_obj):
     if has_header and rows:
         rows = rows[1:]
 
-    target_obj.motion_data_entries.clear()
     max_idx = max(time_idx, x_idx, y_idx, z_idx, roll_idx, pitch_idx, yaw_idx)
 
-    count = 0
+    motion_rows = []
     for row in rows:
         if len(row) <= max_idx:
             continue
@@ -174,19 +195,20 @@ def import_mapped_motion_data(filepath, mapping, has_header, target_obj):
             except (ValueError, IndexError):
                 return 0.0
 
-        entry = target_obj.motion_data_entries.add()
-        entry.time = time
-        entry.x = optional(x_idx)
-        entry.y = optional(y_idx)
-        entry.z = optional(z_idx)
-        entry.roll = optional(roll_idx)
-        entry.pitch = optional(pitch_idx)
-        entry.yaw = optional(yaw_idx)
-        count += 1
-
-    if count == 0:
+        motion_rows.append((
+            time,
+            optional(x_idx),
+            optional(y_idx),
+            optional(z_idx),
+            optional(roll_idx),
+            optional(pitch_idx),
+            optional(yaw_idx),
+        ))
+
+    store_motion_data_entries(target_obj, np.array(motion_rows, dtype=np.float64).reshape(-1, 7))
+    if not motion_rows:
         return 0, "No valid numerical rows found with the selected columns."
-    return count, None
+    return len(motion_rows), None
 
 
 def ensure_origin_parent_empty(obj, context):
@@ -238,11 +260,40 @@ def set_extrapolation(obj, mode):
             fcurve.extrapolation = mode
 
 
-def animate_object_from_entries(context, obj, extrapolation_mode):
+def motion_keyframe_channels(rows, frame_rate, unit_scale):
+    """Return ``(frames, location, rotation)`` keys for ``(N, 7)`` motion rows.
+
+    Each row keys frame ``int(time * frame_rate)``; when several rows land on
+    the same frame the last one wins, as successive ``keyframe_insert`` calls
+    did. Positions are multiplied by ``unit_scale`` and angles converted from
+    degrees to radians.
+    """
+    rows = np.asarray(rows, dtype=np.float64).reshape(-1, 7)
+    # astype truncates toward zero, like int()
+    frames = (rows[:, 0] * frame_rate).astype(np.int64)
+    location = rows[:, 1:4] * unit_scale
+    rotation = np.radians(rows[:, 4:7])
+    frames, *channels = last_value_per_frame(frames, *location.T, *rotation.T)
+    return frames, tuple(channels[:3]), tuple(channels[3:])
+
+
+def read_motion_data_entries(obj):
+    """Return ``obj.motion_data_entries`` as an ``(N, 7)`` array in ``MOTION_COLUMN_FIELDS`` order."""
+    entries = obj.motion_data_entries
+    rows = np.empty((len(entries), len(MOTION_COLUMN_FIELDS)))
+    values = [0.0] * len(entries)
+    for column, field in enumerate(MOTION_COLUMN_FIELDS):
+        entries.foreach_get(field, values)
+        rows[:, column] = values
+    return rows
+
+
+def animate_object_from_entries(context, obj, extrapolation_mode, rows=None):
     """Keyframe ``obj`` from its stored ``motion_data_entries`` collection.
 
-    Position values are converted from feet to meters under an Imperial unit
-    system. Returns the number of keyframed rows.
+    ``rows`` may pass the ``(N, 7)`` array the entries were just stored from,
+    which skips reading them back. Position values are converted from feet to
+    meters under an Imperial unit system. Returns the number of keyframed rows.
     """
     scene = context.scene
     frame_rate = scene.render.fps  # User-defined FPS (synced with scene)
@@ -259,30 +310,27 @@ def animate_object_from_entries(context, obj, extrapolation_mode):
     # Ensure start frame is set to 0
     scene.frame_start = 0
 
-    frames = []
-    for entry in obj.motion_data_entries:
-        x = entry.x * unit_scale
-        y = entry.y * unit_scale
-        z = entry.z * unit_scale
-        frame = int(entry.time * frame_rate)
-        frames.append(frame)
-
-        obj.location = (x, y, z)
-        obj.keyframe_insert(data_path="location", frame=frame)
+    if rows is None:
+        rows = read_motion_data_entries(obj)
+    if len(rows):
+        # Key every row with one bulk write per channel
+        frames, location, rotation = motion_keyframe_channels(rows, frame_rate, unit_scale)
+        keyframe_channels(obj, "location", frames, location)
+        keyframe_channels(obj, "rotation_euler", frames, rotation)
 
-        obj.rotation_euler = Euler((radians(entry.roll), radians(entry.pitch), radians(entry.yaw)), 'XYZ')
-        obj.keyframe_insert(data_path="rotation_euler", frame=frame)
+        # Leave the object posed at the last row, as per-row keying did
+        obj.location = (rows[-1, 1:4] * unit_scale).tolist()
+        obj.rotation_euler = np.radians(rows[-1, 4:7]).tolist()
 
-    if frames:
         # 🔹 Apply the selected extrapolation mode
         if extrapolation_mode in {'LINEAR', 'CONSTANT'}:
             set_extrapolation(obj, extrapolation_mode)
 
-        last_frame = max(frames)
+        last_frame = int(frames[-1])
         if last_frame > scene.frame_end:
             scene.frame_end = last_frame
 
-    return len(frames)
+    return len(rows)
 
 
 class ImportCSVAnimationOperator(bpy.types.Operator, ImportHelper):
@@ -302,15 +350,15 @@ class ImportCSVAnimationOperator(bpy.types.Operator, ImportHelper):
             return {'CANCELLED'}
 
         filepath = self.filepath
-        if not os.path.exists(filepath):
+        # Persist imported source data on the animated object
+        try:
+            rows = import_motion_data_entries(filepath, obj)
+        except FileNotFoundError:
             self.report({'ERROR'}, "File not found")
             return {'CANCELLED'}
 
-        # Persist imported source data on the animated object
-        import_motion_data_entries(filepath, obj)
-
         extrapolation_mode = context.scene.anim_settings.extrapolation_mode
-        animate_object_from_entries(context, obj, extrapolation_mode)
+        animate_object_from_entries(context, obj, extrapolation_mode, rows)
 
         self.report({'INFO'}, "CSV Animation Imported Successfully")
         return {'FINISHED'}
@@ -381,9 +429,6 @@ class HVE_OT_ImportMappedMotionCSV(bpy.types.Operator):
         if not filepath:
             self.report({'WARNING'}, "Load a CSV file first.")
             return {'CANCELLED'}
-        if not os.path.exists(filepath):
-            self.report({'ERROR'}, "File not found")
-            return {'CANCELLED'}
 
         mapping = {
             "time": int(settings.motion_col_time),
@@ -395,7 +440,11 @@ class HVE_OT_ImportMappedMotionCSV(bpy.types.Operator):
             "yaw": int(settings.motion_col_yaw),
         }
 
-        count, error = import_mapped_motion_data(filepath, mapping, settings.motion_csv_has_header, obj)
+        try:
+            count, error = import_mapped_motion_data(filepath, mapping, settings.motion_csv_has_header, obj)
+        except FileNotFoundError:
+            self.report({'ERROR'}, "File not found")
+            return {'CANCELLED'}
         if error:
             self.report({'WARNING'}, error)
             return {'CANCELLED'}
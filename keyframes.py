@@ -0,0 +1,123 @@
+"""Batched F-Curve keyframe writing shared by the HVE importers.
+
+``Object.keyframe_insert`` is a full RNA roundtrip per key and re-sorts the
+F-Curve on every call. The helpers below size an F-Curve's keyframe points
+once and fill them with a single ``foreach_set`` instead.
+"""
+import bpy
+import numpy as np
+
+
+def ensure_action(obj, name=None):
+    """Return the action assigned to ``obj``, creating and assigning one if needed."""
+    anim_data = obj.animation_data or obj.animation_data_create()
+    action = anim_data.action
+    if action is None:
+        action = bpy.data.actions.new(name=name or f"{obj.name}Action")
+        anim_data.action = action
+    return action
+
+
+def ensure_fcurve(obj, data_path, index=0):
+    """Return the F-Curve for ``data_path[index]`` on ``obj``, creating it if missing.
+
+    Layered actions (Blender 4.4+) no longer accept ``action.fcurves.new`` for
+    new data-blocks, so ``fcurve_ensure_for_datablock`` is preferred when the
+    running Blender provides it.
+    """
+    action = ensure_action(obj)
+    ensure = getattr(action, "fcurve_ensure_for_datablock", None)
+    if ensure is not None:
+        return ensure(obj, data_path, index=index)
+
+    fcurves = action.fcurves
+    fcurve = fcurves.find(data_path, index=index)
+    if fcurve is None:
+        fcurve = fcurves.new(data_path, index=index)
+    return fcurve
+
+
+# Keyframe interpolation enum values by identifier, read once from Blender's RNA.
+_interpolation_codes = {}
+
+
+def interpolation_code(interpolation):
+    """Return the enum value Blender stores for the keyframe ``interpolation`` mode."""
+    code = _interpolation_codes.get(interpolation)
+    if code is None:
+        enum_items = bpy.types.Keyframe.bl_rna.properties["interpolation"].enum_items
+        code = _interpolation_codes[interpolation] = enum_items[interpolation].value
+    return code
+
+
+def set_keyframe_interpolation(fcurve, interpolation):
+    """Set every key on ``fcurve`` to ``interpolation`` (e.g. ``'LINEAR'``) in one write."""
+    points = fcurve.keyframe_points
+    count = len(points)
+    if count:
+        points.foreach_set("interpolation", np.full(count, interpolation_code(interpolation), dtype=np.int32))
+
+
+def set_fcurve_keyframes(fcurve, frames, values, interpolation=None):
+    """Replace the keys on ``fcurve`` with ``(frames[i], values[i])`` pairs in one write.
+
+    ``interpolation`` optionally sets the mode of every new key in a second
+    bulk write; otherwise the keys keep Blender's default.
+    """
+    count = len(frames)
+    points = fcurve.keyframe_points
+    if len(points):
+        points.clear()
+    if count == 0:
+        return
+
+    co = np.empty(count * 2, dtype=np.float32)
+    co[0::2] = frames
+    co[1::2] = values
+
+    points.add(count)
+    points.foreach_set("co", co)
+    if interpolation is not None:
+        set_keyframe_interpolation(fcurve, interpolation)
+    fcurve.update()
+
+
+def keyframe_channels(obj, data_path, frames, channels, interpolation=None):
+    """Key every array component of ``data_path`` on ``obj`` from per-index value arrays.
+
+    ``channels`` holds one value sequence per array index (e.g. ``(xs, ys, zs)``
+    for ``location``); ``None`` entries are skipped.
+    """
+    for index, values in enumerate(channels):
+        if values is None:
+            continue
+        set_fcurve_keyframes(ensure_fcurve(obj, data_path, index), frames, values, interpolation)
+
+
+def last_value_per_frame(frames, *channels):
+    """Sort samples by frame, keeping the last sample written to each frame.
+
+    ``keyframe_insert`` overwrites an existing key on the same frame, so when
+    samples are collected first and written in bulk the later sample must win.
+    Returns ``(frames, *channels)`` as NumPy arrays.
+    """
+    frames = np.asarray(frames, dtype=np.float64)
+    reversed_frames = frames[::-1]
+    unique_frames, reversed_idx = np.unique(reversed_frames, return_index=True)
+    idx = len(frames) - 1 - reversed_idx
+    return (unique_frames,) + tuple(np.asarray(values)[idx] for values in channels)
+
+
+def run_boundary_indices(values):
+    """Return the sample indices needed to key ``values`` without constant runs.
+
+    Only the first and last sample of each run of equal values is kept, so a
+    held value stays flat between its two keys while every change is still
+    keyed on the frame it happens.
+    """
+    values = np.asarray(values)
+    count = len(values)
+    if count <= 2:
+        return np.arange(count)
+    changes = np.flatnonzero(values[1:] != values[:-1])
+    return np.unique(np.concatenate(([0], changes, changes + 1, [count - 1])))
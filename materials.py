@@ -54,94 +54,119 @@ class NodeTree:
         return node
 
 
+# Hidden (dot-prefixed) material holding the HVE node tree every HVE material
+# is copied from. It has no users, so it is never saved with the file.
+HVE_TEMPLATE_MATERIAL = ".HVE_Template"
+
+
+def buildHVENodeTree(mat):
+    """Build the HVE texture/color/shininess/transparency node tree on ``mat``."""
+    tree = NodeTree(mat.node_tree)
+    links = mat.node_tree.links
+    
+    texture = tree.addNode(1, 'ShaderNodeTexImage')
+    texture.label = "hveTexture"
+    texture.name = "hveTexture"
+    
+    diffuseColor = tree.addNode(1, 'ShaderNodeRGB')
+    diffuseColor.label = "diffuseColor"
+    diffuseColor.name = "diffuseColor"
+    
+    mixDiffuseTexture = tree.addNode(2, 'ShaderNodeMixRGB')
+    mixDiffuseTexture.label = "mixDiffuseTexture"
+    mixDiffuseTexture.name = "mixDiffuseTexture" 
+    
+    ambientColor = tree.addNode(1, 'ShaderNodeRGB')
+    ambientColor.label = "ambientColor"
+    ambientColor.name = "ambientColor"
+    
+    specularColor = tree.addNode(1, 'ShaderNodeRGB')
+    specularColor.label = "specularColor"
+    specularColor.name = "specularColor"
+       
+    shininess = tree.addNode(1, 'ShaderNodeClamp')
+    shininess.label = "shininess"
+    shininess.name = "shininess"
+    shininess.clamp_type = 'RANGE'
+    
+    mapRoughness = tree.addNode(2, 'ShaderNodeMapRange')
+    mapRoughness.label = "mapRoughness"
+    mapRoughness.name = "mapRoughness"    
+    mapRoughness.interpolation_type = 'LINEAR'
+    mapRoughness.inputs[1].default_value = 0
+    mapRoughness.inputs[2].default_value = 1    
+    mapRoughness.inputs[3].default_value = 1    
+    mapRoughness.inputs[4].default_value = 0    
+    
+    emissiveColor = tree.addNode(1, 'ShaderNodeRGB')
+    emissiveColor.label = "emissiveColor"
+    emissiveColor.name = "emissiveColor"
+
+    transparency = tree.addNode(1, 'ShaderNodeClamp')
+    transparency.label = "transparency"
+    transparency.name = "transparency"
+    transparency.clamp_type = 'RANGE'
+    
+    mapAlpha = tree.addNode(2, 'ShaderNodeMapRange')
+    mapAlpha.label = "mapAlpha"
+    mapAlpha.name = "mapAlpha"    
+    mapAlpha.interpolation_type = 'LINEAR'
+    mapAlpha.inputs[1].default_value = 0
+    mapAlpha.inputs[2].default_value = 1    
+    mapAlpha.inputs[3].default_value = 1    
+    mapAlpha.inputs[4].default_value = 0   
+    
+    principled = tree.addNode(3, 'ShaderNodeBsdfPrincipled')
+    principled.name = "principledBSDF"
+    principled.label = "principledBSDF"    
+    
+    outputMaterial = tree.addNode(4, 'ShaderNodeOutputMaterial')
+    
+    links.new(texture.outputs[0],mixDiffuseTexture.inputs[1])
+    links.new(diffuseColor.outputs[0],mixDiffuseTexture.inputs[2])    
+    links.new(mixDiffuseTexture.outputs[0],principled.inputs[0])
+    links.new(ambientColor.outputs[0],principled.inputs[3])   
+    links.new(specularColor.outputs[0],principled.inputs[5])
+    links.new(shininess.outputs[0],mapRoughness.inputs[0])
+    links.new(transparency.outputs[0],mapAlpha.inputs[0])
+    links.new(mapRoughness.outputs[0],principled.inputs[7])
+    links.new(mapAlpha.outputs[0],principled.inputs[18])
+    links.new(emissiveColor.outputs[0],principled.inputs[17])    
+    links.new(principled.outputs[0],outputMaterial.inputs[0])
+
+
+def getHVETemplateMaterial():
+    """Return the template material, building its node tree if it is missing."""
+    template = bpy.data.materials.get(HVE_TEMPLATE_MATERIAL)
+    if template is None:
+        template = bpy.data.materials.new(HVE_TEMPLATE_MATERIAL)
+        template.use_nodes = True
+        template.node_tree.nodes.clear()
+        buildHVENodeTree(template)
+    return template
+
+
+def setHVEMaterialValues(mat, diffColor, ambiColor, specColor, emisColor, shine, transp):
+    """Set the color and factor inputs that differ between HVE materials."""
+    nodes = mat.node_tree.nodes
+    nodes["diffuseColor"].outputs[0].default_value = diffColor
+    nodes["ambientColor"].outputs[0].default_value = ambiColor
+    nodes["specularColor"].outputs[0].default_value = specColor
+    nodes["emissiveColor"].outputs[0].default_value = emisColor
+    nodes["shininess"].inputs[0].default_value = shine
+    nodes["transparency"].inputs[0].default_value = transp
+
+
 def buildMaterial4HVE(ob, scn, diffColor, ambiColor, specColor, emisColor, shine, transp, name):
     mat_list = bpy.data.materials
     if name in mat_list:
         print("MATERIAL ALREADY THERE")
     else:
-        mat = bpy.data.materials.new(name)
+        # Copy the prebuilt node tree instead of creating and linking every node again
+        mat = getHVETemplateMaterial().copy()
+        mat.name = name
         print("Creating CYCLES material", mat.name)
-        mat.use_nodes= True
-        mat.node_tree.nodes.clear()
-        tree = NodeTree(mat.node_tree)
-        links = mat.node_tree.links
-        
-        texture = tree.addNode(1, 'ShaderNodeTexImage')
-        texture.label = "hveTexture"
-        texture.name = "hveTexture"
-        
-        diffuseColor = tree.addNode(1, 'ShaderNodeRGB')
-        diffuseColor.label = "diffuseColor"
-        diffuseColor.name = "diffuseColor"
-        diffuseColor.outputs[0].default_value =  diffColor
-        
-        mixDiffuseTexture = tree.addNode(2, 'ShaderNodeMixRGB')
-        mixDiffuseTexture.label = "mixDiffuseTexture"
-        mixDiffuseTexture.name = "mixDiffuseTexture" 
-        
-        ambientColor = tree.addNode(1, 'ShaderNodeRGB')
-        ambientColor.label = "ambientColor"
-        ambientColor.name = "ambientColor"
-        ambientColor.outputs[0].default_value =  ambiColor 
-        
-        specularColor = tree.addNode(1, 'ShaderNodeRGB')
-        specularColor.label = "specularColor"
-        specularColor.name = "specularColor"
-        specularColor.outputs[0].default_value =  specColor
-           
-        shininess = tree.addNode(1, 'ShaderNodeClamp')
-        shininess.label = "shininess"
-        shininess.name = "shininess"
-        shininess.clamp_type = 'RANGE'
-        shininess.inputs[0].default_value =  shine   
-        
-        mapRoughness = tree.addNode(2, 'ShaderNodeMapRange')
-        mapRoughness.label = "mapRoughness"
-        mapRoughness.name = "mapRoughness"    
-        mapRoughness.interpolation_type = 'LINEAR'
-        mapRoughness.inputs[1].default_value = 0
-        mapRoughness.inputs[2].default_value = 1    
-        mapRoughness.inputs[3].default_value = 1    
-        mapRoughness.inputs[4].default_value = 0    
-        
-        emissiveColor = tree.addNode(1, 'ShaderNodeRGB')
-        emissiveColor.label = "emissiveColor"
-        emissiveColor.name = "emissiveColor"
-        emissiveColor.outputs[0].default_value =  emisColor
-
-        transparency = tree.addNode(1, 'ShaderNodeClamp')
-        transparency.label = "transparency"
-        transparency.name = "transparency"
-        transparency.inputs[0].default_value =  transp
-        transparency.clamp_type = 'RANGE'
-        
-        mapAlpha = tree.addNode(2, 'ShaderNodeMapRange')
-        mapAlpha.label = "mapAlpha"
-        mapAlpha.name = "mapAlpha"    
-        mapAlpha.interpolation_type = 'LINEAR'
-        mapAlpha.inputs[1].default_value = 0
-        mapAlpha.inputs[2].default_value = 1    
-        mapAlpha.inputs[3].default_value = 1    
-        mapAlpha.inputs[4].default_value = 0   
-        
-        principled = tree.addNode(3, 'ShaderNodeBsdfPrincipled')
-        principled.name = "principledBSDF"
-        principled.label = "principledBSDF"    
-        
-        outputMaterial = tree.addNode(4, 'ShaderNodeOutputMaterial')
-        
-        links.new(texture.outputs[0],mixDiffuseTexture.inputs[1])
-        links.new(diffuseColor.outputs[0],mixDiffuseTexture.inputs[2])    
-        links.new(mixDiffuseTexture.outputs[0],principled.inputs[0])
-        links.new(ambientColor.outputs[0],principled.inputs[3])   
-        links.new(specularColor.outputs[0],principled.inputs[5])
-        links.new(shininess.outputs[0],mapRoughness.inputs[0])
-        links.new(transparency.outputs[0],mapAlpha.inputs[0])
-        links.new(mapRoughness.outputs[0],principled.inputs[7])
-        links.new(mapAlpha.outputs[0],principled.inputs[18])
-        links.new(emissiveColor.outputs[0],principled.inputs[17])    
-        links.new(principled.outputs[0],outputMaterial.inputs[0])
-        
+        setHVEMaterialValues(mat, diffColor, ambiColor, specColor, emisColor, shine, transp)
         mat.use_fake_user = True
 
 def buildGenericMaterial(ob, scn):
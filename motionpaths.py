@@ -1,6 +1,7 @@
 import math
 
 import bpy
+import numpy as np
 from mathutils import Vector
 
 bl_info = {
@@ -90,16 +91,21 @@ def assign_single_material(obj, material):
 def get_or_create_motion_path_collection():
     """Creates a collection called 'Motion Paths' if it doesn't exist."""
     collection_name = "Motion Paths"
-    if collection_name in bpy.data.collections:
-        return bpy.data.collections[collection_name]
+    collection = bpy.data.collections.get(collection_name)
+    if collection is not None:
+        return collection
 
     new_collection = bpy.data.collections.new(collection_name)
     bpy.context.scene.collection.children.link(new_collection)
     return new_collection
 
 
-def preserve_object_selection_for_motion_path(ob, operation):
-    """Run a motion path operation on one object without changing other selections/paths."""
+def preserve_object_selection_for_motion_paths(objects, operation):
+    """Run a motion path operation on ``objects`` without changing other selections/paths.
+
+    All target objects are selected together so the operator runs once for the
+    whole batch rather than once per object.
+    """
     view_layer = bpy.context.view_layer
     original_active = view_layer.objects.active
     original_selection = list(bpy.context.selected_objects)
@@ -108,12 +114,16 @@ def preserve_object_selection_for_motion_path(ob, operation):
         for selected_ob in original_selection:
             selected_ob.select_set(False)
 
-        ob.select_set(True)
-        view_layer.objects.active = ob
+        for ob in objects:
+            ob.select_set(True)
+        view_layer.objects.active = objects[0]
         return operation()
     finally:
-        for selected_ob in list(bpy.context.selected_objects):
-            selected_ob.select_set(False)
+        # Only the target objects were selected above, so deselect them
+        # directly instead of re-reading the context selection.
+        for ob in objects:
+            if ob.name in bpy.data.objects:
+                ob.select_set(False)
 
         for selected_ob in original_selection:
             if selected_ob.name in bpy.data.objects:
@@ -123,27 +133,41 @@ def preserve_object_selection_for_motion_path(ob, operation):
             view_layer.objects.active = original_active
 
 
-def create_motion_path(ob):
-    """Generates a motion path for the given object without clearing paths from others."""
-    def calculate_path_for_active_object():
-        if ob.motion_path:
-            bpy.ops.object.paths_clear()  # Clear only this object's existing motion path
+def create_motion_paths(objects):
+    """Generates motion paths for ``objects`` without clearing paths from others.
+
+    Returns the number of objects that ended up with a motion path.
+    """
+    objects = list(objects)
+    if not objects:
+        return 0
+
+    def calculate_paths_for_selected_objects():
+        if any(ob.motion_path for ob in objects):
+            # Clear only the target objects' existing motion paths
+            bpy.ops.object.paths_clear(only_selected=True)
 
         bpy.ops.object.paths_calculate()
-        return ob.motion_path is not None
+        return sum(1 for ob in objects if ob.motion_path is not None)
+
+    return preserve_object_selection_for_motion_paths(objects, calculate_paths_for_selected_objects)
 
-    return preserve_object_selection_for_motion_path(ob, calculate_path_for_active_object)
 
+def delete_motion_paths(objects):
+    """Clears motion paths from ``objects`` without clearing paths from others.
 
-def delete_motion_path(ob):
-    """Clears a motion path from the given object without clearing paths from others."""
-    def clear_path_for_active_object():
-        if ob.motion_path:
-            bpy.ops.object.paths_clear()  # Clear only this object's existing motion path
+    Returns the number of objects that had a motion path before clearing.
+    """
+    objects = [ob for ob in objects if ob.motion_path]
+    if not objects:
+        return 0
 
-        return ob.motion_path is not None
+    def clear_paths_for_selected_objects():
+        # Clear only the target objects' existing motion paths
+        bpy.ops.object.paths_clear(only_selected=True)
+        return len(objects)
 
-    return preserve_object_selection_for_motion_path(ob, clear_path_for_active_object)
+    return preserve_object_selection_for_motion_paths(objects, clear_paths_for_selected_objects)
 
 
 def create_curve_from_motion_path(ob, context):
@@ -160,12 +184,21 @@ def create_curve_from_motion_path(ob, context):
     motion_path_collection = get_or_create_motion_path_collection()
     motion_path_collection.objects.link(curve_obj)
 
+    num_points = len(mp.points)
+    coords = np.empty(num_points * 3, dtype=np.float32)
+    mp.points.foreach_get("co", coords)
+
     path.dimensions = '3D'
     spline = path.splines.new(type='BEZIER')
-    spline.bezier_points.add(len(mp.points) - 1)
-
-    for i, p in enumerate(spline.bezier_points):
-        p.co = mp.points[i].co
+    bezier_points = spline.bezier_points
+    bezier_points.add(num_points - 1)
+
+    # Write all points (and collapse both handles onto them) in bulk; only the
+    # handle type enums still need a per-point assignment.
+    bezier_points.foreach_set("co", coords)
+    bezier_points.foreach_set("handle_left", coords)
+    bezier_points.foreach_set("handle_right", coords)
+    for p in bezier_points:
         p.handle_right_type = 'VECTOR'
         p.handle_left_type = 'VECTOR'
 
@@ -455,10 +488,7 @@ class GenerateMotionPathOperator(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
-        count = 0
-        for ob in bpy.context.selected_objects:
-            if create_motion_path(ob):
-                count += 1
+        count = create_motion_paths(list(bpy.context.selected_objects))
 
         self.report({'INFO'}, f"Generated motion paths for {count} objects.")
         return {'FINISHED'}
@@ -471,12 +501,7 @@ class RemoveMotionPathOperator(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
-        count = 0
-        for ob in bpy.context.selected_objects:
-            had_path = ob.motion_path is not None
-            delete_motion_path(ob)
-            if had_path:
-                count += 1
+        count = delete_motion_paths(list(bpy.context.selected_objects))
 
         self.report({'INFO'}, f"Removed motion paths from {count} objects.")
         return {'FINISHED'}
@@ -506,7 +531,8 @@ class ConvertSelectedObjectsOperator(bpy.types.Operator):
 
     def execute(self, context):
         count = 0
-        for ob in bpy.context.selected_objects:
+        selected_objects = list(bpy.context.selected_objects)
+        for ob in selected_objects:
             if create_curve_from_motion_path(ob, context):
                 count += 1
 
@@ -29,11 +29,8 @@ class ScaleByTwoPointsOperator(bpy.types.Operator):
         if context.mode != 'EDIT_MESH':
             self.report({'ERROR'}, "Enter Edit Mode and select two vertices")
             return {'CANCELLED'}
-        bpy.ops.object.mode_set(mode='OBJECT')  
-        bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)  # Apply scale
-        bpy.ops.object.mode_set(mode='EDIT')
 
-        # Get selected vertices
+        # Get selected vertices straight from the edit mesh (no mode toggle needed)
         bm = bmesh.from_edit_mesh(obj.data)
         selected_verts = [v for v in bm.verts if v.select]
 
@@ -42,7 +39,10 @@ class ScaleByTwoPointsOperator(bpy.types.Operator):
             return {'CANCELLED'}
 
         v1, v2 = selected_verts
-        current_distance = (v2.co - v1.co).length
+        # Measure with the object's current scale folded in, which matches the
+        # distance after applying scale without a mode switch + transform_apply.
+        offset = (v2.co - v1.co) * obj.scale  # element-wise
+        current_distance = offset.length
 
         # Get scene unit scale
         unit_system = context.scene.unit_settings.system
@@ -2,6 +2,9 @@ import ast
 import csv
 import pathlib
 import tempfile
+import warnings
+
+import numpy as np
 
 
 # Extract import_mapped_csv_data (and the helpers it depends on) so the
@@ -14,14 +17,16 @@ WANTED = {
     "get_target_object",
     "get_vehicle_path_entries",
     "import_mapped_csv_data",
+    "import_csv_data",
 }
 
-ns = {"csv": csv}
+ns = {"csv": csv, "np": np, "warnings": warnings}
 for node in module_ast.body:
     if isinstance(node, ast.FunctionDef) and node.name in WANTED:
         exec(compile(ast.Module([node], []), filename="<ast>", mode="exec"), ns)
 
 import_mapped_csv_data = ns["import_mapped_csv_data"]
+import_csv_data = ns["import_csv_data"]
 
 
 class MockEntry:
@@ -41,6 +46,11 @@ class MockEntries(list):
     def clear(self):
         del self[:]
 
+    def foreach_set(self, attr, values):
+        assert len(values) == len(self)
+        for entry, value in zip(self, values):
+            setattr(entry, attr, float(value))
+
 
 class MockObject:
     def __init__(self):
@@ -51,6 +61,7 @@ class MockObject:
 class MockAnimSettings:
     def __init__(self, target):
         self.edr_anim_object = target
+        self.edr_input_mode = 'YAW_RATE'
 
 
 class MockScene:
@@ -160,3 +171,63 @@ def test_import_skips_non_numeric_rows():
 
     assert error is None
     assert count == 2
+
+
+def test_positional_import_skips_headers_and_short_rows():
+    path = _write_csv([
+        ["Time", "Speed", "YawRate"],
+        [-1.0, 10.0, 1.5],
+        [0.0, 11.0],
+        [1.0, 12.0, 2.5, 99.0],
+    ])
+    target = MockObject()
+    context = MockContext(target)
+
+    import_csv_data(path, context)
+
+    entries = target.vehicle_path_entries
+    assert [(e.time, e.speed, e.yaw_rate) for e in entries] == [
+        (0.0, 10.0, 1.5),
+        (2.0, 12.0, 2.5),
+    ]
+    assert all(e.steering_wheel_angle == 0.0 for e in entries)
+    assert context.scene.frame_start == 0
+
+
+def test_positional_import_accepts_quoted_numeric_cells():
+    tmp = tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False, newline="")
+    tmp.write('"Time","Speed","YawRate"\n0,"1.5",2\n"1","3.5","4"\n')
+    tmp.close()
+    target = MockObject()
+    context = MockContext(target)
+
+    import_csv_data(tmp.name, context)
+
+    entries = target.vehicle_path_entries
+    assert [(e.time, e.speed, e.yaw_rate) for e in entries] == [
+        (0.0, 1.5, 2.0),
+        (1.0, 3.5, 4.0),
+    ]
+
+
+def test_positional_import_steering_mode_fills_steering_column():
+    path = _write_csv([[0.0, 10.0, 45.0], [1.0, 10.0, 90.0]])
+    target = MockObject()
+    context = MockContext(target)
+    context.scene.anim_settings.edr_input_mode = 'STEERING_WHEEL_ANGLE'
+
+    import_csv_data(path, context)
+
+    entries = target.vehicle_path_entries
+    assert [e.steering_wheel_angle for e in entries] == [45.0, 90.0]
+    assert [e.yaw_rate for e in entries] == [0.0, 0.0]
+
+
+def test_positional_import_without_numeric_rows_leaves_table_empty():
+    path = _write_csv([["Time", "Speed", "YawRate"]])
+    target = MockObject()
+    context = MockContext(target)
+
+    import_csv_data(path, context)
+
+    assert len(target.vehicle_path_entries) == 0
@@ -60,3 +60,57 @@ def test_integrate_step_treats_speed_and_yaw_as_instantaneous_endpoints():
     psi_mid = (1.0 + 1.4) / 2
     assert math.isclose(x, ds * math.cos(psi_mid), rel_tol=1e-9)
     assert math.isclose(y, ds * math.sin(psi_mid), rel_tol=1e-9)
+
+
+def _load_with_numpy():
+    import numpy
+
+    np_ns = {"np": numpy}
+    for node in module_ast.body:
+        if isinstance(node, ast.FunctionDef) and node.name in {"integrate_step", "integrate_samples"}:
+            code = compile(ast.Module([node], []), filename="<ast>", mode="exec")
+            exec(code, np_ns)
+    return np_ns
+
+
+def test_integrate_samples_keys_every_frame_and_final_sample():
+    integrate_samples = _load_with_numpy()["integrate_samples"]
+
+    frames, xs, ys, psis = integrate_samples([0.0, 1.0], [10.0, 10.0], [0.0, 0.0], 10, 0.0, 0.0, 0.0)
+
+    assert list(frames) == list(range(11)) + [10]
+    assert math.isclose(xs[-1], 10.0)
+    assert math.isclose(xs[5], 5.0)
+    assert all(y == 0.0 for y in ys)
+    assert all(p == 0.0 for p in psis)
+
+
+def test_integrate_samples_matches_stepwise_integration_and_skips_backward_time():
+    np_ns = _load_with_numpy()
+    integrate_samples = np_ns["integrate_samples"]
+    step = np_ns["integrate_step"]
+
+    time = [0.0, 0.5, 0.4, 1.0]
+    speed = [5.0, 7.0, 7.0, 6.0]
+    yaw_rate = [0.0, 0.2, 0.2, 0.1]
+    frames, xs, ys, psis = integrate_samples(time, speed, yaw_rate, 4, 1.0, 2.0, 0.3)
+
+    # Segment 0: frames 0 -> 2, segment 1 is skipped, segment 2: frames 2 -> 4.
+    assert list(frames) == [0, 1, 2, 3, 4, 4]
+
+    x, y, psi = 1.0, 2.0, 0.3
+    expected = []
+    for i, n in ((0, 2), (2, 2)):
+        dt_interval = time[i + 1] - time[i]
+        v, r = speed[i], yaw_rate[i]
+        a = (speed[i + 1] - v) / dt_interval
+        rdot = (yaw_rate[i + 1] - r) / dt_interval
+        for _ in range(n):
+            x, y, psi, v, r = step(x, y, psi, v, r, dt_interval / n, a, rdot)
+            expected.append((x, y, psi))
+
+    for k, (ex, ey, epsi) in enumerate(expected, start=1):
+        assert math.isclose(xs[k], ex, rel_tol=1e-12)
+        assert math.isclose(ys[k], ey, rel_tol=1e-12)
+        assert math.isclose(psis[k], epsi, rel_tol=1e-12)
+    assert (xs[-1], ys[-1], psis[-1]) == (xs[-2], ys[-2], psis[-2])
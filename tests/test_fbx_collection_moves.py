@@ -0,0 +1,88 @@
+import ast
+import pathlib
+import types
+from collections import defaultdict
+
+
+module_path = pathlib.Path(__file__).resolve().parents[1] / "fbx_importer.py"
+module_ast = ast.parse(module_path.read_text())
+
+
+class FakeObjects(list):
+    def link(self, obj):
+        if obj in self:
+            raise RuntimeError(f"{obj.name} already linked")
+        self.append(obj)
+        obj.users_collection.append(self.owner)
+
+    def unlink(self, obj):
+        self.remove(obj)
+        if self.owner in obj.users_collection:
+            obj.users_collection.remove(self.owner)
+
+    def __contains__(self, item):
+        if isinstance(item, str):
+            return any(obj.name == item for obj in self)
+        return list.__contains__(self, item)
+
+
+class FakeCollection:
+    def __init__(self, name):
+        self.name = name
+        self.objects = FakeObjects()
+        self.objects.owner = self
+
+    def __hash__(self):
+        return id(self)
+
+
+class FakeObject:
+    def __init__(self, name, *collections):
+        self.name = name
+        self.users_collection = []
+        for collection in collections:
+            collection.objects.link(self)
+
+
+scene_root = FakeCollection("Scene Collection")
+fake_bpy = types.SimpleNamespace(
+    context=types.SimpleNamespace(scene=types.SimpleNamespace(collection=scene_root))
+)
+
+ns = {"bpy": fake_bpy, "defaultdict": defaultdict}
+for node in module_ast.body:
+    if isinstance(node, ast.FunctionDef) and node.name == "move_objects_to_collection":
+        exec(compile(ast.Module([node], []), filename="<ast>", mode="exec"), ns)
+
+move_objects_to_collection = ns["move_objects_to_collection"]
+
+
+def test_move_objects_unlinks_every_source_and_links_target():
+    source_a = FakeCollection("A")
+    source_b = FakeCollection("B")
+    target = FakeCollection("Target")
+    first = FakeObject("First", source_a, source_b)
+    second = FakeObject("Second", source_a)
+
+    move_objects_to_collection([first, second], target)
+
+    assert list(source_a.objects) == []
+    assert list(source_b.objects) == []
+    assert list(target.objects) == [first, second]
+    assert first.users_collection == [target]
+    assert second.users_collection == [target]
+
+
+def test_move_objects_handles_objects_already_in_target():
+    target = FakeCollection("Target")
+    obj = FakeObject("Obj", target)
+
+    move_objects_to_collection([obj], target)
+
+    assert list(target.objects) == [obj]
+
+
+def test_move_objects_with_no_objects_is_noop():
+    target = FakeCollection("Target")
+    move_objects_to_collection([], target)
+    assert list(target.objects) == []
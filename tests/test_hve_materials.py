@@ -0,0 +1,113 @@
+import ast
+import copy
+import pathlib
+import types
+
+
+module_path = pathlib.Path(__file__).resolve().parents[1] / "materials.py"
+module_ast = ast.parse(module_path.read_text())
+
+
+class FakeSocket:
+    default_value = None
+
+
+class FakeNode:
+    def __init__(self):
+        self.outputs = [FakeSocket()]
+        self.inputs = [FakeSocket()]
+
+
+class FakeMaterial:
+    def __init__(self, name, materials):
+        self.materials = materials
+        self._name = name
+        self.node_tree = types.SimpleNamespace(nodes={})
+        self.use_fake_user = False
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, name):
+        del self.materials[self._name]
+        self._name = name
+        self.materials[name] = self
+
+    def copy(self):
+        duplicate = FakeMaterial(self.name + ".001", self.materials)
+        duplicate.node_tree.nodes = copy.deepcopy(self.node_tree.nodes)
+        self.materials[duplicate.name] = duplicate
+        return duplicate
+
+
+class FakeMaterials(dict):
+    def new(self, name):
+        self[name] = FakeMaterial(name, self)
+        return self[name]
+
+
+def load_namespace():
+    materials = FakeMaterials()
+    ns = {"bpy": types.SimpleNamespace(data=types.SimpleNamespace(materials=materials)), "built": []}
+
+    def buildHVENodeTree(mat):
+        ns["built"].append(mat.name)
+        for name in ("diffuseColor", "ambientColor", "specularColor", "emissiveColor", "shininess", "transparency"):
+            mat.node_tree.nodes[name] = FakeNode()
+
+    for node in module_ast.body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(target, ast.Name) and target.id == "HVE_TEMPLATE_MATERIAL"
+            for target in node.targets
+        ):
+            exec(compile(ast.Module([node], []), filename="<ast>", mode="exec"), ns)
+        elif isinstance(node, ast.FunctionDef) and node.name in {
+            "getHVETemplateMaterial",
+            "setHVEMaterialValues",
+            "buildMaterial4HVE",
+        }:
+            exec(compile(ast.Module([node], []), filename="<ast>", mode="exec"), ns)
+    ns["buildHVENodeTree"] = buildHVENodeTree
+    return ns, materials
+
+
+def test_build_material_copies_one_template_and_sets_its_values():
+    ns, materials = load_namespace()
+    white, black = (1, 1, 1, 1), (0, 0, 0, 1)
+
+    ns["buildMaterial4HVE"](None, None, white, white, black, black, 1, 0, "BODY")
+    ns["buildMaterial4HVE"](None, None, black, white, white, black, 0.9, 0.2, "GLASS")
+
+    assert ns["built"] == [".HVE_Template"]
+    glass_nodes = materials["GLASS"].node_tree.nodes
+    assert glass_nodes["diffuseColor"].outputs[0].default_value == black
+    assert glass_nodes["specularColor"].outputs[0].default_value == white
+    assert glass_nodes["shininess"].inputs[0].default_value == 0.9
+    assert glass_nodes["transparency"].inputs[0].default_value == 0.2
+    assert materials["BODY"].node_tree.nodes["diffuseColor"].outputs[0].default_value == white
+    assert materials["BODY"].use_fake_user and materials["GLASS"].use_fake_user
+    assert not materials[".HVE_Template"].use_fake_user
+
+
+def test_build_material_keeps_existing_materials():
+    ns, materials = load_namespace()
+    existing = materials.new("BODY")
+
+    ns["buildMaterial4HVE"](None, None, (1, 1, 1, 1), (1, 1, 1, 1), (0, 0, 0, 1), (0, 0, 0, 1), 1, 0, "BODY")
+
+    assert materials["BODY"] is existing
+    assert ns["built"] == []
+
+
+def test_build_material_rebuilds_a_removed_template():
+    ns, materials = load_namespace()
+    white, black = (1, 1, 1, 1), (0, 0, 0, 1)
+
+    ns["buildMaterial4HVE"](None, None, white, white, black, black, 1, 0, "BODY")
+    del materials[".HVE_Template"]
+    ns["buildMaterial4HVE"](None, None, black, white, white, black, 0.9, 0.2, "GLASS")
+
+    assert ns["built"] == [".HVE_Template", ".HVE_Template"]
+    assert "GLASS" in materials
@@ -0,0 +1,95 @@
+import ast
+import pathlib
+import warnings
+
+import numpy as np
+
+
+module_path = pathlib.Path(__file__).resolve().parents[1] / "import_xyzrpy.py"
+module_ast = ast.parse(module_path.read_text())
+keyframes_ast = ast.parse((module_path.parent / "keyframes.py").read_text())
+ns = {"np": np, "warnings": warnings}
+for node in module_ast.body + keyframes_ast.body:
+    if isinstance(node, ast.FunctionDef) and node.name in {
+        "read_motion_rows",
+        "motion_keyframe_channels",
+        "last_value_per_frame",
+    }:
+        exec(compile(ast.Module([node], []), filename="<ast>", mode="exec"), ns)
+
+read_motion_rows = ns["read_motion_rows"]
+motion_keyframe_channels = ns["motion_keyframe_channels"]
+
+
+def write_csv(tmp_path, text):
+    path = tmp_path / "motion.csv"
+    path.write_bytes(text.encode())
+    return str(path)
+
+
+def test_read_motion_rows_parses_seven_numeric_columns(tmp_path):
+    path = write_csv(tmp_path, "0.0,1,2,3,4,5,6\r\n0.5, 1.5,2.5,3.5,4.5,5.5,6.5\r\n")
+
+    rows = read_motion_rows(path)
+
+    assert rows.shape == (2, 7)
+    assert rows[1].tolist() == [0.5, 1.5, 2.5, 3.5, 4.5, 5.5, 6.5]
+
+
+def test_read_motion_rows_skips_headers_and_malformed_rows(tmp_path):
+    path = write_csv(
+        tmp_path,
+        "Time,X,Y,Z,Roll,Pitch,Yaw\n"
+        "0.0,1,2,3,4,5,6\n"
+        "\n"
+        "0.1,1,2,3\n"
+        "0.2,1,2,3,4,5,6,7\n"
+        "0.3,1,,3,4,5,6\n"
+        "0.4,1,2,3,4,5,6 # note\n"
+        "0.5,1,2,3,4,5,6\n",
+    )
+
+    rows = read_motion_rows(path)
+
+    assert rows[:, 0].tolist() == [0.0, 0.5]
+
+
+def test_read_motion_rows_skips_a_header_before_all_numeric_rows(tmp_path):
+    path = write_csv(tmp_path, "Time,X,Y,Z,Roll,Pitch,Yaw\n0.0, 1,2,3,4,5,6\n0.1,1,2,3,4,5,nan\n0.2,1,2,3,4,5,6\n")
+
+    rows = read_motion_rows(path)
+
+    assert rows[:, 0].tolist() == [0.0, 0.2]
+    assert rows[0].tolist() == [0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+
+
+def test_read_motion_rows_accepts_quoted_numeric_cells(tmp_path):
+    path = write_csv(tmp_path, '"Time","X","Y","Z","Roll","Pitch","Yaw"\n"0.0","1","2","3","4","5","6"\n0.5,"1.5",2,3,4,5,6\n')
+
+    rows = read_motion_rows(path)
+
+    assert rows.shape == (2, 7)
+    assert rows[0].tolist() == [0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+    assert rows[1, :2].tolist() == [0.5, 1.5]
+
+
+def test_read_motion_rows_without_data_is_empty(tmp_path):
+    assert read_motion_rows(write_csv(tmp_path, "Time,X\n")).shape == (0, 7)
+
+
+def test_motion_keyframe_channels_scales_converts_and_keeps_last_row_per_frame():
+    rows = [
+        [0.0, 1.0, 2.0, 3.0, 0.0, 90.0, 180.0],
+        [0.05, 9.0, 9.0, 9.0, 0.0, 0.0, 0.0],
+        [0.04, 4.0, 5.0, 6.0, 45.0, 0.0, 0.0],
+        [0.1, 7.0, 8.0, 9.0, 0.0, 0.0, -90.0],
+    ]
+
+    frames, location, rotation = motion_keyframe_channels(rows, 30, 0.5)
+
+    # 0.04 s and 0.05 s both truncate to frame 1; the later row wins
+    assert frames.tolist() == [0, 1, 3]
+    assert [values.tolist() for values in location] == [[0.5, 2.0, 3.5], [1.0, 2.5, 4.0], [1.5, 3.0, 4.5]]
+    assert np.allclose(rotation[0], [0.0, np.pi / 4, 0.0])
+    assert np.allclose(rotation[1], [np.pi / 2, 0.0, 0.0])
+    assert np.allclose(rotation[2], [np.pi, 0.0, -np.pi / 2])
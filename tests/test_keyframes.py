@@ -0,0 +1,144 @@
+import ast
+import pathlib
+import types
+
+import numpy as np
+
+
+# Load the batched keyframe helpers with a stub ``bpy`` and drive them with
+# fake F-Curves (no Blender needed).
+module_path = pathlib.Path(__file__).resolve().parents[1] / "keyframes.py"
+module_ast = ast.parse(module_path.read_text())
+
+
+class FakeKeyframePoints:
+    def __init__(self):
+        self.co = []
+        self.interpolation = []
+
+    def __len__(self):
+        return len(self.co)
+
+    def clear(self):
+        self.co = []
+
+    def add(self, count):
+        self.co.extend([(0.0, 0.0)] * count)
+
+    def foreach_set(self, attr, seq):
+        flat = list(seq)
+        if attr == "interpolation":
+            assert len(flat) == len(self.co)
+            self.interpolation = flat
+            return
+        assert attr == "co"
+        self.co = list(zip(flat[0::2], flat[1::2]))
+
+
+class FakeFCurve:
+    def __init__(self, data_path, index):
+        self.data_path = data_path
+        self.array_index = index
+        self.keyframe_points = FakeKeyframePoints()
+        self.updated = 0
+
+    def update(self):
+        self.updated += 1
+
+
+class FakeFCurves(list):
+    def find(self, data_path, index=0):
+        for fcurve in self:
+            if fcurve.data_path == data_path and fcurve.array_index == index:
+                return fcurve
+        return None
+
+    def new(self, data_path, index=0):
+        fcurve = FakeFCurve(data_path, index)
+        self.append(fcurve)
+        return fcurve
+
+
+class FakeAction:
+    def __init__(self, name):
+        self.name = name
+        self.fcurves = FakeFCurves()
+
+
+class FakeObject:
+    def __init__(self, name):
+        self.name = name
+        self.animation_data = None
+
+    def animation_data_create(self):
+        self.animation_data = types.SimpleNamespace(action=None)
+        return self.animation_data
+
+
+interpolation_items = {
+    name: types.SimpleNamespace(value=value)
+    for value, name in enumerate(("CONSTANT", "LINEAR", "BEZIER"))
+}
+
+fake_bpy = types.SimpleNamespace(
+    data=types.SimpleNamespace(actions=types.SimpleNamespace(new=lambda name: FakeAction(name))),
+    types=types.SimpleNamespace(Keyframe=types.SimpleNamespace(bl_rna=types.SimpleNamespace(
+        properties={"interpolation": types.SimpleNamespace(enum_items=interpolation_items)}
+    ))),
+)
+
+ns = {"bpy": fake_bpy, "np": np}
+for node in module_ast.body:
+    if isinstance(node, (ast.FunctionDef, ast.Assign)):
+        exec(compile(ast.Module([node], []), filename="<ast>", mode="exec"), ns)
+
+keyframe_channels = ns["keyframe_channels"]
+last_value_per_frame = ns["last_value_per_frame"]
+set_fcurve_keyframes = ns["set_fcurve_keyframes"]
+
+
+def test_keyframe_channels_creates_action_and_one_fcurve_per_index():
+    obj = FakeObject("Car")
+
+    keyframe_channels(obj, "location", [0, 1, 2], ([0.0, 1.0, 2.0], [5.0, 5.0, 5.0], None))
+
+    action = obj.animation_data.action
+    assert action.name == "CarAction"
+    assert [(fc.data_path, fc.array_index) for fc in action.fcurves] == [
+        ("location", 0),
+        ("location", 1),
+    ]
+    assert action.fcurves[0].keyframe_points.co == [(0.0, 0.0), (1.0, 1.0), (2.0, 2.0)]
+    assert action.fcurves[1].keyframe_points.co == [(0.0, 5.0), (1.0, 5.0), (2.0, 5.0)]
+    assert action.fcurves[0].updated == 1
+
+
+def test_set_fcurve_keyframes_replaces_existing_keys():
+    fcurve = FakeFCurve("location", 0)
+    set_fcurve_keyframes(fcurve, [0, 1], [1.0, 2.0])
+    set_fcurve_keyframes(fcurve, [4], [9.0])
+
+    assert fcurve.keyframe_points.co == [(4.0, 9.0)]
+
+
+def test_set_fcurve_keyframes_sets_interpolation_in_one_write():
+    fcurve = FakeFCurve("location", 0)
+    set_fcurve_keyframes(fcurve, [0, 1, 2], [1.0, 2.0, 3.0], interpolation="LINEAR")
+
+    assert fcurve.keyframe_points.interpolation == [1, 1, 1]
+
+
+def test_last_value_per_frame_sorts_and_keeps_latest_sample():
+    frames, values = last_value_per_frame([0, 2, 1, 2], [10.0, 20.0, 30.0, 40.0])
+
+    assert frames.tolist() == [0.0, 1.0, 2.0]
+    assert values.tolist() == [10.0, 30.0, 40.0]
+
+
+def test_run_boundary_indices_keeps_both_ends_of_each_run():
+    run_boundary_indices = ns["run_boundary_indices"]
+
+    assert run_boundary_indices([0, 0, 0, 1, 1, 1, 1, 0]).tolist() == [0, 2, 3, 6, 7]
+    assert run_boundary_indices([5.0] * 6).tolist() == [0, 5]
+    assert run_boundary_indices([1.0, 2.0, 3.0]).tolist() == [0, 1, 2]
+    assert run_boundary_indices([]).tolist() == []
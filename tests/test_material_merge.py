@@ -11,7 +11,7 @@ ns = {"math": math, "re": re, "os": __import__("os")}
 for node in module_ast.body:
     if isinstance(node, ast.Assign):
         for target in node.targets:
-            if isinstance(target, ast.Name) and target.id == "MATERIAL_NAME_PREFIXES":
+            if isinstance(target, ast.Name) and target.id in {"MATERIAL_NAME_PREFIXES", "_DUP_SUFFIX_RE"}:
                 code = compile(ast.Module([node], []), filename="<ast>", mode="exec")
                 exec(code, ns)
     if isinstance(node, ast.FunctionDef) and node.name in {
@@ -28,6 +28,7 @@ for node in module_ast.body:
         "remove_unused_materials",
         "merge_duplicate_materials_per_vehicle",
         "collapse_material_slots",
+        "vehicle_name_tokens",
         "belongs_to_vehicle",
         "set_new_materials_metallic_zero",
     }:
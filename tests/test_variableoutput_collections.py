@@ -0,0 +1,150 @@
+import ast
+import pathlib
+import types
+
+
+module_path = pathlib.Path(__file__).resolve().parents[1] / "variableoutput_importer.py"
+module_ast = ast.parse(module_path.read_text())
+
+
+class FakeObjects(list):
+    def link(self, obj):
+        if obj in self:
+            raise RuntimeError(f"Object '{obj.name}' already in collection")
+        self.append(obj)
+        if self.owner.reported:
+            obj.users_collection.append(self.owner)
+
+    def unlink(self, obj):
+        if obj not in self:
+            raise RuntimeError(f"Object '{obj.name}' not in collection")
+        self.remove(obj)
+        if self.owner in obj.users_collection:
+            obj.users_collection.remove(self.owner)
+
+    def __contains__(self, item):
+        if isinstance(item, str):
+            raise AssertionError("membership should not be tested by name")
+        return list.__contains__(self, item)
+
+
+class FakeCollection:
+    def __init__(self, name, reported=True):
+        self.name = name
+        self.reported = reported
+        self.objects = FakeObjects()
+        self.objects.owner = self
+        self.children = FakeChildren()
+
+
+class FakeObject:
+    def __init__(self, name, *collections):
+        self.name = name
+        self.users_collection = []
+        for collection in collections:
+            collection.objects.link(self)
+
+
+class FakeCollections(dict):
+    lookups = 0
+
+    def get(self, name, default=None):
+        self.lookups += 1
+        return dict.get(self, name, default)
+
+    def new(self, name):
+        self[name] = FakeCollection(name)
+        return self[name]
+
+
+class FakeChildren(list):
+    def link(self, collection):
+        self.append(collection)
+
+
+def load_namespace(*collections):
+    # The scene master collection is not reported by ``users_collection``.
+    scene_root = FakeCollection("Scene Collection", reported=False)
+    fake_bpy = types.SimpleNamespace(
+        context=types.SimpleNamespace(scene=types.SimpleNamespace(collection=scene_root)),
+        data=types.SimpleNamespace(collections=FakeCollections({c.name: c for c in collections})),
+    )
+    ns = {"bpy": fake_bpy, "_collection_cache": {}}
+    for node in module_ast.body:
+        if isinstance(node, ast.FunctionDef) and node.name in {
+            "_cached_get",
+            "get_collection",
+            "ensure_collection_exists",
+            "remove_from_all_collections",
+            "assign_objects_to_subcollection",
+            "assign_objects_to_collection",
+        }:
+            exec(compile(ast.Module([node], []), filename="<ast>", mode="exec"), ns)
+    return ns, scene_root
+
+
+def test_remove_from_all_collections_unlinks_users_and_scene_root():
+    ns, scene_root = load_namespace()
+    first = FakeCollection("First")
+    second = FakeCollection("Second")
+    obj = FakeObject("Car", first, second, scene_root)
+
+    ns["remove_from_all_collections"](obj)
+
+    assert obj.users_collection == []
+    assert obj not in first.objects
+    assert obj not in second.objects
+    assert obj not in scene_root.objects
+
+
+def test_remove_from_all_collections_ignores_objects_outside_scene_root():
+    ns, scene_root = load_namespace()
+    first = FakeCollection("First")
+    obj = FakeObject("Car", first)
+
+    ns["remove_from_all_collections"](obj)
+    ns["remove_from_all_collections"](None)
+
+    assert obj.users_collection == []
+    assert list(scene_root.objects) == []
+
+
+def test_assign_objects_to_subcollection_moves_objects_without_name_checks():
+    ns, scene_root = load_namespace()
+    parent = FakeCollection("Vehicle")
+    old = FakeCollection("Old")
+    objects = [FakeObject("Wheel FL", old), FakeObject("Wheel FR", scene_root)]
+
+    ns["assign_objects_to_subcollection"]("Wheels", parent, objects)
+
+    wheels = ns["bpy"].data.collections["Wheels"]
+    assert parent.children == [wheels]
+    assert list(wheels.objects) == objects
+    assert list(old.objects) == []
+    assert list(scene_root.objects) == []
+
+
+def test_assign_objects_to_collection_tolerates_already_linked_objects():
+    paths = FakeCollection("Paths")
+    ns, _scene_root = load_namespace(paths)
+    linked = FakeObject("CG Path", paths)
+    other = FakeObject("Tire Path")
+
+    ns["assign_objects_to_collection"]("Paths", [linked, other])
+
+    assert list(paths.objects) == [linked, other]
+
+
+def test_ensure_collection_exists_memoizes_lookups_for_the_import():
+    ns, scene_root = load_namespace()
+    collections = ns["bpy"].data.collections
+
+    event = ns["ensure_collection_exists"]("Event", scene_root)
+    assert ns["ensure_collection_exists"]("Event", scene_root, dont_render=True) is event
+    assert ns["get_collection"]("Event") is event
+
+    assert scene_root.children == [event]
+    assert event.hide_render is True
+    assert collections.lookups == 1
+    assert ns["get_collection"]("Missing") is None
+    assert "Missing" not in ns["_collection_cache"]
@@ -0,0 +1,130 @@
+import ast
+import csv
+import pathlib
+import warnings
+
+import numpy as np
+
+
+module_path = pathlib.Path(__file__).resolve().parents[1] / "variableoutput_importer.py"
+module_ast = ast.parse(module_path.read_text())
+ns = {"csv": csv, "warnings": warnings, "np": np}
+for node in module_ast.body:
+    if isinstance(node, ast.FunctionDef) and node.name in {"read_variable_output_csv", "split_variable_name"}:
+        code = compile(ast.Module([node], []), filename="<ast>", mode="exec")
+        exec(code, ns)
+
+read_variable_output_csv = ns["read_variable_output_csv"]
+
+
+def write_csv(tmp_path, text):
+    path = tmp_path / "VariableOutput.csv"
+    path.write_text(text)
+    return str(path)
+
+
+def test_read_variable_output_csv_splits_headers_from_numeric_block(tmp_path):
+    path = write_csv(
+        tmp_path,
+        "Time, Car, Car\n"
+        ",KinematicOut:VehKinematicX, KinematicOut:VehKinematicY\n"
+        ",Kinematics: X, Kinematics: Y\n"
+        "sec, ft, ft\n"
+        "0.0, 1.5, 2.5\n"
+        "0.1, 3.0, 4.0\n",
+    )
+
+    header_rows, values = read_variable_output_csv(path)
+
+    assert header_rows[0] == ["Car", "Car"]
+    assert header_rows[1] == ["KinematicOut:VehKinematicX", "KinematicOut:VehKinematicY"]
+    assert header_rows[3] == ["ft", "ft"]
+    assert values.shape == (2, 3)
+    assert values[:, 0].tolist() == [0.0, 0.1]
+    assert values[:, 2].tolist() == [2.5, 4.0]
+
+
+def test_read_variable_output_csv_reads_empty_and_invalid_cells_as_zero(tmp_path):
+    path = write_csv(
+        tmp_path,
+        "Time,Car,Car\n,A:x,A:y\n,x,y\nsec,ft,ft\n0.0,,abc\n0.1,1,2\n",
+    )
+
+    _header_rows, values = read_variable_output_csv(path)
+
+    assert values[0].tolist() == [0.0, 0.0, 0.0]
+    assert values[1].tolist() == [0.1, 1.0, 2.0]
+
+
+def test_read_variable_output_csv_keeps_short_and_trailing_comma_rows(tmp_path):
+    path = write_csv(
+        tmp_path,
+        "Time,Car,Car\n,A:x,A:y\n,x,y\nsec,ft,ft\n"
+        "0.0,1,2\n0.1,3\n0.2,5,6,\n0.3,7,8\n0.4,9,10\n",
+    )
+
+    _header_rows, values = read_variable_output_csv(path)
+
+    assert values.shape == (5, 3)
+    assert values[:, 0].tolist() == [0.0, 0.1, 0.2, 0.3, 0.4]
+    assert values[1].tolist() == [0.1, 3.0, 0.0]
+    assert values[2].tolist() == [0.2, 5.0, 6.0]
+
+
+def test_read_variable_output_csv_parses_quoted_cells(tmp_path):
+    path = write_csv(
+        tmp_path,
+        'Time,Car,Car\n,A:x,A:y\n,x,y\nsec,ft,ft\n"0.0","1.5",2\n0.1,"3",""\n',
+    )
+
+    _header_rows, values = read_variable_output_csv(path)
+
+    assert values.tolist() == [[0.0, 1.5, 2.0], [0.1, 3.0, 0.0]]
+
+
+def test_read_variable_output_csv_skips_blank_lines(tmp_path):
+    path = write_csv(
+        tmp_path,
+        "Time,Car,Car\n,A:x,A:y\n,x,y\nsec,ft,ft\n0.0,1,2\n\n0.1,3,4\n\n",
+    )
+
+    _header_rows, values = read_variable_output_csv(path)
+
+    assert values[:, 0].tolist() == [0.0, 0.1]
+    assert values[1].tolist() == [0.1, 3.0, 4.0]
+
+
+def test_read_variable_output_csv_without_data_rows(tmp_path):
+    path = write_csv(tmp_path, "Time,Car\n,A:x\n,x\nsec,ft\n")
+
+    header_rows, values = read_variable_output_csv(path)
+
+    assert len(header_rows) == 4
+    assert len(values) == 0
+
+
+def test_read_variable_output_csv_trims_padded_header_cells(tmp_path):
+    path = write_csv(tmp_path, "Time,  Car ,Car\n, A:x , A:y\n,x ,y\nsec, ft,ft \n0.0,1,2\n")
+
+    header_rows, _values = read_variable_output_csv(path)
+
+    assert header_rows == [["Car", "Car"], ["A:x", "A:y"], ["x", "y"], ["ft", "ft"]]
+
+
+def test_read_variable_output_csv_columns_are_contiguous(tmp_path):
+    path = write_csv(tmp_path, "Time,Car,Car\n,A:x,A:y\n,x,y\nsec,ft,ft\n0.0,1,2\n0.1,3,4\n0.2,5,6\n")
+
+    _header_rows, values = read_variable_output_csv(path)
+
+    column = values[:, 2]
+    assert column.flags["C_CONTIGUOUS"]
+    assert np.shares_memory(column, values)
+    assert column.tolist() == [2.0, 4.0, 6.0]
+
+
+def test_split_variable_name_uses_first_and_last_colon():
+    split_variable_name = ns["split_variable_name"]
+
+    assert split_variable_name("Tires:Front:Left:VehTireX") == ("Tires:Front:Left", "Tires", "VehTireX")
+    assert split_variable_name("KinematicOut:VehKinematicX") == ("KinematicOut", "KinematicOut", "VehKinematicX")
+    assert split_variable_name("Time") == ("Time", "Time", "Time")
@@ -0,0 +1,149 @@
+import ast
+import pathlib
+
+import numpy as np
+
+
+module_path = pathlib.Path(__file__).resolve().parents[1] / "variableoutput_importer.py"
+module_ast = ast.parse(module_path.read_text())
+ns = {"np": np}
+for node in module_ast.body:
+    if isinstance(node, ast.FunctionDef) and node.name in {
+        "polyline_edge_indices",
+        "set_polyline_geometry",
+    }:
+        code = compile(ast.Module([node], []), filename="<ast>", mode="exec")
+        exec(code, ns)
+
+
+class FakeElements:
+    def __init__(self):
+        self.count = 0
+        self.written = {}
+
+    def add(self, count):
+        self.count += count
+
+    def foreach_set(self, attr, seq):
+        assert len(seq) % self.count == 0
+        self.written[attr] = np.array(seq)
+
+
+class FakeMesh:
+    def __init__(self):
+        self.vertices = FakeElements()
+        self.edges = FakeElements()
+        self.updated = False
+
+    def update(self):
+        self.updated = True
+
+
+def test_polyline_edge_indices_joins_successive_points():
+    assert ns["polyline_edge_indices"](4).tolist() == [[0, 1], [1, 2], [2, 3]]
+    assert ns["polyline_edge_indices"](1).shape == (0, 2)
+
+
+def test_set_polyline_geometry_writes_vertices_and_edges_in_bulk():
+    mesh = FakeMesh()
+
+    ns["set_polyline_geometry"](mesh, [(0, 0, 0), (1, 2, 3), (4, 5, 6)])
+
+    assert mesh.vertices.count == 3
+    assert mesh.vertices.written["co"].tolist() == [0, 0, 0, 1, 2, 3, 4, 5, 6]
+    assert mesh.edges.count == 2
+    assert mesh.edges.written["vertices"].tolist() == [0, 1, 1, 2]
+    assert mesh.updated
+
+
+def test_set_polyline_geometry_single_point_has_no_edges():
+    mesh = FakeMesh()
+
+    ns["set_polyline_geometry"](mesh, [(1, 1, 1)])
+
+    assert mesh.vertices.count == 1
+    assert mesh.edges.count == 0
+
+
+class RemovedMesh:
+    @property
+    def name(self):
+        raise ReferenceError("StructRNA of type Mesh has been removed")
+
+
+class LiveMesh:
+    name = "HVE Arrow"
+
+
+def load_mesh_cache():
+    cache_ns = {}
+    for node in module_ast.body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(target, ast.Name) and target.id == "_primitive_mesh_cache" for target in node.targets
+        ):
+            exec(compile(ast.Module([node], []), filename="<ast>", mode="exec"), cache_ns)
+        elif isinstance(node, ast.FunctionDef) and node.name == "get_cached_mesh":
+            exec(compile(ast.Module([node], []), filename="<ast>", mode="exec"), cache_ns)
+    return cache_ns
+
+
+def test_get_cached_mesh_builds_once_per_key():
+    cache_ns = load_mesh_cache()
+    built = []
+
+    def build():
+        built.append(LiveMesh())
+        return built[-1]
+
+    first = cache_ns["get_cached_mesh"](("arrow", 1, 0.3048), build)
+    second = cache_ns["get_cached_mesh"](("arrow", 1, 0.3048), build)
+    other = cache_ns["get_cached_mesh"](("arrow", 7, 0.3048), build)
+
+    assert first is second
+    assert other is not first
+    assert len(built) == 2
+
+
+def test_get_cached_mesh_rebuilds_removed_meshes():
+    cache_ns = load_mesh_cache()
+    cache_ns["_primitive_mesh_cache"][("cube", 1)] = RemovedMesh()
+    replacement = LiveMesh()
+
+    assert cache_ns["get_cached_mesh"](("cube", 1), lambda: replacement) is replacement
+    assert cache_ns["_primitive_mesh_cache"][("cube", 1)] is replacement
+
+
+def load_spline_points():
+    spline_ns = {"np": np}
+    for node in module_ast.body:
+        if isinstance(node, ast.FunctionDef) and node.name in {"set_poly_spline_points", "set_bezier_spline_points"}:
+            exec(compile(ast.Module([node], []), filename="<ast>", mode="exec"), spline_ns)
+    return spline_ns
+
+
+class FakeSpline:
+    def __init__(self):
+        # A new spline starts with a single point
+        self.points = FakeElements()
+        self.points.count = 1
+
+
+def test_set_poly_spline_points_writes_weighted_coordinates_in_bulk():
+    spline = FakeSpline()
+
+    load_spline_points()["set_poly_spline_points"](spline, np.array([[0, 0, 0], [1, 2, 3]]))
+
+    assert spline.points.count == 2
+    assert spline.points.written["co"].tolist() == [0, 0, 0, 1, 1, 2, 3, 1]
+
+
+def test_set_bezier_spline_points_offsets_handles_along_x():
+    spline = FakeSpline()
+    spline.bezier_points = spline.points
+
+    load_spline_points()["set_bezier_spline_points"](spline, [(0, 0, 0), (1, 2, 3)])
+
+    assert spline.bezier_points.count == 2
+    assert spline.bezier_points.written["co"].tolist() == [0, 0, 0, 1, 2, 3]
+    assert spline.bezier_points.written["handle_left"].tolist() == [-0.5, 0, 0, 0.5, 2, 3]
+    assert spline.bezier_points.written["handle_right"].tolist() == [0.5, 0, 0, 1.5, 2, 3]
@@ -47,3 +47,31 @@ def test_variableoutput_load_does_not_wrap_child_import_timings():
     assert "read VariableOutput CSV and build import data" not in source
     assert 'timed_phase(timing_report, "read VariableOutput CSV")' in source
     assert 'timed_phase(timing_report, "build VariableOutput data arrays")' in source
+
+
+def test_deferred_scene_updates_restores_lock_and_updates_once():
+    from types import SimpleNamespace
+
+    ns = load_timing_namespace(FakeTime([]))
+    module = ast.Module(
+        [node for node in module_ast.body if isinstance(node, ast.FunctionDef) and node.name == "deferred_scene_updates"],
+        [],
+    )
+    exec(compile(module, filename="<ast>", mode="exec"), ns)
+
+    updates = []
+    context = SimpleNamespace(
+        scene=SimpleNamespace(render=SimpleNamespace(use_lock_interface=False)),
+        view_layer=SimpleNamespace(update=lambda: updates.append(True)),
+    )
+
+    try:
+        with ns["deferred_scene_updates"](context):
+            assert context.scene.render.use_lock_interface is True
+            assert updates == []
+            raise RuntimeError("import failed")
+    except RuntimeError:
+        pass
+
+    assert context.scene.render.use_lock_interface is False
+    assert updates == [True]
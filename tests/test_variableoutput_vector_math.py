@@ -0,0 +1,88 @@
+import ast
+import math
+import pathlib
+
+import numpy as np
+
+
+module_path = pathlib.Path(__file__).resolve().parents[1] / "variableoutput_importer.py"
+module_ast = ast.parse(module_path.read_text())
+ns = {"np": np, "math": math}
+for node in module_ast.body:
+    if isinstance(node, ast.FunctionDef) and node.name in {
+        "calculate_total_properties_vec",
+        "calculate_total_properties",
+        "quaternion_multiply",
+        "track_quaternions",
+    }:
+        code = compile(ast.Module([node], []), filename="<ast>", mode="exec")
+        exec(code, ns)
+
+
+def test_calculate_total_properties_vec_normalizes_every_row():
+    magnitude, unit = ns["calculate_total_properties_vec"](np.array([[3.0, 4.0, 0.0], [0.0, 0.0, -2.0]]))
+
+    assert magnitude.tolist() == [5.0, 2.0]
+    assert np.allclose(unit, [[0.6, 0.8, 0.0], [0.0, 0.0, -1.0]])
+
+
+def test_calculate_total_properties_vec_zero_vector_has_zero_unit():
+    magnitude, unit = ns["calculate_total_properties_vec"](np.zeros((2, 3)))
+
+    assert magnitude.tolist() == [0.0, 0.0]
+    assert unit.tolist() == [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]
+
+
+def test_calculate_total_properties_scalar_wrapper():
+    magnitude, unit = ns["calculate_total_properties"](0.0, 3.0, 4.0)
+
+    assert math.isclose(magnitude, 5.0)
+    assert unit == (0.0, 0.6, 0.8)
+    assert ns["calculate_total_properties"](0, 0, 0) == (0.0, (0.0, 0.0, 0.0))
+
+
+def test_calculate_total_properties_vec_matches_row_norms():
+    xyz = np.random.default_rng(0).normal(size=(64, 3))
+    xyz[::8] = 0.0
+
+    magnitude, unit = ns["calculate_total_properties_vec"](xyz)
+
+    assert np.allclose(magnitude, np.linalg.norm(xyz, axis=1))
+    assert np.allclose(unit * magnitude[:, None], xyz)
+    assert not np.isnan(unit).any()
+
+
+def rotate_z_axis(quat):
+    w, x, y, z = quat
+    return np.array([2 * (x * z + w * y), 2 * (y * z - w * x), 1 - 2 * (x * x + y * y)])
+
+
+def rotate_y_axis(quat):
+    w, x, y, z = quat
+    return np.array([2 * (x * y - w * z), 1 - 2 * (x * x + z * z), 2 * (y * z + w * x)])
+
+
+def test_track_quaternions_point_z_along_each_vector():
+    vectors = np.random.default_rng(1).normal(size=(32, 3))
+    unit = vectors / np.linalg.norm(vectors, axis=1)[:, None]
+
+    quats = ns["track_quaternions"](unit)
+
+    assert np.allclose(np.linalg.norm(quats, axis=1), 1.0)
+    for quat, direction in zip(quats, unit):
+        assert np.allclose(rotate_z_axis(quat), direction)
+        # The up axis stays in the vertical plane through the tracked direction
+        assert abs(np.dot(np.cross(direction, [0.0, 0.0, 1.0]), rotate_y_axis(quat))) < 1e-9
+
+
+def test_track_quaternions_zero_vector_is_identity():
+    quats = ns["track_quaternions"](np.zeros((2, 3)))
+
+    assert quats.tolist() == [[1.0, 0.0, 0.0, 0.0], [1.0, 0.0, 0.0, 0.0]]
+
+
+def test_track_quaternions_along_z_matches_blender_half_turn():
+    # vec_to_quat resolves the degenerate +Z case to a half turn about Z
+    quat = ns["track_quaternions"](np.array([[0.0, 0.0, 1.0]]))[0]
+
+    assert np.allclose(quat, [0.0, 0.0, 0.0, 1.0])
@@ -11,7 +11,7 @@ ns = {'re': re, 'contextmanager': contextmanager}
 for node in module_ast.body:
     if isinstance(node, ast.Assign):
         for target in node.targets:
-            if isinstance(target, ast.Name) and target.id == "ROTATION_AXIS_KEYWORDS":
+            if isinstance(target, ast.Name) and target.id in {"ROTATION_AXIS_KEYWORDS", "_DUP_SUFFIX_RE"}:
                 code = compile(ast.Module([node], []), filename="<ast>", mode="exec")
                 exec(code, ns)
     elif isinstance(node, ast.FunctionDef) and node.name in {
@@ -19,6 +19,7 @@ for node in module_ast.body:
         "normalize_root_name",
         "get_root_vehicle_names",
         "is_valid_blender_object",
+        "vehicle_name_tokens",
         "belongs_to_vehicle",
         "join_mesh_objects_per_vehicle",
         "get_body_mesh_objects_for_vehicle",
@@ -94,6 +95,15 @@ def test_belongs_to_vehicle_wheel_descriptors():
         assert belongs_to_vehicle(name, 'Heil_Rear')
 
 
+def test_belongs_to_vehicle_with_precomputed_tokens():
+    tokens = ns["vehicle_name_tokens"]('Heil_Rear')
+    assert tokens == ['heil', 'rear']
+    assert belongs_to_vehicle('Mesh: Heil_Rear.001: Body', 'Heil_Rear', tokens)
+    assert belongs_to_vehicle('Wheel_FL: Heil Rear Wheel', 'Heil_Rear', tokens)
+    assert not belongs_to_vehicle('Mesh: Heil: Body', 'Heil_Rear', tokens)
+    assert not belongs_to_vehicle('Mesh: Other: Body', 'Heil_Rear', tokens)
+
+
 def test_get_root_vehicle_names_skips_removed_blender_objects():
     class RemovedObj:
         @property
@@ -3,8 +3,12 @@ import csv
 import os
 import math
 import time
+import warnings
 from contextlib import contextmanager
+import numpy as np
+import bmesh
 import mathutils  # Blender's math utilities library
+from .keyframes import ensure_fcurve, keyframe_channels, run_boundary_indices, set_fcurve_keyframes
 bl_info = {
     "name": "HVE Motion Import",
     "category": "Import-Export",
@@ -59,6 +63,19 @@ def timed_phase(timing_report, name):
         yield
 
 
+@contextmanager
+def deferred_scene_updates(context):
+    """Lock the interface while objects are built and evaluate the view layer once at the end."""
+    render = context.scene.render
+    previous_lock = render.use_lock_interface
+    render.use_lock_interface = True
+    try:
+        yield
+    finally:
+        render.use_lock_interface = previous_lock
+        context.view_layer.update()
+
+
 REQUIRED_MOTION_VARIABLES = {
     ("KinematicOut", "VehKinematicX"),
     ("KinematicOut", "VehKinematicY"),
@@ -128,14 +145,15 @@ def make_vehicle_id(vehicle_name):
 
 
 def split_variable_name(object_name_variable):
-    if ":" in object_name_variable:
-        object_name = object_name_variable[:object_name_variable.rfind(":")]
-        group_name = object_name_variable.split(":")[0]
-        variable = object_name_variable.split(":")[-1]
-    else:
-        object_name = object_name_variable
-        group_name = object_name_variable
-        variable = object_name_variable
+    """Split ``Group:...:Variable`` into ``(object_name, group_name, variable)``.
+
+    The object name is everything before the last colon and the group name
+    everything before the first; without a colon all three are the whole name.
+    """
+    object_name, sep, variable = object_name_variable.rpartition(":")
+    if not sep:
+        return object_name_variable, object_name_variable, object_name_variable
+    group_name = object_name_variable.partition(":")[0]
     return object_name, group_name, variable
 
 
@@ -173,14 +191,15 @@ def inspect_variable_columns(filepath, **create_options):
         return variables
 
     with open(filepath, newline="") as csvfile:
-        reader = csv.reader(csvfile, delimiter=',')
+        # skipinitialspace drops the blank after each delimiter in C.
+        reader = csv.reader(csvfile, delimiter=',', skipinitialspace=True)
         header_rows = []
         for _ in range(4):
             try:
                 row = next(reader)
             except StopIteration:
                 break
-            header_rows.append([cell.strip(' ') for cell in row])
+            header_rows.append([cell.rstrip(' ') for cell in row])
 
     if len(header_rows) < 2:
         return variables
@@ -221,20 +240,279 @@ def parse_newline_delimited_ids(serialized_ids):
 def parse_disabled_variable_ids(disabled_variables):
     return parse_newline_delimited_ids(disabled_variables)
 
+# Collections, node groups and materials looked up or created during the
+# current import, keyed by name. Cleared at the start of every read_some_data call.
+_collection_cache = {}
+_node_group_cache = {}
+_material_cache = {}
+
+
+def _cached_get(cache, datablocks, name):
+    """Return ``datablocks.get(name)`` through ``cache``, memoizing hits for this import."""
+    datablock = cache.get(name)
+    if datablock is None:
+        datablock = datablocks.get(name)
+        if datablock is not None:
+            cache[name] = datablock
+    return datablock
+
+
+def get_collection(collection_name):
+    """Return the collection named ``collection_name`` or None."""
+    return _cached_get(_collection_cache, bpy.data.collections, collection_name)
+
+
+def get_node_group(node_group_name):
+    """Return the node group named ``node_group_name`` or None."""
+    return _cached_get(_node_group_cache, bpy.data.node_groups, node_group_name)
+
+
+def get_material(material_name):
+    """Return the material named ``material_name`` or None."""
+    return _cached_get(_material_cache, bpy.data.materials, material_name)
+
+def get_geometry_nodes_modifier(obj):
+    """Return ``obj``'s Geometry Nodes modifier named "GeometryNodes", or None."""
+    modifier = obj.modifiers.get("GeometryNodes")
+    if modifier is not None and modifier.type != 'NODES':
+        return None
+    return modifier
+
+def ensure_material_node_group(node_group_name, base_color):
+    """Return the Geometry Nodes group that sets a single-color material, building it once.
+
+    The group and its material are both named ``node_group_name`` and are
+    shared by every object that uses them, so they are only built the first
+    time they are missing.
+    """
+    node_group = get_node_group(node_group_name)
+
+    if node_group is None:
+        node_group = bpy.data.node_groups.new(name=node_group_name, type='GeometryNodeTree')
+        _node_group_cache[node_group.name] = node_group
+        node_group.use_fake_user = True  # Prevent Blender from deleting it
+        node_group.is_modifier = True
+
+        # Add input and output nodes
+        input_node = node_group.nodes.new(type='NodeGroupInput')
+        output_node = node_group.nodes.new(type='NodeGroupOutput')
+
+        node_group.interface.new_socket("Geometry", in_out='INPUT', socket_type='NodeSocketGeometry')
+        node_group.interface.new_socket("Geometry", in_out='OUTPUT', socket_type='NodeSocketGeometry')
+
+        # Position nodes
+        input_node.location = (-200, 0)
+        output_node.location = (200, 0)
+
+        # Create a Set Material Node
+        set_material_node = node_group.nodes.new(type='GeometryNodeSetMaterial')
+        set_material_node.location = (200, -400)
+
+        # Create or get the material
+        material_name = node_group_name  # Use node group name as material name
+        material = get_material(material_name)
+        if material is None:
+            material = bpy.data.materials.new(name=material_name)
+            _material_cache[material.name] = material
+            material.use_nodes = True
+            material_tree = material.node_tree
+
+            # Clear any existing nodes
+            material_tree.nodes.clear()
+
+            # Create a Principled BSDF Node
+            principled_bsdf_node = material_tree.nodes.new(type='ShaderNodeBsdfPrincipled')
+            principled_bsdf_node.location = (-200, -400)
+            principled_bsdf_node.inputs["Base Color"].default_value = base_color  # Set color
+
+            # Create a Material Output Node
+            material_output_node = material_tree.nodes.new(type='ShaderNodeOutputMaterial')
+            material_output_node.location = (0, -400)
+
+            # Connect shader nodes in the material node tree
+            material_tree.links.new(principled_bsdf_node.outputs["BSDF"], material_output_node.inputs["Surface"])
+
+        # Assign the material to Set Material node
+        set_material_node.inputs["Material"].default_value = material
+
+        # Connect nodes
+        node_group.links.new(input_node.outputs["Geometry"], set_material_node.inputs["Geometry"])
+        node_group.links.new(set_material_node.outputs["Geometry"], output_node.inputs["Geometry"])
+
+    return node_group
+
+# (from node, output socket, to node, input socket) links of the "TireSkids" group
+TIRE_SKIDS_LINKS = (
+    ("input", "Geometry", "mesh_to_curve", "Mesh"),
+    ("mesh_to_curve", "Curve", "curve_to_mesh", "Curve"),
+    ("bezier_segment", "Curve", "curve_to_mesh", "Profile Curve"),
+    ("curve_to_mesh", "Mesh", "separate_geometry", "Geometry"),
+    ("separate_geometry", "Selection", "set_material", "Geometry"),
+    ("index", "Index", "less_than", 0),
+    ("scene_time", "Frame", "less_than", 1),
+    ("less_than", "Result", "separate_geometry", "Selection"),
+    ("set_material", "Geometry", "set_position", "Geometry"),
+    ("combine_xyz", 0, "set_position", "Offset"),
+    ("set_position", "Geometry", "output", "Geometry"),
+)
+
+def ensure_tire_skids_node_group(scale_factor):
+    """Return the shared "TireSkids" Geometry Nodes group, building it and its material once.
+
+    The group sweeps each skid polyline into a ribbon ``0.5 * scale_factor``
+    wide, shows it only up to the current frame and shades it by the "Skid"
+    point attribute.
+    """
+    node_group = get_node_group("TireSkids")
+
+    if node_group is None:
+        node_group = bpy.data.node_groups.new(name="TireSkids", type='GeometryNodeTree')
+        _node_group_cache[node_group.name] = node_group
+        node_group.use_fake_user = True  # Prevent Blender from deleting it
+        node_group.is_modifier = True
+        # Add input and output nodes
+        input_node = node_group.nodes.new(type='NodeGroupInput')
+        output_node = node_group.nodes.new(type='NodeGroupOutput')
+
+        node_group.interface.new_socket("Geometry", in_out='INPUT', socket_type='NodeSocketGeometry')
+        node_group.interface.new_socket("Geometry", in_out='OUTPUT', socket_type='NodeSocketGeometry')
+
+        # Position nodes
+        input_node.location = (-200, 0)
+        output_node.location = (200, 0)
+
+        # Create a Mesh to Curve Node
+        mesh_to_curve_node = node_group.nodes.new(type='GeometryNodeMeshToCurve')
+        mesh_to_curve_node.location = (0, -200)
+
+        # Create a Curve to Mesh Node
+        curve_to_mesh_node = node_group.nodes.new(type='GeometryNodeCurveToMesh')
+        curve_to_mesh_node.location = (200, -200)
+
+        # Create a Curve Bezier Segment Node
+        bezier_segment_node = node_group.nodes.new(type='GeometryNodeCurvePrimitiveBezierSegment')
+        bezier_segment_node.location = (-200, -200)
+        bezier_segment_node.inputs["Start"].default_value = (0.25*scale_factor, 0.0, 0.0)
+        bezier_segment_node.inputs["End"].default_value = (-0.25*scale_factor, 0.0, 0.0)
+        bezier_segment_node.inputs["Start Handle"].default_value = (0.0, 0.0, 0.0)
+        bezier_segment_node.inputs["End Handle"].default_value = (0.0, 0.0, 0.0)
+        bezier_segment_node.inputs["Resolution"].default_value = 1
+
+        # Create a Separate Geometry Node
+        separate_geometry_node = node_group.nodes.new(type='GeometryNodeSeparateGeometry')
+        separate_geometry_node.location = (0, -400)
+        separate_geometry_node.domain = 'FACE'
+
+        # Create a Set Material Node
+        set_material_node = node_group.nodes.new(type='GeometryNodeSetMaterial')
+        set_material_node.location = (200, -400)
+
+        # Create or get the material
+        material_name = "TireSkids"
+        material = get_material(material_name)
+        if material is None:
+            material = bpy.data.materials.new(name=material_name)
+            _material_cache[material.name] = material
+            # Ensure the material uses nodes
+            material.use_nodes = True
+            material_tree = material.node_tree
+
+            # Clear any existing nodes
+            material_tree.nodes.clear()
+
+            # Create an Attribute Node
+            attribute_node = material_tree.nodes.new(type='ShaderNodeAttribute')
+            attribute_node.location = (-600, -400)
+            attribute_node.attribute_name = "Skid"
+
+            # Create a Gamma Node
+            gamma_node = material_tree.nodes.new(type='ShaderNodeGamma')
+            gamma_node.location = (-400, -400)
+            gamma_node.inputs["Gamma"].default_value = 1
+
+            # Create a Principled BSDF Node
+            principled_bsdf_node = material_tree.nodes.new(type='ShaderNodeBsdfPrincipled')
+            principled_bsdf_node.location = (-200, -400)
+            principled_bsdf_node.inputs["Base Color"].default_value = (0,0,0,1)
+
+            # Create a Material Output Node
+            material_output_node = material_tree.nodes.new(type='ShaderNodeOutputMaterial')
+            material_output_node.location = (0, -400)
+
+            # Connect shader nodes in the material node tree
+            material_tree.links.new(attribute_node.outputs["Color"], gamma_node.inputs["Color"])
+            material_tree.links.new(gamma_node.outputs["Color"], principled_bsdf_node.inputs["Alpha"])
+            material_tree.links.new(principled_bsdf_node.outputs["BSDF"], material_output_node.inputs["Surface"])
+
+        # Assign the material to Set Material node
+        set_material_node.inputs["Material"].default_value = material
+
+        # Create an Index Node
+        index_node = node_group.nodes.new(type='GeometryNodeInputIndex')
+        index_node.location = (-400, -400)
+
+        # Create a Scene Time Node
+        scene_time_node = node_group.nodes.new(type='GeometryNodeInputSceneTime')
+        scene_time_node.location = (-400, -600)
+
+        # Create a Less Than Node
+        less_than_node = node_group.nodes.new(type='FunctionNodeCompare')
+        less_than_node.operation = 'LESS_THAN'
+        less_than_node.location = (-200, -600)
+
+        # Create a Set Position node
+        set_position_node = node_group.nodes.new(type='GeometryNodeSetPosition')
+        set_position_node.location = (0, 0)
+
+        # Create a Combine XYZ node to define the offset vector (0, 0, 0.001)
+        combine_xyz_node = node_group.nodes.new(type='ShaderNodeCombineXYZ')
+        combine_xyz_node.location = (-200, 0)
+
+        # Set the Z value to 0.001 (X and Y remain 0)
+        combine_xyz_node.inputs[0].default_value = 0  # X
+        combine_xyz_node.inputs[1].default_value = 0  # Y
+        combine_xyz_node.inputs[2].default_value = 0.001  # Z
+
+        # Connect nodes
+        nodes = {
+            "input": input_node,
+            "output": output_node,
+            "mesh_to_curve": mesh_to_curve_node,
+            "curve_to_mesh": curve_to_mesh_node,
+            "bezier_segment": bezier_segment_node,
+            "separate_geometry": separate_geometry_node,
+            "set_material": set_material_node,
+            "index": index_node,
+            "scene_time": scene_time_node,
+            "less_than": less_than_node,
+            "set_position": set_position_node,
+            "combine_xyz": combine_xyz_node,
+        }
+        links = node_group.links
+        for from_node, from_socket, to_node, to_socket in TIRE_SKIDS_LINKS:
+            links.new(nodes[from_node].outputs[from_socket], nodes[to_node].inputs[to_socket])
+
+    return node_group
+
 def remove_from_all_collections(obj):
     """Remove an object from all Blender collections before reassigning it."""
-    if not obj or obj.name not in bpy.data.objects:
+    if obj is None:
         return
 
-    # Unlink from all user collections
-    for collection in list(obj.users_collection):
+    # Unlink from the collections that actually hold the object
+    users = list(obj.users_collection)
+    for collection in users:
         collection.objects.unlink(obj)
 
     # Also unlink from the scene's master collection, which isn't included in
-    # ``obj.users_collection`` or ``bpy.data.collections``.
+    # ``obj.users_collection`` or ``bpy.data.collections``. Unlinking directly
+    # avoids a by-name scan of the root collection's objects.
     active_root = bpy.context.scene.collection
-    if obj.name in active_root.objects:
-        active_root.objects.unlink(obj)
+    if active_root not in users:
+        try:
+            active_root.objects.unlink(obj)
+        except RuntimeError:
+            pass  # Not linked to the scene root
 
 def assign_objects_to_subcollection(collection_name, parent_collection, objects):
     """
@@ -255,17 +533,17 @@ def assign_objects_to_subcollection(collection_name, parent_collection, objects)
 
 
     # Check if subcollection exists, if not, create it
-    sub_collection = bpy.data.collections.get(collection_name)
+    sub_collection = get_collection(collection_name)
     if not sub_collection:
         sub_collection = bpy.data.collections.new(collection_name)
         parent_collection.children.link(sub_collection)  # Add as a subcollection
+        _collection_cache[sub_collection.name] = sub_collection
 
     # Remove objects from existing collections and reassign them
     for obj in objects:
         if obj:
             remove_from_all_collections(obj)  # Remove from any existing collection
-            if obj.name not in sub_collection.objects:
-                sub_collection.objects.link(obj)
+            sub_collection.objects.link(obj)  # Cannot already be linked after the removal above
 
 def assign_objects_to_collection(collection_name, objects):
     """
@@ -277,7 +555,7 @@ def assign_objects_to_collection(collection_name, objects):
     """
     
     
-    collection = bpy.data.collections.get(collection_name)
+    collection = get_collection(collection_name)
     if not collection:
         print(f"Error: Collection '{collection_name}' does not exist.")
         return
@@ -288,9 +566,11 @@ def assign_objects_to_collection(collection_name, objects):
 
     # Remove objects from existing collections and reassign them
     for obj in objects:
-        if obj:            
-            if obj.name not in collection.objects:
+        if obj:
+            try:
                 collection.objects.link(obj)
+            except RuntimeError:
+                pass  # Already linked to this collection
 
 def ensure_collection_exists(collection_name, parent_collection=None, hide=False, dont_render=False):
     """
@@ -303,13 +583,14 @@ def ensure_collection_exists(collection_name, parent_collection=None, hide=False
     Returns:
     - bpy.types.Collection: The created or existing collection.
     """
-    collection = bpy.data.collections.get(collection_name)
+    collection = get_collection(collection_name)
     if collection is None:
         collection = bpy.data.collections.new(collection_name)
         if parent_collection:
             parent_collection.children.link(collection)
         else:
             bpy.context.scene.collection.children.link(collection)  # Link to scene if no parent
+        _collection_cache[collection.name] = collection
         print(f"✅ Collection '{collection_name}' created successfully.")
     else:
         print(f"🔍 Collection '{collection_name}' already exists.")
@@ -337,6 +618,57 @@ def parent_keep_transform(child,parent):
         #child.matrix_world = matrix_world
     
     
+def read_variable_output_csv(filepath):
+    """Read a VariableOutput CSV into its header rows and a numeric value block.
+
+    Returns ``(header_rows, values)``. ``header_rows`` holds the four metadata
+    rows (vehicle, variable, translated name, unit) without the time column;
+    ``values`` is a column-major ``(frames, columns)`` float array whose
+    column 0 is time. Each non-blank data row is one frame, one column per
+    header cell; empty, missing or non-numeric cells read as 0.0.
+    """
+    # A 1 MiB buffer keeps large exports from being read in many small chunks.
+    with open(filepath, 'r', buffering=1 << 20, newline="") as csvfile:
+        # skipinitialspace drops the blank after each delimiter in C; only the
+        # four metadata rows need their trailing blanks trimmed.
+        reader = csv.reader(csvfile, delimiter=',', skipinitialspace=True)
+        header_rows = []
+        for _ in range(4):
+            row = next(reader, None)
+            if row is None:
+                break
+            header_rows.append([cell.rstrip(' ') for cell in row[1:]])
+
+        # Quoted numeric cells ("1.5") must still parse, so drop the quotes.
+        text = csvfile.read().replace('"', '')
+
+    # genfromtxt drops rows shorter than usecols, so every non-blank row gets
+    # a full run of empty trailing fields. usecols then cuts each row to the
+    # header width and filling_values reads the missing cells as 0.0.
+    ncols = len(header_rows[0]) + 1 if header_rows else 1
+    padding = ',' * (ncols - 1)
+    lines = [line + padding for line in text.splitlines() if line.strip()]
+
+    # Parse the numeric block in one pass instead of float() per cell.
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        values = np.genfromtxt(
+            lines,
+            delimiter=',',
+            dtype=np.float64,
+            usecols=range(ncols),
+            filling_values=0.0,
+            ndmin=2,
+        )
+    if values.size == 0:
+        values = np.empty((0, ncols))
+
+    values[np.isnan(values)] = 0.0
+    # Column-major storage makes each variable's column a contiguous array, so
+    # the per-variable views handed to add_vehicle vectorize without copying.
+    return header_rows, np.asfortranarray(values)
+
+
 def read_some_data(context, filepath, scale_factor, save_separate_csv, disabled_variables=None, disabled_groups=None, disabled_vehicles=None, timing_report=None, create_tire_paths=True, create_skids=True, create_paths=True, create_velocities=True, create_accelerations=True, create_forces=True):
 
     """Do something with the selected file(s)."""
@@ -345,34 +677,23 @@ def read_some_data(context, filepath, scale_factor, save_separate_csv, disabled_
     disabled_variable_ids = parse_disabled_variable_ids(disabled_variables)
     disabled_group_ids = parse_newline_delimited_ids(disabled_groups)
     disabled_vehicle_ids = parse_newline_delimited_ids(disabled_vehicles)
+    _collection_cache.clear()
+    _node_group_cache.clear()
+    _material_cache.clear()
     vehicles = {}
     name_mapping = {}  # Dictionary to map object_name to object_name_trans
     group_name_mapping = {}  # Dictionary to map object_name to object_name_trans
     with timed_phase(timing_report, "read VariableOutput CSV"):
-        with open(filepath) as csvfile:
-            reader = csv.reader(csvfile, delimiter=',')
-            data = []
-            time = []
-            # strip all the white space
-            for row in reader:
-                row = [x.strip(' ') for x in row]
-
-                try:
-                    time.append(float(row[0]))
-                except ValueError:
-                    # Handle non-numeric timestamps (e.g., header rows)
-                    time.append(row[0])
-                data.append(row[1:])
+        data, values = read_variable_output_csv(filepath)
 
     with timed_phase(timing_report, "configure VariableOutput timeline"):
         # Set the frame rate
-        if len(time) < 6:
+        if len(data) < 4 or len(values) < 2:
             print("Not enough data rows to determine frame rate.")
             return
 
-        try:
-            time_step = float(time[5]) - float(time[4])
-        except (TypeError, ValueError):
+        time_step = float(values[1, 0] - values[0, 0])
+        if not math.isfinite(time_step):
             print("Unable to determine frame rate from the CSV timestamps.")
             return
 
@@ -382,8 +703,10 @@ def read_some_data(context, filepath, scale_factor, save_separate_csv, disabled_
 
         bpy.context.scene.render.fps = int(1.0/time_step)
         # Setup timeline
-        numframes = len(time[4:])
+        numframes = len(values)
         context.scene.frame_start = 0
+        # Objects are posed at their frame 0 values while importing; show that frame
+        context.scene.frame_current = 0
 
         # Get the current frame end in Blender's timeline
         current_max_frame = context.scene.frame_end
@@ -403,11 +726,14 @@ def read_some_data(context, filepath, scale_factor, save_separate_csv, disabled_
         skipped_variable_count = 0
         skipped_vehicle_count = 0
         skipped_group_count = 0
+        missing_column = None
         for j, vehicle_name in enumerate(data[0]):
             object_name_variable_for_filter = data[1][j] if len(data) > 1 and j < len(data[1]) else ""
-            _object_name_for_filter, group_name_for_filter, _variable_for_filter = split_variable_name(object_name_variable_for_filter)
+            # Object name is everything before the last colon, group name everything
+            # before the first and variable everything after the last
+            object_name, group_name, variable = split_variable_name(object_name_variable_for_filter)
             variable_id = make_variable_column_id(vehicle_name, object_name_variable_for_filter)
-            group_id = make_variable_group_id(vehicle_name, group_name_for_filter)
+            group_id = make_variable_group_id(vehicle_name, group_name)
             if make_vehicle_id(vehicle_name) in disabled_vehicle_ids:
                 skipped_vehicle_count += 1
                 continue
@@ -418,24 +744,13 @@ def read_some_data(context, filepath, scale_factor, save_separate_csv, disabled_
                 skipped_variable_count += 1
                 continue
             # Add the vehicle name if not in the dictionary
-            if vehicle_name not in vehicles.keys(): vehicles.update({vehicle_name:{}})
-            object_name_variable = data[1][j]
+            vehicle_objects = vehicles.setdefault(vehicle_name, {})
             object_name_translated = data[2][j]
-        
-            # Ensure object_name_variable contains ":"
-            if ":" in object_name_variable:
-                object_name = object_name_variable[:object_name_variable.rfind(":")]  # Everything before the last colon
-                group_name = object_name_variable.split(":")[0]  # Everything before the first colon
-                variable = object_name_variable.split(":")[-1]  # Everything after the last colon
-            else:
-                object_name = object_name_variable
-                group_name =  object_name_variable
-                variable = object_name_variable  # Use the entire string as the variable
 
             # Ensure object_name_translated contains ":"
-            if ":" in object_name_translated:
-                object_name_trans = object_name_translated[:object_name_translated.rfind(":")]
-                variable_name_trans = object_name_translated.split(":")[-1].lstrip()
+            object_name_trans, sep, variable_name_trans = object_name_translated.rpartition(":")
+            if sep:
+                variable_name_trans = variable_name_trans.lstrip()
             else:
                 object_name_trans = None  # Indicate that there is no object name
                 variable_name_trans = object_name_translated  # Use the entire string as the variable name
@@ -446,16 +761,16 @@ def read_some_data(context, filepath, scale_factor, save_separate_csv, disabled_
             name_mapping[f"group_name {object_name}"] = group_name  # Only map object names if they exist
             name_mapping[variable] = variable_name_trans
 
+            # Column 0 of ``values`` is time, so header column j is a view of values[:, j + 1];
+            # short rows share one zero column instead of allocating per variable
+            if j + 1 < values.shape[1]:
+                column = values[:, j + 1]
+            else:
+                if missing_column is None:
+                    missing_column = np.zeros(numframes)
+                column = missing_column
             # Add the Object name if not in dictionary
-            if object_name not in vehicles[vehicle_name].keys():
-                vehicles[vehicle_name].update({object_name:{}})
-            vehicles[vehicle_name][object_name].update({variable:[]})
-            for row in (data[4:]):
-                try:
-                    value = float(row[j])
-                except (IndexError, TypeError, ValueError):
-                    value = 0.0
-                vehicles[vehicle_name][object_name][variable].append(value)
+            vehicle_objects.setdefault(object_name, {})[variable] = column
             
         if skipped_vehicle_count:
             print(f"Skipped {skipped_vehicle_count} VariableOutput column(s) from disabled vehicle(s).")
@@ -471,76 +786,251 @@ def read_some_data(context, filepath, scale_factor, save_separate_csv, disabled_
     if any("KinematicOut" not in vehicle_data for vehicle_data in vehicles.values()):
         print("Not a valid HVE motion file.")
         return  # Stops execution without closing Blender
-    for vehicle_name in vehicles.keys():
-        if vehicle_name != '':
-            if timing_report:
-                with timing_report.phase(f"build vehicle data for {vehicle_name}"):
+    if save_separate_csv == True:
+        # Group the export columns by vehicle once instead of rescanning the header per vehicle
+        export_columns_by_vehicle = {}
+        for j, vehicle_col in enumerate(data[0]):
+            export_columns_by_vehicle.setdefault(vehicle_col, []).append(j)
+
+    with deferred_scene_updates(context):
+        for vehicle_name in vehicles.keys():
+            if vehicle_name != '':
+                if timing_report:
+                    with timing_report.phase(f"build vehicle data for {vehicle_name}"):
+                        add_vehicle(context, vehicle_name, vehicles, scale_factor, numframes, name_mapping, filename, create_tire_paths=create_tire_paths, create_skids=create_skids, create_paths=create_paths, create_velocities=create_velocities, create_accelerations=create_accelerations, create_forces=create_forces)
+                else:
                     add_vehicle(context, vehicle_name, vehicles, scale_factor, numframes, name_mapping, filename, create_tire_paths=create_tire_paths, create_skids=create_skids, create_paths=create_paths, create_velocities=create_velocities, create_accelerations=create_accelerations, create_forces=create_forces)
-            else:
-                add_vehicle(context, vehicle_name, vehicles, scale_factor, numframes, name_mapping, filename, create_tire_paths=create_tire_paths, create_skids=create_skids, create_paths=create_paths, create_velocities=create_velocities, create_accelerations=create_accelerations, create_forces=create_forces)
         
-        if save_separate_csv == True:
-            save_phase_name = f"save separate CSV for {vehicle_name}" if vehicle_name else "save separate CSV"
-            with timed_phase(timing_report, save_phase_name):
-                ##Export data to separate CSV files
-                dirname = os.path.dirname(filepath)
-                csv_path = os.path.join(dirname, filename + "_" +vehicle_name + '.csv')
-                time_decimals=3
-                # Extract relevant translated headers for the current vehicle
-                translated_headers = []
-                for j, vehicle_col in enumerate(data[0]):
-                    if vehicle_col == vehicle_name:
+            if save_separate_csv == True:
+                save_phase_name = f"save separate CSV for {vehicle_name}" if vehicle_name else "save separate CSV"
+                with timed_phase(timing_report, save_phase_name):
+                    ##Export data to separate CSV files
+                    dirname = os.path.dirname(filepath)
+                    csv_path = os.path.join(dirname, filename + "_" +vehicle_name + '.csv')
+                    time_decimals=3
+                    # Extract relevant translated headers and their columns for the current vehicle
+                    translated_headers = []
+                    export_columns = []
+                    for j in export_columns_by_vehicle.get(vehicle_name, ()):
                         object_name_variable = data[1][j] if j < len(data[1]) else ""
-                        variable_id = make_variable_column_id(vehicle_col, object_name_variable)
+                        variable_id = make_variable_column_id(vehicle_name, object_name_variable)
                         if variable_id in disabled_variable_ids and not is_required_variable(object_name_variable, create_tire_paths=create_tire_paths, create_skids=create_skids, create_paths=create_paths, create_velocities=create_velocities, create_accelerations=create_accelerations, create_forces=create_forces):
                             continue
                         translated_name = data[2][j]  # Object name translated (Row 3)
                         unit = data[3][j] if j < len(data[3]) else ""  # Units (Row 4)
                         full_header = f"{translated_name} {unit}" if unit else translated_name
                         translated_headers.append(full_header)
+                        export_columns.append(
+                            values[:, j + 1].tolist() if j + 1 < values.shape[1] else [0.0] * numframes
+                        )
+
+                    # Time is rebuilt from the frame rate, keeping only time (no frame column)
+                    export_times = [round(i * time_step, time_decimals) for i in range(numframes)]
 
-                # Open the CSV file for writing
-                with open(csv_path, "w", newline="") as csvfile:
-                    writer = csv.writer(csvfile)
-
-                    # Write header row (Frame, Time + translated headers for the specific vehicle)
-                    header_row = ['Time (sec)'] + translated_headers
-                    writer.writerow(header_row)
-
-                    # Write data rows
-                    num_rows = len(data) - 4  # Excluding header and metadata rows
-                    for i in range(num_rows):
-                        row_values = [round(i * time_step,time_decimals)]   # Removing frame, keeping only time
-                        for j, vehicle_col in enumerate(data[0]):
-                            if vehicle_col == vehicle_name:
-                                object_name_variable = data[1][j]
-                                variable_id = make_variable_column_id(vehicle_col, object_name_variable)
-                                if variable_id in disabled_variable_ids and not is_required_variable(object_name_variable, create_tire_paths=create_tire_paths, create_skids=create_skids, create_paths=create_paths, create_velocities=create_velocities, create_accelerations=create_accelerations, create_forces=create_forces):
-                                    continue
-                                object_name = object_name_variable[:object_name_variable.rfind(":")]
-                                variable = object_name_variable.split(":")[-1]
-                                try:
-                                    value = float(vehicles[vehicle_name][object_name][variable][i])
-                                except (ValueError, TypeError):  # Handle non-numeric values
-                                    value = 0.0  # Default to 0.0 if conversion fails
-
-                                row_values.append(value)
-
-                        writer.writerow(row_values)
+                    # Open the CSV file for writing
+                    with open(csv_path, "w", newline="") as csvfile:
+                        writer = csv.writer(csvfile)
+
+                        # Write header row (Frame, Time + translated headers for the specific vehicle)
+                        header_row = ['Time (sec)'] + translated_headers
+                        writer.writerow(header_row)
+
+                        # Write all data rows at once, column-wise from the parsed array
+                        writer.writerows(zip(export_times, *export_columns))
     return {'FINISHED'}
 
+def polyline_edge_indices(count):
+    """Return the ``(count - 1, 2)`` vertex index pairs joining ``count`` points in order."""
+    starts = np.arange(max(count - 1, 0), dtype=np.int32)
+    return np.column_stack((starts, starts + 1))
+
+
+def set_polyline_geometry(mesh_data, points):
+    """Fill an empty mesh with ``points`` as vertices joined by successive edges.
+
+    Vertices and edges are allocated once and written with ``foreach_set``
+    rather than converted element by element through ``from_pydata``.
+    """
+    coords = np.asarray(points, dtype=np.float32).reshape(-1, 3)
+    count = len(coords)
+    mesh_data.vertices.add(count)
+    mesh_data.vertices.foreach_set("co", coords.ravel())
+    if count > 1:
+        mesh_data.edges.add(count - 1)
+        mesh_data.edges.foreach_set("vertices", polyline_edge_indices(count).ravel())
+    mesh_data.update()
+
+
+def set_poly_spline_points(spline, points):
+    """Place ``points`` on a new POLY ``spline`` with a single ``foreach_set``.
+
+    POLY spline points are 4D (x, y, z, w); every weight is written as 1.
+    """
+    coords = np.asarray(points, dtype=np.float32).reshape(-1, 3)
+    count = len(coords)
+    co = np.ones((count, 4), dtype=np.float32)
+    co[:, :3] = coords
+    # A new spline already holds one point
+    spline.points.add(count - 1)
+    spline.points.foreach_set("co", co.ravel())
+
+
+def set_bezier_spline_points(spline, points):
+    """Place ``points`` on a new BEZIER ``spline``, writing each coordinate array in one call.
+
+    Each handle sits half a unit before or after its point along X.
+    """
+    coords = np.asarray(points, dtype=np.float32).reshape(-1, 3)
+    offset = np.array((0.5, 0.0, 0.0), dtype=np.float32)
+    # A new spline already holds one point
+    spline.bezier_points.add(len(coords) - 1)
+    spline.bezier_points.foreach_set("co", coords.ravel())
+    spline.bezier_points.foreach_set("handle_left", (coords - offset).ravel())
+    spline.bezier_points.foreach_set("handle_right", (coords + offset).ravel())
+
+
+def quaternion_multiply(a, b):
+    """Hamilton product ``a @ b`` of two ``(N, 4)`` arrays of (w, x, y, z) quaternions."""
+    aw, ax, ay, az = a.T
+    bw, bx, by, bz = b.T
+    return np.column_stack((
+        aw * bw - ax * bx - ay * by - az * bz,
+        aw * bx + ax * bw + ay * bz - az * by,
+        aw * by + ay * bw + az * bx - ax * bz,
+        aw * bz + az * bw + ax * by - ay * bx,
+    ))
+
+
+def track_quaternions(vectors):
+    """Vectorized ``Vector.to_track_quat('Z', 'Y')`` for an ``(N, 3)`` array of vectors.
+
+    Follows Blender's ``vec_to_quat`` step for step (including the order of
+    operations that decides signed zeros) so every frame gets the same
+    quaternion the per-frame call returned. Zero vectors give the identity.
+    """
+    vectors = np.asarray(vectors, dtype=np.float64).reshape(-1, 3)
+    quats = np.zeros((len(vectors), 4))
+    quats[:, 0] = 1.0
+    length = np.sqrt(np.einsum('ij,ij->i', vectors, vectors))
+    valid = length != 0
+    v = vectors[valid]
+    length = length[valid]
+
+    # Swing Z onto the vector about Z x v (X when the vector is nearly along Z)
+    nor = np.column_stack((-v[:, 1], v[:, 0], np.zeros(len(v))))
+    nor[np.abs(v[:, 0]) + np.abs(v[:, 1]) < 1e-4, 0] = 1.0
+    nor /= np.sqrt(np.einsum('ij,ij->i', nor, nor))[:, None]
+    half_angle = 0.5 * np.arccos(np.clip(v[:, 2] / length, -1.0, 1.0))
+    swing = np.column_stack((np.cos(half_angle), nor * np.sin(half_angle)[:, None]))
+
+    # Twist about the vector so the Y axis stays up (third matrix column of the swing)
+    q0, q1, q2, q3 = (math.sqrt(2.0) * swing).T
+    fp0 = q0 * q2 + q1 * q3
+    fp1 = -(q0 * q1) + q2 * q3
+    twist_angle = -0.5 * np.arctan2(-fp0, -fp1)
+    twist = np.column_stack((np.cos(twist_angle), v * (np.sin(twist_angle) / length)[:, None]))
+
+    quats[valid] = quaternion_multiply(twist, swing)
+    return quats
+
+
+# Calculate the unit vectors and magnitudes of a whole series of force vectors
+def calculate_total_properties_vec(xyz):
+    """Return ``(magnitudes, unit_vectors)`` for an ``(N, 3)`` array of vectors.
+
+    Zero-length vectors get a zero unit vector.
+    """
+    xyz = np.asarray(xyz, dtype=np.float64).reshape(-1, 3)
+    # einsum forms the row-wise dot products without a squared temporary
+    magnitude = np.sqrt(np.einsum('ij,ij->i', xyz, xyz))
+    unit_vectors = np.zeros_like(xyz)
+    np.divide(xyz, magnitude[:, None], out=unit_vectors, where=magnitude[:, None] > 0)
+    return magnitude, unit_vectors
+
+
 # Calculate the unit vector and magnitude of a force
 def calculate_total_properties(x, y, z):
-    # Magnitude of the force vector
-    magnitude = math.sqrt(x**2 + y**2 + z**2)
-    
-    # Normalize the force vector (unit vector)
-    if magnitude != 0:
-        unit_vector = (x / magnitude, y / magnitude, z / magnitude)
-    else:
-        unit_vector = (0, 0, 0)  # Zero vector
-    
-    return magnitude, unit_vector
+    magnitude, unit_vectors = calculate_total_properties_vec((x, y, z))
+    return float(magnitude[0]), tuple(unit_vectors[0].tolist())
+
+# Primitive meshes shared by every vehicle's body, wheel and arrow objects,
+# keyed on the parameters that shape them.
+_primitive_mesh_cache = {}
+
+
+def get_cached_mesh(key, build):
+    """Return the cached mesh for ``key``, calling ``build()`` to create it on a miss.
+
+    A cached mesh that Blender has since removed (e.g. after loading another
+    file) raises ReferenceError on access and is rebuilt.
+    """
+    mesh = _primitive_mesh_cache.get(key)
+    if mesh is not None:
+        try:
+            mesh.name
+            return mesh
+        except ReferenceError:
+            pass
+    mesh = build()
+    _primitive_mesh_cache[key] = mesh
+    return mesh
+
+
+def _bmesh_to_new_mesh(bm, name):
+    """Write ``bm`` into a new mesh with every element selected, then free it."""
+    for elements in (bm.verts, bm.edges, bm.faces):
+        for element in elements:
+            element.select = True
+    mesh = bpy.data.meshes.new(name)
+    bm.to_mesh(mesh)
+    bm.free()
+    return mesh
+
+
+def _new_uv_bmesh():
+    """Return an empty bmesh with a UV layer for ``calc_uvs`` primitives to fill."""
+    bm = bmesh.new()
+    bm.loops.layers.uv.new()
+    return bm
+
+
+def build_cube_mesh(size):
+    bm = _new_uv_bmesh()
+    bmesh.ops.create_cube(bm, size=size, calc_uvs=True)
+    return _bmesh_to_new_mesh(bm, "HVE Cube")
+
+
+def build_cylinder_mesh(radius, depth):
+    """32-sided cylinder lying along the Y axis (rotated 90 degrees about X)."""
+    bm = _new_uv_bmesh()
+    bmesh.ops.create_cone(
+        bm, cap_ends=True, cap_tris=False, segments=32, radius1=radius, radius2=radius, depth=depth, calc_uvs=True,
+        matrix=mathutils.Matrix.Rotation(math.radians(90), 4, 'X'),
+    )
+    return _bmesh_to_new_mesh(bm, "HVE Cylinder")
+
+
+def build_arrow_mesh(scale, scale_factor):
+    """Cone arrowhead on a thin shaft, stretched by ``scale`` along Z."""
+    # Each part is a radius 1, depth 2 primitive placed and sized in world space.
+    bm = _new_uv_bmesh()
+    # Cone (Arrowhead)
+    bmesh.ops.create_cone(
+        bm, cap_ends=True, cap_tris=False, segments=32, radius1=1, radius2=0, depth=2, calc_uvs=True,
+        matrix=mathutils.Matrix.Translation((0, 0, 0.875 * scale_factor))
+        @ mathutils.Matrix.Diagonal((0.010287, 0.010287, 0.0381, 1.0)),
+    )
+    # Cylinder (Arrow Shaft)
+    bmesh.ops.create_cone(
+        bm, cap_ends=True, cap_tris=False, segments=32, radius1=1, radius2=1, depth=2, calc_uvs=True,
+        matrix=mathutils.Matrix.Translation((0, 0, 0.442913 * scale_factor))
+        @ mathutils.Matrix.Diagonal((0.001524, 0.001524, 0.135, 1.0)),
+    )
+    mesh = _bmesh_to_new_mesh(bm, "HVE Arrow")
+    # Bake the stretch along Z (about the origin) straight into the mesh coordinates
+    mesh.transform(mathutils.Matrix.Scale(scale, 4, (0.0, 0.0, 1.0)))
+    return mesh
+
 
 def safe_name(name, max_length=63):
     """Ensure object name fits within Blender's limit of 63 characters."""
@@ -554,6 +1044,13 @@ def add_vehicle(context, vehicle_name, vehicles, scale_factor, numframes, name_m
         scale_factor_sub = scale_factor/100
     else: 
         scale_factor_sub = scale_factor/12
+    # HVE's Y and Z axes are flipped in Blender; negating the factor once scales
+    # and flips each column in a single pass
+    neg_scale_factor = -scale_factor
+    neg_scale_factor_sub = -scale_factor_sub
+    # Display sizes shared by several empties
+    tire_display_size = scale_factor*.002
+    pedal_display_size = scale_factor * 1.5
         
     wheelposX = [0,0]
     track = 0
@@ -562,13 +1059,11 @@ def add_vehicle(context, vehicle_name, vehicles, scale_factor, numframes, name_m
     event_collection_name = f"HVE: {filename}"
     event_collection = ensure_collection_exists(event_collection_name, bpy.context.scene.collection, hide = False, dont_render=False)
 
-    # Ensure the layer collection exists before setting it as active
-    layer_collection = None
-    for lc in bpy.context.view_layer.layer_collection.children:
-        if lc.name == event_collection.name:
-            layer_collection = lc
-            break
+    # Index the top-level layer collections once instead of scanning them per lookup
+    lc_index = {lc.name: lc for lc in bpy.context.view_layer.layer_collection.children}
 
+    # Ensure the layer collection exists before setting it as active
+    layer_collection = lc_index.get(event_collection.name)
     if layer_collection:
         bpy.context.view_layer.active_layer_collection = layer_collection
 
@@ -611,12 +1106,7 @@ def add_vehicle(context, vehicle_name, vehicles, scale_factor, numframes, name_m
 
     # Ensure the layer collection exists before setting it as active
     if create_skids:
-        layer_collection = None
-        for lc in bpy.context.view_layer.layer_collection.children:
-            if lc.name == overall_skids_collection.name:
-                layer_collection = lc
-                break
-
+        layer_collection = lc_index.get(overall_skids_collection.name)
         if layer_collection:
             bpy.context.view_layer.active_layer_collection = layer_collection
 
@@ -626,12 +1116,7 @@ def add_vehicle(context, vehicle_name, vehicles, scale_factor, numframes, name_m
     vehicle_collection = ensure_collection_exists(vehicle_collection_name, event_collection, hide = False, dont_render=False)
     
     # Ensure the layer collection exists before setting it as active
-    layer_collection = None
-    for lc in bpy.context.view_layer.layer_collection.children:
-        if lc.name == vehicle_collection.name:
-            layer_collection = lc
-            break
-
+    layer_collection = lc_index.get(vehicle_collection.name)
     if layer_collection:
         bpy.context.view_layer.active_layer_collection = layer_collection
 
@@ -661,42 +1146,61 @@ def add_vehicle(context, vehicle_name, vehicles, scale_factor, numframes, name_m
         ensure_collection_exists(skids_collection_name, vehicle_collection, hide = False, dont_render=False)
     
     
+    # Scene objects by name, snapshotted once and kept current as objects are
+    # created or removed below, instead of a scene lookup per created object.
+    existing_objects = {obj.name: obj for obj in bpy.context.scene.objects}
+    # Datablock collections used by the helpers below, resolved once per vehicle
+    data_objects = bpy.data.objects
+    data_meshes = bpy.data.meshes
+
+    def remove_obj(obj):
+        existing_objects.pop(obj.name, None)
+        data_objects.remove(obj, do_unlink=True)
+
     # Used to create objects, if they already exist, clear the animation data
-    def create_obj(name):
+    def create_obj(name, recreate=False):
+        """Return ``(obj, exists)`` for the empty called ``name``, creating it if needed.
+
+        With ``recreate`` an existing empty is reset in place to the state of a
+        new one (unparented, identity transform, no constraints or custom
+        properties) instead of being removed and created again.
+        """
         name = safe_name(name)
-        obj = bpy.context.scene.objects.get(name)
+        obj = existing_objects.get(name)
         exists = True
         if not obj:
-            obj = bpy.data.objects.new(name, None )
+            obj = data_objects.new(name, None )
             context.collection.objects.link(obj)
+            existing_objects[obj.name] = obj
             exists = False
-        obj.animation_data_clear()
+        else:
+            obj.animation_data_clear()
+            if recreate:
+                obj.constraints.clear()
+                obj.parent = None
+                obj.matrix_parent_inverse = mathutils.Matrix.Identity(4)
+                obj.rotation_mode = 'XYZ'
+                obj.matrix_world = mathutils.Matrix.Identity(4)
+                for prop_name in list(obj.keys()):
+                    del obj[prop_name]
         return obj, exists  
 
     def create_cube_obj(name):
         name = safe_name(name)
         # Create or retrieve the cube object
-        obj = bpy.context.scene.objects.get(name)
+        obj = existing_objects.get(name)
         if not obj:
-            bpy.ops.mesh.primitive_cube_add(
-                size=scale_factor, 
-                calc_uvs=True, 
-                enter_editmode=False, 
-                align='WORLD', 
-                location=(0, 0, 0), 
-                rotation=(0, 0, 0), 
-                scale=(2, 2, 2)
-                )
-            obj = bpy.context.active_object
-            obj.name = name
+            mesh = get_cached_mesh(("cube", scale_factor), lambda: build_cube_mesh(scale_factor))
+            obj = data_objects.new(name, mesh)
+            bpy.context.collection.objects.link(obj)
+            existing_objects[obj.name] = obj
+            obj.scale = (2, 2, 2)
             
             # Set properties
             obj.hide_render = True  # Optional: Hide from render
             obj.display_type = 'WIRE'  # Display as wireframe in the viewport
-            
-            
-            
-        obj.animation_data_clear()     
+        else:
+            obj.animation_data_clear()
 
         # Return the cylinder object
         return obj    
@@ -704,37 +1208,120 @@ def add_vehicle(context, vehicle_name, vehicles, scale_factor, numframes, name_m
     def create_cylinder_obj(name, location=(0, 0, 0), radius=1, depth=1):
         name = safe_name(name)
         # Create or retrieve the cylinder object
-        obj = bpy.context.scene.objects.get(name)
+        obj = existing_objects.get(name)
         exists = True
         if not obj:
             exists = False
-            bpy.ops.mesh.primitive_cylinder_add(
-                vertices=32,    # Number of sides
-                radius=radius,  # Radius of the base
-                depth=depth,    # Height of the cylinder
-                location=location
-            )
-            obj = bpy.context.active_object
-            obj.name = name
-            # Rotate the cylinder 90 degrees about the X-axis
-            obj.rotation_euler = (math.radians(90), 0, 0)  # Rotate 90 degrees on X
-
-            
-            # Apply the rotation to make it permanent (reset rotation)
-            bpy.context.view_layer.objects.active = obj  # Ensure the object is active
-            bpy.ops.object.transform_apply(location=False, rotation=True, scale=False)
+            # The shared mesh already lies along Y (rotated 90 degrees on X)
+            mesh = get_cached_mesh(("cylinder", radius, depth), lambda: build_cylinder_mesh(radius, depth))
+            obj = data_objects.new(name, mesh)
+            bpy.context.collection.objects.link(obj)
+            existing_objects[obj.name] = obj
+            obj.location = location
 
             # Set properties
             obj.display_type = 'WIRE'  # Display as wireframe in the viewport
-            
-            
-            
-        obj.animation_data_clear()     
+        else:
+            obj.animation_data_clear()
 
         # Return the cylinder object
         return obj , exists   
   
        
+    def keyframe_custom_properties(blender_obj, custom_properties):
+        """Key each per-frame custom property list on ``blender_obj`` in one bulk write.
+
+        The property is set to its last value first so the ID property exists
+        (and matches what per-frame ``keyframe_insert`` would leave behind).
+        Runs of identical values are keyed only at their first and last frame.
+        """
+        for prop_name, prop_values in custom_properties.items():
+            values = np.asarray(prop_values[:numframes], dtype=np.float64)
+            if not len(values):
+                continue
+            blender_obj[prop_name] = float(values[-1])
+            frames = run_boundary_indices(values)
+            fcurve = ensure_fcurve(blender_obj, f'["{prop_name}"]')
+            set_fcurve_keyframes(fcurve, frames, values[frames])
+
+    def variable_or_zeros(veh_obj_data, variable):
+        """Return the first ``numframes`` samples of ``variable``, or zeros when it was not exported."""
+        if variable in veh_obj_data:
+            return np.asarray(veh_obj_data[variable][:numframes], dtype=np.float64)
+        return np.zeros(numframes)
+
+    def keyframe_frame_range(blender_obj, data_path, channels, start=0, rest=None):
+        """Key ``data_path`` on ``blender_obj`` at frames ``start``..numframes-1 in one write per index.
+
+        ``channels`` holds one per-frame value array per array index (``None``
+        skips that index). When ``rest`` is given, each index also gets a key
+        at frame -1 with its rest value. An index whose value never changes
+        is keyed only at ``start``, which the F-Curve then holds.
+        """
+        frames = np.arange(start, numframes)
+        if rest is None and not len(frames):
+            return
+        if rest is None:
+            rest = (None,) * len(channels)
+        for index, (channel, rest_value) in enumerate(zip(channels, rest)):
+            if channel is None:
+                continue
+            index_frames = frames
+            index_values = np.asarray(channel[start:numframes], dtype=np.float64)
+            if len(index_values) > 1 and not np.ptp(index_values):
+                index_frames = index_frames[:1]
+                index_values = index_values[:1]
+            if rest_value is not None:
+                index_frames = np.concatenate(([-1], index_frames))
+                index_values = np.concatenate(([rest_value], index_values))
+            set_fcurve_keyframes(ensure_fcurve(blender_obj, data_path, index), index_frames, index_values)
+
+    def keyframe_from_rest(blender_obj, data_path, channels, rest=(0.0, 0.0, 0.0)):
+        """Key ``data_path`` on ``blender_obj`` at frame -1 with ``rest`` and at frames 0..numframes-1.
+
+        ``channels`` holds one per-frame value array per array index (``None``
+        skips that index); the rest key at frame -1 is what the old per-frame
+        loops inserted before frame 0.
+        """
+        keyframe_frame_range(blender_obj, data_path, channels, rest=rest)
+
+    def tire_force_scale_channels(tire_obj, veh_obj_data):
+        """Return the per-index scale arrays that show a tire's force components, or None.
+
+        Scale X, Y and Z carry the longitudinal, lateral (sign-flipped) and
+        normal forces. When any of them was exported every index is keyed, and
+        a missing component holds the tire's current scale, as keying the whole
+        scale vector per frame did.
+        """
+        forces = (
+            veh_obj_data.get("VehTireFLong"),
+            veh_obj_data["VehTireFLat"] * -1 if "VehTireFLat" in veh_obj_data else None,
+            veh_obj_data.get("VehTireFNorm"),
+        )
+        if all(force is None for force in forces):
+            return None
+        held = held_channels(tire_obj.scale)
+        return tuple(held_value if force is None else force for force, held_value in zip(forces, held))
+
+    def held_channels(values):
+        """Return per-index arrays holding each of ``values`` constant over every frame."""
+        return tuple(np.full(numframes, value, dtype=np.float64) for value in values)
+
+    def animate_arrowhead_from_vector(arrow_obj, vectors):
+        """Key ``arrow_obj`` to point along and stretch with an ``(numframes, 3)`` vector series.
+
+        The Z axis is aligned to each frame's direction through a quaternion
+        and scale[2] follows the magnitude. The arrow is parented to the CG
+        and rests flat with a length of 1 on frame -1.
+        """
+        magnitudes, unit_vectors = calculate_total_properties_vec(vectors)
+        arrow_obj.rotation_mode = 'QUATERNION'
+        keyframe_channels(arrow_obj, "rotation_quaternion", np.arange(numframes), track_quaternions(unit_vectors).T)
+        arrow_obj.parent = blender_CG_obj
+        arrow_obj.rotation_euler = (0,-math.pi/2,0)
+        arrow_obj.scale = (20, 20, 1)
+        keyframe_from_rest(arrow_obj, "scale", (None, None, magnitudes), rest=(1.0, 1.0, 1.0))
+
     # Used to create curve objects, if they already exist, clear the animation data
     def create_curve_obj(
         name: str,
@@ -746,7 +1333,7 @@ def add_vehicle(context, vehicle_name, vehicles, scale_factor, numframes, name_m
 
         Parameters:
             name (str): Name of the curve object.
-            points (list[tuple[float, float, float]]): List of (x, y, z) coordinates for the curve points.
+            points (list[tuple[float, float, float]]): (x, y, z) coordinates for the curve points, as a list or an (N, 3) array.
             bevel_depth (float): Thickness of the curve (default: 0.0).
             resolution (int): Resolution of the curve (default: 2).
             spline_type (str): Type of the curve ('POLY' or 'BEZIER', default: 'POLY').
@@ -758,7 +1345,7 @@ def add_vehicle(context, vehicle_name, vehicles, scale_factor, numframes, name_m
         """
         
         name = safe_name(name)
-        if not points:
+        if len(points) == 0:
             raise ValueError("Points list cannot be empty.")
             
         bevel_depth: float = 0.1*scale_factor      
@@ -769,13 +1356,14 @@ def add_vehicle(context, vehicle_name, vehicles, scale_factor, numframes, name_m
         if spline_type not in {'POLY', 'BEZIER'}:
             raise ValueError(f"Invalid spline type '{spline_type}'. Must be 'POLY' or 'BEZIER'.")
 
-        curve_object = bpy.context.scene.objects.get(name)
+        curve_object = existing_objects.get(name)
 
         if not curve_object:
             curve_data = bpy.data.curves.new(name=name, type='CURVE')
             curve_data.dimensions = dimensions
-            curve_object = bpy.data.objects.new(name, curve_data)
+            curve_object = data_objects.new(name, curve_data)
             bpy.context.collection.objects.link(curve_object)
+            existing_objects[curve_object.name] = curve_object
         else:
             curve_object.data.dimensions = dimensions
 
@@ -784,168 +1372,108 @@ def add_vehicle(context, vehicle_name, vehicles, scale_factor, numframes, name_m
         spline = curve_data.splines.new(type=spline_type)
 
         if spline_type == 'POLY':
-            spline.points.add(len(points) - 1)
-            for i, (x, y, z) in enumerate(points):
-                spline.points[i].co = (x, y, z, 1)
+            set_poly_spline_points(spline, points)
         elif spline_type == 'BEZIER':
-            spline.bezier_points.add(len(points) - 1)
-            for i, (x, y, z) in enumerate(points):
-                bez_point = spline.bezier_points[i]
-                bez_point.co = (x, y, z)
-                bez_point.handle_left = (x - 0.5, y, z)
-                bez_point.handle_right = (x + 0.5, y, z)
+            set_bezier_spline_points(spline, points)
 
         curve_data.bevel_depth = bevel_depth
         curve_data.resolution_u = resolution
 
         # Add custom properties to the curve object
         if custom_properties:
-            frame = -1
-            while frame < numframes-1:
-                frame = frame + 1
-                for prop_name, prop_value in custom_properties.items():
-                    curve_object[prop_name] = prop_value[frame]
-                    curve_object.keyframe_insert(data_path=f'["{prop_name}"]', frame=frame)
-                    
+            keyframe_custom_properties(curve_object, custom_properties)
+
         return curve_object
 
     def create_mesh_obj(
         name: str,
         points: list[tuple[float, float, float]],
-        custom_properties: dict[str, list] = None,    
+        custom_properties: dict[str, np.ndarray] = None,
     ) -> bpy.types.Object:
         """
         Create or update a mesh object in Blender, connecting successive points with edges.
 
         Parameters:
             name (str): Name of the mesh object.
-            points (list[tuple[float, float, float]]): List of (x, y, z) coordinates for the vertices.
-            custom_properties (dict[str, list]): Custom properties to assign to the mesh (optional).
-            numframes (int): Number of frames for animation (default: 1).
+            points (list[tuple[float, float, float]]): (x, y, z) coordinates for the vertices, as a list or an (N, 3) array.
+            custom_properties (dict[str, np.ndarray]): Per-point values stored as FLOAT point attributes (optional).
 
         Returns:
             bpy.types.Object: The created or updated mesh object.
         """
         name = safe_name(name)
-        if not points:
+        if len(points) == 0:
             raise ValueError("Points list cannot be empty.")
 
-        # Generate edges by connecting successive points
-        edges = [(i, i + 1) for i in range(len(points) - 1)]
-
         # Create or get the mesh object
-        mesh_data = bpy.data.meshes.get(name)
+        mesh_data = data_meshes.get(name)
         if not mesh_data:
-            mesh_data = bpy.data.meshes.new(name)
+            mesh_data = data_meshes.new(name)
         mesh_data.clear_geometry()
 
-        mesh_object = bpy.data.objects.get(name)
+        mesh_object = data_objects.get(name)
         if not mesh_object:
-            mesh_object = bpy.data.objects.new(name, mesh_data)
+            mesh_object = data_objects.new(name, mesh_data)
             bpy.context.collection.objects.link(mesh_object)
 
-        # Set vertices and edges
-        mesh_data.from_pydata(points, edges, [])
-        mesh_data.update()
+        # Set vertices and edges connecting successive points
+        set_polyline_geometry(mesh_data, points)
 
-        # Add custom properties and animate them
+        # Store custom properties as per-point attributes; the skid material reads
+        # them from the mesh, so they are not also keyed as object properties.
         if custom_properties:
-            frame = -1
-            while frame < numframes-1:
-                frame = frame + 1
-                for prop_name, prop_value in custom_properties.items():
-                    mesh_object[prop_name] = prop_value[frame]
-                    mesh_object.keyframe_insert(data_path=f'["{prop_name}"]', frame=frame)
-            
             for prop_name, prop_values in custom_properties.items():
                 if len(prop_values) != len(points):
                     raise ValueError(f"The number of values for '{prop_name}' must match the number of points.")
 
                 # Add the attribute if it doesn't exist
-                if prop_name not in mesh_data.attributes:
+                attr = mesh_data.attributes.get(prop_name)
+                if attr is None:
                     attr = mesh_data.attributes.new(prop_name, 'FLOAT', 'POINT')
-                else:
-                    attr = mesh_data.attributes[prop_name]
 
-                # Assign values to the attribute
-                for i, value in enumerate(prop_values):
-                    attr.data[i].value = value
-            
+                # Assign values to the attribute in one write
+                attr.data.foreach_set("value", np.asarray(prop_values, dtype=np.float32))
 
         return mesh_object
         
 
 
     def create_arrowhead(name, scale):
-        """Creates a scaled cone and cylinder, then joins them into one object.
+        """Creates an arrow object from a shared cone-and-cylinder mesh.
            If an object with the given name already exists, it returns that object instead of recreating it.
         """
         exists = True 
         name = safe_name(name)
         # Check if object already exists
-        if name in bpy.data.objects:
+        arrowhead = data_objects.get(name)
+        if arrowhead is not None:
             print(f"Object '{name}' already exists.")
-            return bpy.data.objects[name], exists
-        print(exists)
+            return arrowhead, exists
         exists = False
-        print(exists)
-        # Create a cone (Arrowhead)
-        bpy.ops.mesh.primitive_cone_add(radius1=1, depth=2, location=(0, 0, 0.875 * scale_factor))
-        cone = bpy.context.object
-        cone.name = "Scaled_Cone"
-        cone.scale = (0.010287, 0.010287, 0.0381)
-
-        # Create a cylinder (Arrow Shaft)
-        bpy.ops.mesh.primitive_cylinder_add(radius=1, depth=2, location=(0, 0, 0.442913   * scale_factor))
-        cylinder = bpy.context.object
-        cylinder.name = "Cylinder"
-        cylinder.scale = (0.001524, 0.001524, 0.135)
-
-        # Select both objects and join them
-        bpy.ops.object.select_all(action='DESELECT')
-        cone.select_set(True)
-        cylinder.select_set(True)
-        bpy.context.view_layer.objects.active = cone
-        bpy.ops.object.join()
-
-        # Rename the merged object
-        arrowhead = bpy.context.object
-        arrowhead.name = name
-
-        # Move the 3D cursor to (0,0,0)
-        bpy.context.scene.cursor.location = (0, 0, 0)
-
-        # Set the object's origin to the 3D cursor
-        bpy.ops.object.origin_set(type='ORIGIN_CURSOR')
-            
-        bpy.context.scene.cursor.location = (0.0, 0.0, 0.0)
-     
-        bpy.ops.object.mode_set(mode='EDIT')
-        bpy.ops.mesh.select_all(action='SELECT')
-        # Change pivot point to 3D Cursor
-        bpy.context.tool_settings.transform_pivot_point = 'CURSOR'
 
+        # All arrows of the same length share one mesh (linked duplicates)
+        mesh = get_cached_mesh(("arrow", scale, scale_factor), lambda: build_arrow_mesh(scale, scale_factor))
+        arrowhead = data_objects.new(name, mesh)
+        bpy.context.collection.objects.link(arrowhead)
 
-        bpy.ops.transform.resize(value=(1.0, 1.0, scale))        
-        bpy.ops.object.mode_set(mode='OBJECT')   
-        
-        bpy.ops.object.transform_apply(scale=True)
-        
-        return bpy.context.object, exists    # Return the final merged object
+        return arrowhead, exists    # Return the final merged object
   
         
     #Create Camera
     def create_camera_obj(name):
     #Create Camera
         name = safe_name(name)
-        cam_object = bpy.context.scene.objects.get(name)
+        cam_object = existing_objects.get(name)
         if not cam_object:
-            cam = bpy.ops.object.camera_add(align='WORLD', enter_editmode=False, location=(0, 0, 0), rotation=(math.pi/2-.2, -0, math.pi/2))
-            bpy.context.object.data.clip_end = 500
-            cam_object = bpy.context.active_object
+            # Build the camera from data rather than through an operator, which
+            # would trigger a scene update and change the selection
+            cam_data = bpy.data.cameras.new(name)
+            cam_data.clip_end = 500
+            cam_object = data_objects.new(name, cam_data)
+            bpy.context.collection.objects.link(cam_object)
+            existing_objects[cam_object.name] = cam_object
             cam_object.location = (20,0,3)
-            cam_object.name = name
-            cam_object.data.name = name
+            cam_object.rotation_euler = (math.pi/2-.2, -0, math.pi/2)
             cam_object.parent = blender_CG_obj
             # Return the camera
         return cam_object
@@ -966,70 +1494,12 @@ def add_vehicle(context, vehicle_name, vehicles, scale_factor, numframes, name_m
         """
 
         # Check for existing Geometry Nodes modifier
-        existing_modifier = None
-        for mod in blender_obj.modifiers:
-            if mod.type == 'NODES' and mod.name == "GeometryNodes":
-                existing_modifier = mod
-                break
+        existing_modifier = get_geometry_nodes_modifier(blender_obj)
 
         # If no modifier exists, create a new one
         if existing_modifier is None:
             geo_modifier = blender_obj.modifiers.new(name="GeometryNodes", type='NODES')
-
-            # Check if the node group already exists
-            node_group = bpy.data.node_groups.get(node_group_name)
-
-            if node_group is None:
-                node_group = bpy.data.node_groups.new(name=node_group_name, type='GeometryNodeTree')
-                node_group.use_fake_user = True  # Prevent Blender from deleting it
-                node_group.is_modifier = True
-
-                # Add input and output nodes
-                input_node = node_group.nodes.new(type='NodeGroupInput')
-                output_node = node_group.nodes.new(type='NodeGroupOutput')
-
-                node_group.interface.new_socket("Geometry", in_out='INPUT', socket_type='NodeSocketGeometry')
-                node_group.interface.new_socket("Geometry", in_out='OUTPUT', socket_type='NodeSocketGeometry')
-
-                # Position nodes
-                input_node.location = (-200, 0)
-                output_node.location = (200, 0)
-
-                # Create a Set Material Node
-                set_material_node = node_group.nodes.new(type='GeometryNodeSetMaterial')
-                set_material_node.location = (200, -400)
-
-                # Create or get the material
-                material_name = node_group_name  # Use node group name as material name
-                material = bpy.data.materials.get(material_name)
-                if material is None:
-                    material = bpy.data.materials.new(name=material_name)
-                    material.use_nodes = True
-                    material_tree = material.node_tree
-
-                    # Clear any existing nodes
-                    material_tree.nodes.clear()
-
-                    # Create a Principled BSDF Node
-                    principled_bsdf_node = material_tree.nodes.new(type='ShaderNodeBsdfPrincipled')
-                    principled_bsdf_node.location = (-200, -400)
-                    principled_bsdf_node.inputs["Base Color"].default_value = base_color  # Set color
-
-                    # Create a Material Output Node
-                    material_output_node = material_tree.nodes.new(type='ShaderNodeOutputMaterial')
-                    material_output_node.location = (0, -400)
-
-                    # Connect shader nodes in the material node tree
-                    material_tree.links.new(principled_bsdf_node.outputs["BSDF"], material_output_node.inputs["Surface"])
-
-                # Assign the material to Set Material node
-                set_material_node.inputs["Material"].default_value = material
-
-                # Connect nodes
-                node_group.links.new(input_node.outputs["Geometry"], set_material_node.inputs["Geometry"])
-                node_group.links.new(set_material_node.outputs["Geometry"], output_node.inputs["Geometry"])
-
-            geo_modifier.node_group = node_group
+            geo_modifier.node_group = ensure_material_node_group(node_group_name, base_color)
             print(f"Added new Geometry Nodes modifier with node group '{node_group_name}'.")
         else:
             geo_modifier = existing_modifier
@@ -1044,7 +1514,8 @@ def add_vehicle(context, vehicle_name, vehicles, scale_factor, numframes, name_m
             print("Object is None.")
             return False
         
-        return property_name in obj.keys()
+        # ID properties support membership directly, without building a keys view
+        return property_name in obj
     # Create CG object - will be the parent object
     blender_CG_obj, exists = create_obj(f"CG: {vehicle_name}: {filename}")
     blender_CG_obj.empty_display_type = 'SPHERE'    
@@ -1056,7 +1527,7 @@ def add_vehicle(context, vehicle_name, vehicles, scale_factor, numframes, name_m
     assign_objects_to_subcollection(extras_collection_name, vehicle_collection, blender_body_obj)
     
     def create_custom_properties(blender_obj,veh_obj_data,custprops_exclude):
-        for obj_variable in veh_obj_data.keys():
+        for obj_variable in veh_obj_data:
             if obj_variable in name_mapping:
                 obj_variable_trans = name_mapping[obj_variable]
             else:
@@ -1067,16 +1538,22 @@ def add_vehicle(context, vehicle_name, vehicles, scale_factor, numframes, name_m
 
                     # get or create the UI object for the property
                     ui = blender_obj.id_properties_ui(obj_variable_trans)
-                    ui.update(description = obj_variable_trans)
-                    ui.update(default = 1.0)
-                    ui.update(min=-1000000.0, soft_min=-1000000.0)
-                    ui.update(max=1000000.0, soft_max=1000000.0)
+                    ui.update(
+                        description=obj_variable_trans,
+                        default=1.0,
+                        min=-1000000.0, soft_min=-1000000.0,
+                        max=1000000.0, soft_max=1000000.0,
+                    )
                 #create_custom_property(blender_obj,obj_variable)
-                frame = -1
-                while frame < numframes-1:
-                    frame = frame + 1
-                    blender_obj[obj_variable_trans] = veh_obj_data[obj_variable][frame]
-                    blender_obj.keyframe_insert(data_path=f'["{obj_variable_trans}"]', frame=frame)
+                values = np.asarray(veh_obj_data[obj_variable][:numframes], dtype=np.float64)
+                if not len(values):
+                    continue
+                # Leave the property at its last value, as per-frame keying did, then key
+                # only the ends of each constant run, so a constant channel gets two keys
+                blender_obj[obj_variable_trans] = float(values[-1])
+                frames = run_boundary_indices(values)
+                fcurve = ensure_fcurve(blender_obj, f'["{obj_variable_trans}"]')
+                set_fcurve_keyframes(fcurve, frames, values[frames])
                     
     def create_full_vehicle_data(
         name: str,
@@ -1101,83 +1578,55 @@ def add_vehicle(context, vehicle_name, vehicles, scale_factor, numframes, name_m
             print("No vehicle data provided.")
             return None
 
-        # Prepare lists for points and attributes
-        points = []
-        attributes = {}  # Dictionary to store translated attributes
-        for frame in range(numframes):
-            x = 0
-            y = 0
-            z = 0
-            points.append((x, y, z))
-
-            # Store attribute values with translated names
-            for section_name, section_data in vehicle_data.items():
-                for key, values in section_data.items():
-                    translated_key = name_mapping.get(key, key)  # Use translated name if available
-                    translated_section_name = name_mapping.get(section_name, section_name)  # Use translated name if available
-                    group_name = name_mapping.get(f"group_name {section_name}", f"group_name {section_name}")  # Use translated name if available
-                    
-                    full_key = f"{group_name}: {translated_section_name}: {translated_key}"
-                    if group_name == translated_section_name:
-                        full_key = f"{translated_section_name}: {translated_key}"         
-
-
-                    if full_key not in attributes:
-                        attributes[full_key] = []
-                    # Ensure only numframes values are stored
-                    attributes[full_key] = values[:numframes]  # Direct assignment prevents extra appends
-
-
-        # Generate edges connecting successive points
-        edges = [(i, i + 1) for i in range(len(points) - 1)]
+        # Every sample sits at the origin; the data lives in the point attributes
+        points = np.zeros((numframes, 3))
 
         # Create or get the mesh data
-        mesh_data = bpy.data.meshes.get(name)
+        mesh_data = data_meshes.get(name)
         if not mesh_data:
-            mesh_data = bpy.data.meshes.new(name=name)
+            mesh_data = data_meshes.new(name=name)
         mesh_data.clear_geometry()
 
         # Create or get the mesh object
-        mesh_object = bpy.data.objects.get(name)
+        mesh_object = data_objects.get(name)
         if not mesh_object:
-            mesh_object = bpy.data.objects.new(name, mesh_data)
+            mesh_object = data_objects.new(name, mesh_data)
             bpy.context.collection.objects.link(mesh_object)
 
-        # Set vertices and edges
-        mesh_data.from_pydata(points, edges, [])
-        mesh_data.update()
-
-        # Add translated attributes to the mesh
-        for attr_name, attr_values in attributes.items():
-            if len(attr_values) != len(points):
-                print(f"Skipping {attr_name} (mismatched data length)")
-               
-                continue
-
-            # Create or get the attribute
-            if attr_name not in mesh_data.attributes:
-                attr = mesh_data.attributes.new(attr_name, 'FLOAT', 'POINT')
+        # Set vertices and edges connecting successive points
+        set_polyline_geometry(mesh_data, points)
+
+        # Translated names depend only on the section and key, so resolve them
+        # once per column rather than once per frame. Each column is written
+        # straight into its mesh attribute, without collecting them first.
+        for section_name, section_data in vehicle_data.items():
+            translated_section_name = name_mapping.get(section_name, section_name)  # Use translated name if available
+            group_key = f"group_name {section_name}"
+            group_name = name_mapping.get(group_key, group_key)  # Use translated name if available
+            # The group/section part of the attribute name is shared by every key in the section
+            if group_name == translated_section_name:
+                prefix = f"{translated_section_name}: "
             else:
-                attr = mesh_data.attributes[attr_name]
+                prefix = f"{group_name}: {translated_section_name}: "
+            for key, values in section_data.items():
+                attr_name = prefix + name_mapping.get(key, key)
+                if len(values) < numframes:
+                    print(f"Skipping {attr_name} (mismatched data length)")
+                    continue
+
+                # Create or get the attribute
+                if attr_name not in mesh_data.attributes:
+                    attr = mesh_data.attributes.new(attr_name, 'FLOAT', 'POINT')
+                else:
+                    attr = mesh_data.attributes[attr_name]
 
-            # Assign attribute values
-            for i, value in enumerate(attr_values):
-                attr.data[i].value = value
+                # Assign only numframes values, converting the column view once
+                attr.data.foreach_set("value", np.asarray(values[:numframes], dtype=np.float32))
 
         return mesh_object
     
     
     
-    # Function to remove an object from all collections before reassigning
-    def remove_from_all_collections(obj):
-        """Remove an object from all Blender collections before reassigning it."""
-        for collection in list(obj.users_collection):
-            collection.objects.unlink(obj)
-
-        active_root = bpy.context.scene.collection
-        if obj.name in active_root.objects:
-            active_root.objects.unlink(obj)
-
     # Get all vehicle data (not just kinematic)
     vehicle_data = vehicles[vehicle_name]  # Now includes everything
     numframes = len(vehicle_data["KinematicOut"]["VehKinematicX"])  # Get frame count
@@ -1193,6 +1642,11 @@ def add_vehicle(context, vehicle_name, vehicles, scale_factor, numframes, name_m
     assign_objects_to_subcollection(extras_collection_name, vehicle_collection, vehicle_data)  
     assign_objects_to_collection(overall_vehicle_data_collection_name, vehicle_data) 
     
+    # The tires and accelerometers read the CG's frame 0 transform. Copying the
+    # CG's posed basis into its world matrix once after it is keyed serves all
+    # of them, without a frame_set evaluating the whole scene.
+    cg_at_frame_zero = False
+
     # Process each object in the vehicle dictionary:
     for veh_obj_name in vehicles[vehicle_name].keys():
         veh_obj_data = vehicles[vehicle_name][veh_obj_name]
@@ -1200,51 +1654,37 @@ def add_vehicle(context, vehicle_name, vehicles, scale_factor, numframes, name_m
             obj_name = name_mapping[veh_obj_name]
         else:
             obj_name = veh_obj_name
-        frame = -1
         if veh_obj_name=='KinematicOut':
             blender_obj = blender_CG_obj
             custprops_exclude = [''] #['X','Y','Z','Roll','Pitch','Yaw']
             blender_CG_obj.location = (0,0,0)
             blender_CG_obj.rotation_euler = (0,0,0)
-            blender_CG_obj.keyframe_insert(data_path ='location', frame = frame)
-            blender_CG_obj.keyframe_insert(data_path = 'rotation_euler', frame = frame)
-
-            while frame < numframes-1:
-                frame = frame + 1
-                locationx=veh_obj_data['VehKinematicX'][frame]*scale_factor
-                locationy=veh_obj_data['VehKinematicY'][frame]*-1*scale_factor
-                locationz=veh_obj_data['VehKinematicZ'][frame]*-1*scale_factor
-                blender_CG_obj.location = (locationx, locationy, locationz)
-                blender_CG_obj.rotation_euler = (veh_obj_data['VehKinematicRoll'][frame]*deg2rad, veh_obj_data['VehKinematicPitch'][frame]*-1*deg2rad, veh_obj_data['VehKinematicYaw'][frame]*-1*deg2rad)
-                blender_CG_obj.keyframe_insert(data_path="location", frame=frame)
-                blender_CG_obj.keyframe_insert(data_path="rotation_euler", frame=frame)
+            # Scale the CG motion once for the whole run
+            kinematic_x = veh_obj_data['VehKinematicX'][:numframes]*scale_factor
+            kinematic_y = veh_obj_data['VehKinematicY'][:numframes]*neg_scale_factor
+            kinematic_z = veh_obj_data['VehKinematicZ'][:numframes]*neg_scale_factor
+            kinematic_roll = veh_obj_data['VehKinematicRoll'][:numframes]*deg2rad
+            kinematic_pitch = veh_obj_data['VehKinematicPitch'][:numframes]*deg2rad
+            kinematic_yaw = veh_obj_data['VehKinematicYaw'][:numframes]*deg2rad
+            # Key the rest pose at frame -1 and every sample, one bulk write per channel
+            keyframe_from_rest(blender_CG_obj, "location", (kinematic_x, kinematic_y, kinematic_z))
+            keyframe_from_rest(blender_CG_obj, "rotation_euler", (kinematic_roll, -kinematic_pitch, -kinematic_yaw))
+            # Pose the CG as its animation evaluates on frame 0
+            blender_CG_obj.location = (kinematic_x[0], kinematic_y[0], kinematic_z[0])
+            blender_CG_obj.rotation_euler = (kinematic_roll[0], -kinematic_pitch[0], -kinematic_yaw[0])
+            cg_at_frame_zero = False
             create_custom_properties(blender_obj,veh_obj_data,custprops_exclude)
             
-            # Define the points of the spline
-            points = []
-            # Custom  properties                       
+            # The spline and its custom properties reuse the scaled CG arrays
+            points = np.column_stack((kinematic_x, kinematic_y, kinematic_z))
             custom_properties = {
-                "X": [],
-                "Y": [],
-                "Z": [],
-                "Roll": [],
-                "Pitch": [],
-                "Yaw": [],
+                "X": kinematic_x,
+                "Y": kinematic_y,
+                "Z": kinematic_z,
+                "Roll": kinematic_roll,
+                "Pitch": kinematic_pitch,
+                "Yaw": kinematic_yaw,
             }
-            frame = -1
-            while frame < numframes-1:
-                frame = frame+1
-                locationx=veh_obj_data['VehKinematicX'][frame]*scale_factor
-                locationy=veh_obj_data['VehKinematicY'][frame]*-1*scale_factor
-                locationz=veh_obj_data['VehKinematicZ'][frame]*-1*scale_factor
-                points.append((locationx, locationy, locationz))
-                # Adding data to the dictionary
-                custom_properties["X"].append(locationx)   
-                custom_properties["Y"].append(locationy)             
-                custom_properties["Z"].append(locationz)
-                custom_properties["Roll"].append(veh_obj_data['VehKinematicRoll'][frame]*deg2rad)   
-                custom_properties["Pitch"].append(veh_obj_data['VehKinematicPitch'][frame]*deg2rad)             
-                custom_properties["Yaw"].append(veh_obj_data['VehKinematicYaw'][frame]*deg2rad)                
             # Create a new object with the curve data
             
             if create_paths:
@@ -1253,73 +1693,12 @@ def add_vehicle(context, vehicle_name, vehicles, scale_factor, numframes, name_m
                 assign_objects_to_subcollection(paths_collection_name, vehicle_collection, cg_curve_object)
                 assign_objects_to_collection(overall_paths_collection_name, cg_curve_object)
        
-                existing_modifier = None
-                for mod in cg_curve_object.modifiers:
-                    if mod.type == 'NODES' and mod.name == "GeometryNodes":
-                        existing_modifier = mod
-                        break
+                existing_modifier = get_geometry_nodes_modifier(cg_curve_object)
 
-                # If no modifier exists, create a new one
+                # If no modifier exists, create a new one sharing the CGPaths group
                 if existing_modifier is None:
-                    # Add a Geometry Nodes modifier
                     geo_modifier = cg_curve_object.modifiers.new(name="GeometryNodes", type='NODES')
-              
-                    # Check if the node group already exists
-                    node_group = bpy.data.node_groups.get("CGPaths")
-                              
-                    if node_group is None:
-                        node_group = bpy.data.node_groups.new(name="CGPaths", type='GeometryNodeTree')
-                        node_group.use_fake_user = True  # Prevent Blender from deleting it
-                        node_group.is_modifier = True
-                        # Add input and output nodes
-                        input_node = node_group.nodes.new(type='NodeGroupInput')
-                        output_node = node_group.nodes.new(type='NodeGroupOutput')
-                    
-                        node_group.interface.new_socket("Geometry", in_out='INPUT', socket_type='NodeSocketGeometry')
-                        node_group.interface.new_socket("Geometry", in_out='OUTPUT', socket_type='NodeSocketGeometry')
-                    
-                        # Position nodes
-                        input_node.location = (-200, 0)
-                        output_node.location = (200, 0)
-                   
-                    
-                        # Create a Set Material Node
-                        set_material_node = node_group.nodes.new(type='GeometryNodeSetMaterial')
-                        set_material_node.location = (200, -400)
-
-                        # Create or get the material
-                        material_name = "CGPaths"
-                        material = bpy.data.materials.get(material_name)
-                        if material is None:
-                            material = bpy.data.materials.new(name=material_name)
-                           # Ensure the material uses nodes
-                            material.use_nodes = True
-                            material_tree = material.node_tree
-
-                            # Clear any existing nodes
-                            material_tree.nodes.clear()
-
-                            # Create a Principled BSDF Node
-                            principled_bsdf_node = material_tree.nodes.new(type='ShaderNodeBsdfPrincipled')
-                            principled_bsdf_node.location = (-200, -400)
-                            principled_bsdf_node.inputs["Base Color"].default_value = (1,1,0,1)
-
-                            # Create a Material Output Node
-                            material_output_node = material_tree.nodes.new(type='ShaderNodeOutputMaterial')
-                            material_output_node.location = (0, -400)
-
-                            # Connect shader nodes in the material node tree
-                            material_tree.links.new(principled_bsdf_node.outputs["BSDF"], material_output_node.inputs["Surface"])
-
-                        # Assign the material to Set Material node
-                        set_material_node.inputs["Material"].default_value = material
-                     
-                    
-                        # Connect nodes
-                        node_group.links.new(input_node.outputs["Geometry"], set_material_node.inputs["Geometry"])
-                        node_group.links.new(set_material_node.outputs["Geometry"], output_node.inputs["Geometry"])
-                
-                    geo_modifier.node_group = node_group
+                    geo_modifier.node_group = ensure_material_node_group("CGPaths", (1, 1, 0, 1))
                 else:
                     geo_modifier = existing_modifier
                     print("Using existing Geometry Nodes modifier.")
@@ -1338,93 +1717,42 @@ def add_vehicle(context, vehicle_name, vehicles, scale_factor, numframes, name_m
             create_custom_properties(blender_obj,veh_obj_data,custprops_exclude)                   
 
         #Force Vector
-        if create_forces and 'VehKineticFxImpact' in veh_obj_data.keys() and 'VehKineticFyImpact' in veh_obj_data.keys() and 'VehKineticFzImpact' in veh_obj_data.keys():
+        if create_forces and 'VehKineticFxImpact' in veh_obj_data and 'VehKineticFyImpact' in veh_obj_data and 'VehKineticFzImpact' in veh_obj_data:
             blender_obj, exists = create_arrowhead(f"Force: Impact: {vehicle_name}: {filename}", .001)
             #blender_obj.location = (0, 0, 0)
-            frame = -1            
-            while frame < numframes-1:
-                frame = frame+1
-                # Extract x, y, z components from veh_obj_data
-                x = veh_obj_data["VehKineticFxImpact"][frame]
-                y = veh_obj_data["VehKineticFyImpact"][frame] * -1
-                z = veh_obj_data["VehKineticFzImpact"][frame] * -1
-                
-                # Calculate force properties
-                magnitude, unit_vector = calculate_total_properties(x, y, z)
-                
-                # Use unit vector to define rotation direction
-                direction = mathutils.Vector(unit_vector)
-                
-                # Align the object to the force direction
-                rotation_quaternion = direction.to_track_quat('Z', 'Y')  # Align Z-axis to force
-                
-                # Apply properties to Blender object
-                blender_obj.rotation_mode = 'QUATERNION'
-                blender_obj.rotation_quaternion = rotation_quaternion
-                blender_obj.keyframe_insert(data_path="rotation_quaternion", frame=frame)
-                
-                blender_obj.scale = (1, 1, magnitude)
-                blender_obj.keyframe_insert(data_path="scale",index=2, frame=frame)
-            blender_obj.parent = blender_CG_obj
-            blender_obj.rotation_euler = (0,-math.pi/2,0)
-            blender_obj.keyframe_insert(data_path="rotation_euler", frame=-1)
-            blender_obj.scale = (20,20, 1)
-            blender_obj.keyframe_insert(data_path="scale",index=2, frame=-1)            
+            animate_arrowhead_from_vector(blender_obj, np.column_stack((
+                veh_obj_data["VehKineticFxImpact"][:numframes],
+                veh_obj_data["VehKineticFyImpact"][:numframes] * -1,
+                veh_obj_data["VehKineticFzImpact"][:numframes] * -1,
+            )))
             assign_objects_to_subcollection(extras_collection_name, vehicle_collection, blender_obj)      
             assign_objects_to_collection(overall_force_collection_name, blender_obj)     
 
             add_or_get_geometry_nodes_modifier(blender_obj, node_group_name="ForceVectors", base_color=(0 , 0, 1, 1))
 
         #Velocity Vectors
-        if create_velocities and 'VehKinematicVTotal' in veh_obj_data.keys()  :
+        if create_velocities and 'VehKinematicVTotal' in veh_obj_data  :
             blender_obj, exists = create_arrowhead(f"Velocity: {vehicle_name}: {filename}", 1)
-            frame = -1
-            while frame < numframes-1:
-                frame = frame+1
-                # Order needs to be YXZ
-                blender_obj.rotation_mode = 'YXZ'
-                # Extract velocity components
-                if 'VehKinematicVLong' in veh_obj_data.keys():
-                    v_long = veh_obj_data['VehKinematicVLong'][frame]
-                else: 
-                    v_long = 0
-                if  'VehKinematicVSide' in veh_obj_data.keys():
-                    v_side = veh_obj_data['VehKinematicVSide'][frame]
-                else:
-                    v_side = 0
-                if  'VehKinematicVNormal' in veh_obj_data.keys():
-                    v_normal = veh_obj_data['VehKinematicVNormal'][frame]
-                else:
-                    v_normal = 0
-                
-                if  'VehKinematicSideslip' in veh_obj_data.keys():
-                    sideslip = veh_obj_data['VehKinematicSideslip'][frame]*deg2rad 
-
-                elif v_long == 0:
-                    sideslip = 0
-                else:    
-                    sideslip = math.atan2(v_side , v_long) 
-                    
-                
-                # Compute the denominator safely
-                denominator = math.sqrt(v_long**2 + v_side**2)
-
-                # Prevent division by zero
-                if denominator == 0:
-                    angle = 0  # Default angle when denominator is zero
-                else:
-                    angle = math.atan2(v_normal , denominator)
-
-                # Apply rotation
-                blender_obj.rotation_euler = (0, math.pi/2 + angle, sideslip * -1)
-                blender_obj.keyframe_insert(data_path="rotation_euler", frame=frame)
-                blender_obj.scale = (1,1,veh_obj_data['VehKinematicVTotal'][frame])
-                blender_obj.keyframe_insert(data_path="scale",index=2, frame=frame)
+            # Extract velocity components (missing ones stay zero)
+            v_long = variable_or_zeros(veh_obj_data, 'VehKinematicVLong')
+            v_side = variable_or_zeros(veh_obj_data, 'VehKinematicVSide')
+            v_normal = variable_or_zeros(veh_obj_data, 'VehKinematicVNormal')
+            if 'VehKinematicSideslip' in veh_obj_data:
+                sideslip = variable_or_zeros(veh_obj_data, 'VehKinematicSideslip')*deg2rad
+            else:
+                sideslip = np.where(v_long == 0, 0.0, np.arctan2(v_side, v_long))
+            # Elevation angle, zero where the planar speed is zero
+            denominator = np.hypot(v_long, v_side)
+            angle = np.where(denominator == 0, 0.0, np.arctan2(v_normal, denominator))
+            v_total = variable_or_zeros(veh_obj_data, 'VehKinematicVTotal')
+            # Order needs to be YXZ
+            blender_obj.rotation_mode = 'YXZ'
+            # Key the rotation and length for every frame, resting flat with a length of 1 on frame -1
+            keyframe_from_rest(blender_obj, "rotation_euler", (np.zeros(numframes), math.pi/2 + angle, sideslip * -1))
+            keyframe_from_rest(blender_obj, "scale", (None, None, v_total), rest=(1.0, 1.0, 1.0))
             blender_obj.parent = blender_CG_obj
             blender_obj.rotation_euler = (0,0,0)
-            blender_obj.keyframe_insert(data_path="rotation_euler", frame=-1)
             blender_obj.scale = (20, 20, 1)
-            blender_obj.keyframe_insert(data_path="scale", index=2,frame=-1)
             assign_objects_to_subcollection(extras_collection_name, vehicle_collection, blender_obj)  
             assign_objects_to_collection(overall_velocity_collection_name, blender_obj)     
 
@@ -1435,84 +1763,28 @@ def add_vehicle(context, vehicle_name, vehicles, scale_factor, numframes, name_m
             blender_obj, exists = create_obj(f"Velocity Components: {vehicle_name}: {filename}")
             blender_obj.empty_display_type = 'ARROWS'    
             blender_obj.empty_display_size = scale_factor
-            frame = -1
-            while frame < numframes-1:
-                frame = frame+1
-                # Order needs to be YXZ
-                blender_obj.rotation_mode = 'YXZ'
-                # Extract velocity components
-                if 'VehKinematicVLong' in veh_obj_data.keys():
-                    v_long = veh_obj_data['VehKinematicVLong'][frame]
-                else: 
-                    v_long = 0
-                if  'VehKinematicVSide' in veh_obj_data.keys():
-                    v_side = veh_obj_data['VehKinematicVSide'][frame]
-                else:
-                    v_side = 0
-                if  'VehKinematicVNormal' in veh_obj_data.keys():
-                    v_normal = veh_obj_data['VehKinematicVNormal'][frame]
-                else:
-                    v_normal = 0
-                blender_obj.keyframe_insert(data_path="rotation_euler", frame=frame)
-                blender_obj.scale = (v_long,-1*v_side,-1*v_normal)
-                blender_obj.keyframe_insert(data_path="scale", frame=frame)
+            # Order needs to be YXZ
+            blender_obj.rotation_mode = 'YXZ'
+            # The rotation is held at its current value; the scale carries the components
+            keyframe_from_rest(blender_obj, "rotation_euler", held_channels(blender_obj.rotation_euler))
+            keyframe_from_rest(blender_obj, "scale", (v_long, -1*v_side, -1*v_normal), rest=(1.0, 1.0, 1.0))
             blender_obj.parent = blender_CG_obj
 
             blender_obj.rotation_euler = (0,0,0)
-            blender_obj.keyframe_insert(data_path="rotation_euler", frame=-1)
             blender_obj.scale = (1, 1, 1)
-            blender_obj.keyframe_insert(data_path="scale", frame=-1)
             assign_objects_to_subcollection(extras_collection_name, vehicle_collection, blender_obj)
             assign_objects_to_collection(overall_velocity_collection_name, blender_obj)
 
         #Acceleration Vectors
-        if create_accelerations and 'VehKinematicAccTotal' in veh_obj_data.keys()  :
+        if create_accelerations and 'VehKinematicAccTotal' in veh_obj_data  :
             blender_obj, exists = create_arrowhead(f"Acceleration: {vehicle_name}: {filename}", 7)
-            frame = -1
-            while frame < numframes-1:
-                frame = frame+1
-                # Order needs to be YXZ
-                blender_obj.rotation_mode = 'YXZ'
-                # Extract acceleration components
-                if 'VehKinematicAccFwd' in veh_obj_data.keys():
-                    acc_long = veh_obj_data['VehKinematicAccFwd'][frame]
-                else: 
-                    acc_long = 0
-                if  'VehKinematicAccLat' in veh_obj_data.keys():
-                    acc_side = veh_obj_data['VehKinematicAccLat'][frame]*-1
-                else:
-                    acc_side = 0
-                if  'VehKinematicAccTangent' in veh_obj_data.keys():
-                    acc_normal = veh_obj_data['VehKinematicAccTangent'][frame]*-1
-                else:
-                    acc_normal = 0
-                
-                if  acc_long == 0:
-                    sideslip = 0
-                else:    
-                    sideslip = math.atan2(acc_side , acc_long) 
-                    
-                # Calculate acc properties
-                magnitude, unit_vector = calculate_total_properties(acc_long, acc_side, acc_normal)
-                # Use unit vector to define rotation direction
-                direction = mathutils.Vector(unit_vector)
-                # Align the object to the force direction
-                rotation_quaternion = direction.to_track_quat('Z', 'Y')  # Align Z-axis to acc
-                
-                
-                # Apply properties to Blender object
-                blender_obj.rotation_mode = 'QUATERNION'
-                blender_obj.rotation_quaternion = rotation_quaternion
-                blender_obj.keyframe_insert(data_path="rotation_quaternion", frame=frame)
-                
-                blender_obj.scale = (1, 1, magnitude)
-                blender_obj.keyframe_insert(data_path="scale",index=2, frame=frame)
-            
-            blender_obj.parent = blender_CG_obj
-            blender_obj.rotation_euler = (0,-math.pi/2,0)
-            blender_obj.keyframe_insert(data_path="rotation_euler", frame=-1)
-            blender_obj.scale = (20, 20, 1)
-            blender_obj.keyframe_insert(data_path="scale", index=2,frame=-1)
+            # Extract acceleration components (missing ones stay zero)
+            acc_components = np.column_stack((
+                variable_or_zeros(veh_obj_data, 'VehKinematicAccFwd'),
+                variable_or_zeros(veh_obj_data, 'VehKinematicAccLat') * -1,
+                variable_or_zeros(veh_obj_data, 'VehKinematicAccTangent') * -1,
+            ))
+            animate_arrowhead_from_vector(blender_obj, acc_components)
             assign_objects_to_subcollection(extras_collection_name, vehicle_collection, blender_obj) 
             assign_objects_to_collection(overall_acceleration_collection_name, blender_obj)     
 
@@ -1523,45 +1795,30 @@ def add_vehicle(context, vehicle_name, vehicles, scale_factor, numframes, name_m
             blender_obj, exists = create_obj(f"Acceleration Components: {vehicle_name}: {filename}")
             blender_obj.empty_display_type = 'ARROWS'    
             blender_obj.empty_display_size = scale_factor*1
-            frame = -1
-            while frame < numframes-1:
-                frame = frame+1
-                # Order needs to be YXZ
-                blender_obj.rotation_mode = 'YXZ'
-                # Extract acceleration components
-                if 'VehKinematicAccFwd' in veh_obj_data.keys():
-                    acc_long = veh_obj_data['VehKinematicAccFwd'][frame]
-                else: 
-                    acc_long = 0
-                if  'VehKinematicAccLat' in veh_obj_data.keys():
-                    acc_side = veh_obj_data['VehKinematicAccLat'][frame]
-                else:
-                    acc_side = 0
-                if  'VehKinematicAccTangent' in veh_obj_data.keys():
-                    acc_normal = veh_obj_data['VehKinematicAccTangent'][frame]
-                else:
-                    acc_normal = 0
-                blender_obj.keyframe_insert(data_path="rotation_euler", frame=frame)
-                blender_obj.scale = (acc_long,-1*acc_side,-1*acc_normal)
-                blender_obj.keyframe_insert(data_path="scale", frame=frame)
+            # Order needs to be YXZ
+            blender_obj.rotation_mode = 'YXZ'
+            keyframe_from_rest(blender_obj, "rotation_euler", held_channels(blender_obj.rotation_euler))
+            # Lateral and tangential components are already sign-flipped
+            keyframe_from_rest(blender_obj, "scale", acc_components.T, rest=(1.0, 1.0, 1.0))
             blender_obj.parent = blender_CG_obj
 
             blender_obj.rotation_euler = (0,0,0)
-            blender_obj.keyframe_insert(data_path="rotation_euler", frame=-1)
             blender_obj.scale = (1, 1, 1)
-            blender_obj.keyframe_insert(data_path="scale", frame=-1)
             assign_objects_to_subcollection(extras_collection_name, vehicle_collection, blender_obj)        
             assign_objects_to_collection(overall_acceleration_collection_name, blender_obj)
             
+        # Steering angle in radians, shared by the wheel and tire blocks below
+        steer_rad = veh_obj_data['VehWheelSteerDelta'][:numframes] * -deg2rad if 'VehWheelSteerDelta' in veh_obj_data else None
+
         # 'VehWheelx' indicates that it is a wheel and a child object
-        if 'VehWheelx' in veh_obj_data.keys():
+        if 'VehWheelx' in veh_obj_data:
             #print(veh_obj_data.keys())
             custprops_exclude = [''] # ['x','y','z','X','Y','Z','Roll','Pitch','Yaw','Gamma','Spin','Delta','Steer','Camber']
             blender_obj, exists = create_cylinder_obj(f"Wheel: {obj_name}: {vehicle_name}: {filename}")
             blender_obj.scale[1] = scale_factor * .65
             blender_obj.scale[0] = blender_obj.scale[2] = scale_factor    
             # Get the object
-            target_obj = bpy.data.objects.get(f"Tire: {obj_name}: Outer: {vehicle_name}: {filename}")
+            target_obj = data_objects.get(f"Tire: {obj_name}: Outer: {vehicle_name}: {filename}")
 
             if target_obj:                
                 custom_property_name = 'Radius'                 
@@ -1572,119 +1829,109 @@ def add_vehicle(context, vehicle_name, vehicles, scale_factor, numframes, name_m
                 else:
                     blender_obj.scale[0] = blender_obj.scale[2] = scale_factor
             # Get the object
-            target_obj = bpy.data.objects.get(f"Tire: {obj_name}: Inner: {vehicle_name}: {filename}")
+            target_obj = data_objects.get(f"Tire: {obj_name}: Inner: {vehicle_name}: {filename}")
             if target_obj and exists == False:                
                 #blender_obj.scale[1] = .4064
                 if blender_obj and blender_obj.type == 'MESH':
-                    bpy.ops.object.mode_set(mode='EDIT')
-                    bpy.ops.mesh.duplicate()
-                    # Duplicate the selected geometry
-                    bpy.ops.mesh.duplicate()
-                    # Move the duplicated geometry
-                    bpy.ops.transform.translate(value=(0,scale_factor, 0))
-                    bpy.ops.mesh.select_all(action='SELECT')
-                    bpy.ops.transform.translate(value=(0,-scale_factor/2, 0))
-                    bpy.ops.object.mode_set(mode='OBJECT')
+                    # Dual tires edit the geometry, so this wheel gets its own copy
+                    # of the shared cylinder, edited directly with bmesh.
+                    blender_obj.data = blender_obj.data.copy()
+                    # Offsets are world-space distances; the wheel is unparented here,
+                    # so its basis matrix maps them into mesh space
+                    to_local = blender_obj.matrix_basis.to_3x3().inverted()
+                    bm = bmesh.new()
+                    bm.from_mesh(blender_obj.data)
+                    # Duplicate the wheel geometry and move the copy one tire width along Y
+                    duplicated = bmesh.ops.duplicate(bm, geom=bm.verts[:] + bm.edges[:] + bm.faces[:])
+                    duplicated_verts = [elem for elem in duplicated["geom"] if isinstance(elem, bmesh.types.BMVert)]
+                    bmesh.ops.translate(bm, verts=duplicated_verts, vec=to_local @ mathutils.Vector((0, scale_factor, 0)))
+                    # Centre the pair on the wheel origin
+                    bmesh.ops.translate(bm, verts=bm.verts[:], vec=to_local @ mathutils.Vector((0, -scale_factor/2, 0)))
+                    bm.to_mesh(blender_obj.data)
+                    bm.free()
 
                 
-            camber = [0] * (numframes)
-            spin = [0] * (numframes)
-            steer = [0] * (numframes)
-            if 'VehWheelGamma' in veh_obj_data.keys(): camber = veh_obj_data['VehWheelGamma'] 
-            if 'VehWheelSpin' in veh_obj_data.keys(): spin = veh_obj_data['VehWheelSpin'] 
-            if 'VehWheelSteerDelta' in veh_obj_data.keys(): steer = veh_obj_data['VehWheelSteerDelta']
-            while frame < numframes-1:
-                frame = frame+1
-                blender_obj.location = (veh_obj_data['VehWheelx'][frame]*scale_factor_sub,veh_obj_data['VehWheely'][frame]*scale_factor_sub*-1,veh_obj_data['VehWheelz'][frame]*scale_factor_sub*-1)
-                # Order needs to be YXZ
-                blender_obj.rotation_mode = 'YXZ'
-                blender_obj.rotation_euler = (camber[frame]*deg2rad,spin[frame]*deg2rad,steer[frame]*-1*deg2rad)
-                blender_obj.keyframe_insert(data_path="location", frame=frame)
-                blender_obj.keyframe_insert(data_path="rotation_euler", frame=frame)
+            camber = variable_or_zeros(veh_obj_data, 'VehWheelGamma')
+            spin = variable_or_zeros(veh_obj_data, 'VehWheelSpin')
+            keyframe_frame_range(blender_obj, "location", (
+                veh_obj_data['VehWheelx'][:numframes]*scale_factor_sub,
+                veh_obj_data['VehWheely'][:numframes]*neg_scale_factor_sub,
+                veh_obj_data['VehWheelz'][:numframes]*neg_scale_factor_sub,
+            ))
+            # Order needs to be YXZ
+            blender_obj.rotation_mode = 'YXZ'
+            keyframe_from_rest(blender_obj, "rotation_euler", (camber*deg2rad, spin*deg2rad, steer_rad if steer_rad is not None else np.zeros(numframes)))
             blender_obj.parent = blender_CG_obj
             blender_obj.rotation_euler = (0,0,0)
-            blender_obj.keyframe_insert(data_path="rotation_euler", frame=-1)
             create_custom_properties(blender_obj,veh_obj_data,custprops_exclude)
             assign_objects_to_subcollection(wheels_collection_name, vehicle_collection, blender_obj)  
             
             
+        # Ground-contact track of the tire, scaled once for the tire empty, its path and its skid
+        if REQUIRED_TIRE_PATH_VARIABLES.issubset(veh_obj_data):
+            tire_track = np.column_stack((
+                veh_obj_data['VehTireX'][:numframes]*scale_factor,
+                veh_obj_data['VehTireY'][:numframes]*neg_scale_factor,
+                veh_obj_data['VehTireZ'][:numframes]*neg_scale_factor,
+            ))
+        else:
+            tire_track = None
+
         # 'VehTirex' indicates that it is a tire and a child object
-        if 'VehTirex' in veh_obj_data.keys() and 'VehTirey' in veh_obj_data.keys() and 'VehTirez' in veh_obj_data.keys():
+        if 'VehTirex' in veh_obj_data and 'VehTirey' in veh_obj_data and 'VehTirez' in veh_obj_data:
             #print(veh_obj_data.keys())
             custprops_exclude = [''] # ['x','y','z','X','Y','Z','Roll','Pitch','Yaw','Gamma','Spin','Delta','Steer','Camber']
             blender_tire_obj, exists = create_obj(f"Tire: {obj_name}: {vehicle_name}: {filename}")
             blender_tire_obj.empty_display_type = 'ARROWS'    
-            blender_tire_obj.empty_display_size = scale_factor*.002
-            while frame < numframes-1:
-                frame = frame+1
-                blender_tire_obj.location = (veh_obj_data['VehTirex'][frame]*scale_factor_sub,veh_obj_data['VehTirey'][frame]*scale_factor_sub*-1,veh_obj_data['VehTirez'][frame]*scale_factor_sub*-1)
-                blender_tire_obj.keyframe_insert(data_path="location", frame=frame)
-                if "VehTireFLong" in veh_obj_data.keys():     
-                    blender_tire_obj.scale.x = veh_obj_data["VehTireFLong"][frame]
-                    blender_tire_obj.keyframe_insert(data_path="scale", frame=frame)
-                if "VehTireFLat" in veh_obj_data.keys():     
-                    blender_tire_obj.scale.y = veh_obj_data["VehTireFLat"][frame] *-1 
-                    blender_tire_obj.keyframe_insert(data_path="scale", frame=frame)
-                if "VehTireFNorm" in veh_obj_data.keys():     
-                    blender_tire_obj.scale.z =  veh_obj_data["VehTireFNorm"][frame]
-                    blender_tire_obj.keyframe_insert(data_path="scale", frame=frame) 
-                if 'VehWheelSteerDelta' in veh_obj_data.keys(): 
-                    steer = veh_obj_data['VehWheelSteerDelta']
-                    blender_tire_obj.rotation_euler = (0,0,steer[frame]*-1*deg2rad)
-                    blender_tire_obj.keyframe_insert(data_path="rotation_euler", frame=frame)
+            blender_tire_obj.empty_display_size = tire_display_size
+            # The old per-frame loop continued from the wheel loop's last frame, so an
+            # object that is also a wheel gets no tire keys here
+            tire_start = numframes if 'VehWheelx' in veh_obj_data else 0
+            keyframe_frame_range(blender_tire_obj, "location", (
+                veh_obj_data['VehTirex'][:numframes]*scale_factor_sub,
+                veh_obj_data['VehTirey'][:numframes]*neg_scale_factor_sub,
+                veh_obj_data['VehTirez'][:numframes]*neg_scale_factor_sub,
+            ), start=tire_start)
+            tire_scale = tire_force_scale_channels(blender_tire_obj, veh_obj_data)
+            if tire_scale is not None:
+                keyframe_frame_range(blender_tire_obj, "scale", tire_scale, start=tire_start)
+            if steer_rad is not None and tire_start < numframes:
+                keyframe_frame_range(blender_tire_obj, "rotation_euler", (np.zeros(numframes), np.zeros(numframes), steer_rad), start=tire_start, rest=(0.0, 0.0, 0.0))
             blender_tire_obj.parent = blender_CG_obj
+            # Unsteered tires stay unrotated without a key; a lone key would only hold this value
             blender_tire_obj.rotation_euler = (0,0,0)
-            blender_tire_obj.keyframe_insert(data_path="rotation_euler", frame=-1)
             create_custom_properties(blender_tire_obj,veh_obj_data,custprops_exclude)
             assign_objects_to_subcollection(tires_collection_name, vehicle_collection, blender_tire_obj)
-        elif 'VehTireX' in veh_obj_data.keys() and  'VehTireY' in veh_obj_data.keys() and  'VehTireZ' in veh_obj_data.keys():     
+        elif tire_track is not None:
             custprops_exclude = [''] # ['x','y','z','X','Y','Z','Roll','Pitch','Yaw','Gamma','Spin','Delta','Steer','Camber']
-            blender_tire_obj, tire_exists = create_obj(f"Tire: {obj_name}: {vehicle_name}: {filename}")
-            if tire_exists == True:
-                bpy.data.objects.remove(blender_tire_obj, do_unlink=True)
-                blender_tire_obj, tire_exists = create_obj(f"Tire: {obj_name}: {vehicle_name}: {filename}")  
+            blender_tire_obj, tire_exists = create_obj(f"Tire: {obj_name}: {vehicle_name}: {filename}", recreate=True)
             
            
             blender_tire_obj.empty_display_type = 'ARROWS'    
-            blender_tire_obj.empty_display_size = scale_factor*.002
-            bpy.context.scene.frame_set(0)
-            frame = 0
-            blender_tire_obj.location = (veh_obj_data['VehTireX'][frame]*scale_factor,veh_obj_data['VehTireY'][frame]*scale_factor*-1,veh_obj_data['VehTireZ'][frame]*scale_factor*-1)
+            blender_tire_obj.empty_display_size = tire_display_size
+            if not cg_at_frame_zero:
+                blender_CG_obj.matrix_world = blender_CG_obj.matrix_basis
+                cg_at_frame_zero = True
+            blender_tire_obj.location = tire_track[0]
             print(blender_CG_obj.location)
             parent_keep_transform(blender_tire_obj, blender_CG_obj)
             blender_tire_obj.rotation_euler = (0,0,0)
-            blender_tire_obj.keyframe_insert(data_path="rotation_euler", frame=-1)          
-            while frame < numframes-1:
-                frame = frame+1              
-                if "VehTireFLong" in veh_obj_data.keys():     
-                    blender_tire_obj.scale.x = veh_obj_data["VehTireFLong"][frame]
-                    blender_tire_obj.keyframe_insert(data_path="scale", frame=frame)
-                if "VehTireFLat" in veh_obj_data.keys():     
-                    blender_tire_obj.scale.y = veh_obj_data["VehTireFLat"][frame] *-1
-                    blender_tire_obj.keyframe_insert(data_path="scale", frame=frame)
-                if "VehTireFNorm" in veh_obj_data.keys():     
-                    blender_tire_obj.scale.z =  veh_obj_data["VehTireFNorm"][frame]
-                    blender_tire_obj.keyframe_insert(data_path="scale", frame=frame) 
+            # The forces are keyed from frame 1, as the per-frame loop did
+            tire_scale = tire_force_scale_channels(blender_tire_obj, veh_obj_data)
+            if tire_scale is not None:
+                keyframe_frame_range(blender_tire_obj, "scale", tire_scale, start=1)
             create_custom_properties(blender_tire_obj,veh_obj_data,custprops_exclude) 
             assign_objects_to_subcollection(tires_collection_name, vehicle_collection, blender_tire_obj)    
 
         
         # 'VehTireX' indicates that it is a tire and a child object
-        if (create_tire_paths or create_skids) and 'VehTireX' in veh_obj_data.keys() and  'VehTireY' in veh_obj_data.keys() and  'VehTireZ' in veh_obj_data.keys():
-            # Define the points of the spline
-            points = []
-            # Custom  properties                       
-            custom_properties = {
-                "Skid": []
-            }
-            frame = -1
-            while frame < numframes-1:
-                frame = frame+1
-                points.append((veh_obj_data['VehTireX'][frame]*scale_factor, veh_obj_data['VehTireY'][frame]*-1*scale_factor, veh_obj_data['VehTireZ'][frame]*-1*scale_factor))
-                # Adding data to the dictionary
-                if "VehTireSkidFlag" in veh_obj_data.keys():
-                    custom_properties["Skid"].append(veh_obj_data['VehTireSkidFlag'][frame])   
-                
+        if (create_tire_paths or create_skids) and tire_track is not None:
+            # The spline follows the tire's ground-contact track
+            points = tire_track
+            # Custom  properties, converted once to the float32 buffer the Skid point attribute stores
+            custom_properties = {}
+            if "VehTireSkidFlag" in veh_obj_data:
+                custom_properties["Skid"] = np.asarray(veh_obj_data['VehTireSkidFlag'][:numframes], dtype=np.float32)
 
             if create_tire_paths:
                 # Create a new object with the curve data
@@ -1702,165 +1949,40 @@ def add_vehicle(context, vehicle_name, vehicles, scale_factor, numframes, name_m
             assign_objects_to_subcollection(skids_collection_name, vehicle_collection, skid_curve_object)                      
             assign_objects_to_collection(overall_skids_collection_name, skid_curve_object) 
        
-            existing_modifier = None
-            for mod in skid_curve_object.modifiers:
-                if mod.type == 'NODES' and mod.name == "GeometryNodes":
-                    existing_modifier = mod
-                    break
+            existing_modifier = get_geometry_nodes_modifier(skid_curve_object)
 
             # If no modifier exists, create a new one
             if existing_modifier is None:
                 # Add a Geometry Nodes modifier
                 geo_modifier = skid_curve_object.modifiers.new(name="GeometryNodes", type='NODES')
-              
-                # Check if the node group already exists
-                node_group = bpy.data.node_groups.get("TireSkids")
-                              
-                if node_group is None:
-                    node_group = bpy.data.node_groups.new(name="TireSkids", type='GeometryNodeTree')
-                    node_group.use_fake_user = True  # Prevent Blender from deleting it
-                    node_group.is_modifier = True
-                    # Add input and output nodes
-                    input_node = node_group.nodes.new(type='NodeGroupInput')
-                    output_node = node_group.nodes.new(type='NodeGroupOutput')
-                    
-                    node_group.interface.new_socket("Geometry", in_out='INPUT', socket_type='NodeSocketGeometry')
-                    node_group.interface.new_socket("Geometry", in_out='OUTPUT', socket_type='NodeSocketGeometry')
-                    
-                    # Position nodes
-                    input_node.location = (-200, 0)
-                    output_node.location = (200, 0)
-                                
-                    # Create a Mesh to Curve Node
-                    mesh_to_curve_node = node_group.nodes.new(type='GeometryNodeMeshToCurve')
-                    mesh_to_curve_node.location = (0, -200)
-                    
-                    # Create a Curve to Mesh Node
-                    curve_to_mesh_node = node_group.nodes.new(type='GeometryNodeCurveToMesh')
-                    curve_to_mesh_node.location = (200, -200)
-                    
-                    # Create a Curve Bezier Segment Node
-                    bezier_segment_node = node_group.nodes.new(type='GeometryNodeCurvePrimitiveBezierSegment')
-                    bezier_segment_node.location = (-200, -200)
-                    bezier_segment_node.inputs["Start"].default_value = (0.25*scale_factor, 0.0, 0.0)
-                    bezier_segment_node.inputs["End"].default_value = (-0.25*scale_factor, 0.0, 0.0)
-                    bezier_segment_node.inputs["Start Handle"].default_value = (0.0, 0.0, 0.0)
-                    bezier_segment_node.inputs["End Handle"].default_value = (0.0, 0.0, 0.0)           
-                    bezier_segment_node.inputs["Resolution"].default_value = 1    
-                    
-                    # Create a Separate Geometry Node
-                    separate_geometry_node = node_group.nodes.new(type='GeometryNodeSeparateGeometry')
-                    separate_geometry_node.location = (0, -400)
-                    separate_geometry_node.domain = 'FACE'
-                    
-                    # Create a Set Material Node
-                    set_material_node = node_group.nodes.new(type='GeometryNodeSetMaterial')
-                    set_material_node.location = (200, -400)
-
-                    # Create or get the material
-                    material_name = "TireSkids"
-                    material = bpy.data.materials.get(material_name)
-                    if material is None:
-                        material = bpy.data.materials.new(name=material_name)
-                       # Ensure the material uses nodes
-                        material.use_nodes = True
-                        material_tree = material.node_tree
-
-                        # Clear any existing nodes
-                        material_tree.nodes.clear()
-
-                        # Create an Attribute Node
-                        attribute_node = material_tree.nodes.new(type='ShaderNodeAttribute')
-                        attribute_node.location = (-600, -400)
-                        attribute_node.attribute_name = "Skid"
-
-                        # Create a Gamma Node
-                        gamma_node = material_tree.nodes.new(type='ShaderNodeGamma')
-                        gamma_node.location = (-400, -400)
-                        gamma_node.inputs["Gamma"].default_value = 1
-
-                        # Create a Principled BSDF Node
-                        principled_bsdf_node = material_tree.nodes.new(type='ShaderNodeBsdfPrincipled')
-                        principled_bsdf_node.location = (-200, -400)
-                        principled_bsdf_node.inputs["Base Color"].default_value = (0,0,0,1)
-
-                        # Create a Material Output Node
-                        material_output_node = material_tree.nodes.new(type='ShaderNodeOutputMaterial')
-                        material_output_node.location = (0, -400)
-
-                        # Connect shader nodes in the material node tree
-                        material_tree.links.new(attribute_node.outputs["Color"], gamma_node.inputs["Color"])
-                        material_tree.links.new(gamma_node.outputs["Color"], principled_bsdf_node.inputs["Alpha"])
-                        material_tree.links.new(principled_bsdf_node.outputs["BSDF"], material_output_node.inputs["Surface"])
-
-                    # Assign the material to Set Material node
-                    set_material_node.inputs["Material"].default_value = material
-                     
-                    # Create an Index Node
-                    index_node = node_group.nodes.new(type='GeometryNodeInputIndex')
-                    index_node.location = (-400, -400)
-                    
-                    # Create a Scene Time Node
-                    scene_time_node = node_group.nodes.new(type='GeometryNodeInputSceneTime')
-                    scene_time_node.location = (-400, -600)
-                    
-                    # Create a Less Than Node
-                    less_than_node = node_group.nodes.new(type='FunctionNodeCompare')
-                    less_than_node.operation = 'LESS_THAN'
-                    less_than_node.location = (-200, -600)
-                    
-                    # Create a Set Position node
-                    set_position_node = node_group.nodes.new(type='GeometryNodeSetPosition')
-                    set_position_node.location = (0, 0)
-
-                    # Create a Combine XYZ node to define the offset vector (0, 0, 0.001)
-                    combine_xyz_node = node_group.nodes.new(type='ShaderNodeCombineXYZ')
-                    combine_xyz_node.location = (-200, 0)
-                    
-                    # Set the Z value to 0.001 (X and Y remain 0)
-                    combine_xyz_node.inputs[0].default_value = 0  # X
-                    combine_xyz_node.inputs[1].default_value = 0  # Y
-                    combine_xyz_node.inputs[2].default_value = 0.001  # Z           
-                    
-                    # Connect nodes
-                    node_group.links.new(input_node.outputs["Geometry"], mesh_to_curve_node.inputs["Mesh"])
-                    node_group.links.new(mesh_to_curve_node.outputs["Curve"], curve_to_mesh_node.inputs["Curve"])
-                    node_group.links.new(bezier_segment_node.outputs["Curve"], curve_to_mesh_node.inputs["Profile Curve"])
-                    node_group.links.new(curve_to_mesh_node.outputs["Mesh"], separate_geometry_node.inputs["Geometry"])
-                    node_group.links.new(separate_geometry_node.outputs["Selection"], set_material_node.inputs["Geometry"])
-                    node_group.links.new(index_node.outputs["Index"], less_than_node.inputs[0])
-                    node_group.links.new(scene_time_node.outputs["Frame"], less_than_node.inputs[1])
-                    node_group.links.new(less_than_node.outputs["Result"],separate_geometry_node.inputs["Selection"])
-                    node_group.links.new(set_material_node.outputs["Geometry"], set_position_node.inputs["Geometry"])
-                    node_group.links.new(combine_xyz_node.outputs[0], set_position_node.inputs["Offset"])
-                    node_group.links.new(set_position_node.outputs["Geometry"], output_node.inputs["Geometry"])
-                geo_modifier.node_group = node_group 
+                geo_modifier.node_group = ensure_tire_skids_node_group(scale_factor)
             else:
                 geo_modifier = existing_modifier
                 print("Using existing Geometry Nodes modifier.")                    
 
             
         # large VehAccelX is an accelerometer
-        if 'VehAccelX' in veh_obj_data.keys() and 'VehAccelY' in veh_obj_data.keys(): 
+        if 'VehAccelX' in veh_obj_data and 'VehAccelY' in veh_obj_data: 
             custprops_exclude = ['']
-            blender_accel_obj, loc_exists = create_obj(f"Accelerometer: {obj_name}: {vehicle_name}: {filename}")
-            if loc_exists == True:
-                bpy.data.objects.remove(blender_accel_obj, do_unlink=True)
-                blender_accel_obj, loc_exists = create_obj(f"Accelerometer: {obj_name}: {vehicle_name}: {filename}")  
+            blender_accel_obj, loc_exists = create_obj(f"Accelerometer: {obj_name}: {vehicle_name}: {filename}", recreate=True)
             
            
             blender_accel_obj.empty_display_type = 'SPHERE'    
             blender_accel_obj.empty_display_size = scale_factor * .15
-            bpy.context.scene.frame_set(0)
-            frame = 0
-            locationx = veh_obj_data['VehAccelX'][frame]*scale_factor
-            locationy = veh_obj_data['VehAccelY'][frame]*scale_factor*-1
-            if 'VehAccelZ' in veh_obj_data.keys():
-                locationz = veh_obj_data['VehAccelZ'][frame]*scale_factor*-1
+            if not cg_at_frame_zero:
+                blender_CG_obj.matrix_world = blender_CG_obj.matrix_basis
+                cg_at_frame_zero = True
+            # Scale the accelerometer track once; the object, its path and its
+            # velocity arrow all read from these arrays
+            accel_x = veh_obj_data['VehAccelX'][:numframes]*scale_factor
+            accel_y = veh_obj_data['VehAccelY'][:numframes]*neg_scale_factor
+            if 'VehAccelZ' in veh_obj_data:
+                accel_z = veh_obj_data['VehAccelZ'][:numframes]*neg_scale_factor
             else:
-                locationz = blender_CG_obj.location[2]
+                accel_z = np.full(numframes, blender_CG_obj.location[2])
+            accel_location_start = (accel_x[0], accel_y[0], accel_z[0])
 
-            blender_accel_obj.location = (locationx,locationy,locationz)
+            blender_accel_obj.location = accel_location_start
 
             parent_keep_transform(blender_accel_obj, blender_CG_obj)
  
@@ -1869,34 +1991,18 @@ def add_vehicle(context, vehicle_name, vehicles, scale_factor, numframes, name_m
             assign_objects_to_subcollection(extras_collection_name, vehicle_collection, blender_accel_obj)    
 
             if create_paths:
-                # Define the points of the spline
-                points = []
-                # Custom  properties
+                # Define the points of the spline as one (numframes, 3) array
+                points = np.column_stack((accel_x, accel_y, accel_z))
+                # Custom  properties; the CG rotation is held at its frame 0 value
+                roll, pitch, yaw = held_channels(blender_CG_obj.rotation_euler)
                 custom_properties = {
-                    "X": [],
-                    "Y": [],
-                    "Z": [],
-                    "Roll": [],
-                    "Pitch": [],
-                    "Yaw": [],
+                    "X": accel_x,
+                    "Y": accel_y,
+                    "Z": accel_z,
+                    "Roll": roll,
+                    "Pitch": pitch,
+                    "Yaw": yaw,
                 }
-                frame = -1
-                while frame < numframes-1:
-                    frame = frame+1
-                    locationx = veh_obj_data['VehAccelX'][frame]*scale_factor
-                    locationy = veh_obj_data['VehAccelY'][frame]*scale_factor*-1
-                    if 'VehAccelZ' in veh_obj_data.keys():
-                        locationz = veh_obj_data['VehAccelZ'][frame]*scale_factor*-1
-                    else:
-                        locationz = blender_CG_obj.location[2]
-                    points.append((locationx, locationy, locationz))
-                    # Adding data to the dictionary
-                    custom_properties["X"].append(locationx)
-                    custom_properties["Y"].append(locationy)
-                    custom_properties["Z"].append(locationz)
-                    custom_properties["Roll"].append(blender_CG_obj.rotation_euler[0])
-                    custom_properties["Pitch"].append(blender_CG_obj.rotation_euler[1])
-                    custom_properties["Yaw"].append(blender_CG_obj.rotation_euler[2])
                 # Create a new object with the curve data
             
                 curve_object = create_curve_obj(f"Accelerometer Path: {obj_name}: {vehicle_name}: {filename}",points, custom_properties)
@@ -1907,68 +2013,33 @@ def add_vehicle(context, vehicle_name, vehicles, scale_factor, numframes, name_m
                 add_or_get_geometry_nodes_modifier(curve_object, node_group_name="AccelerometerPaths", base_color=(1 , .25, 0, 1))
             
             #Velocity Vectors
-            if create_velocities and 'VehAccelVTotal' in veh_obj_data.keys()  :
+            if create_velocities and 'VehAccelVTotal' in veh_obj_data  :
                 blender_accel_vel_obj, velocity_exists = create_arrowhead(f"Accelerometer Velocity: {obj_name}: {vehicle_name}: {filename}", 1)
                 if velocity_exists == True:
-                    bpy.data.objects.remove(blender_accel_vel_obj, do_unlink=True)
+                    remove_obj(blender_accel_vel_obj)
                     blender_accel_vel_obj, velocity_exists = create_arrowhead(f"Accelerometer Velocity: {obj_name}: {vehicle_name}: {filename}", 1)
                 
                
-                frame = -1
-                while frame < numframes-1:
-                    frame = frame+1
-                    # Order needs to be YXZ
-                    blender_accel_vel_obj.rotation_mode = 'YXZ'
-                    # Extract velocity components
-                    if 'VehAccelVLong' in veh_obj_data.keys():
-                        v_long = veh_obj_data['VehAccelVLong'][frame]
-                    else:
-                        v_long = 0
-                    if 'VehAccelVSide' in veh_obj_data.keys(): 
-                        v_side = veh_obj_data['VehAccelVSide'][frame]            
-                    else:
-                        v_side = 0 
-                    if 'VehAccelVNormal' in veh_obj_data.keys():
-                        v_normal = veh_obj_data['VehAccelVNormal'][frame]
-                    else: 
-                        v_normal = 0                  
-                    if v_long == 0:
-                        sideslip = 0
-                    else:    
-                        sideslip = math.atan2(v_side, v_long)
-
-                    # Compute the denominator safely
-                    denominator = math.sqrt(v_long**2 + v_side**2)
-
-                    # Prevent division by zero
-                    if denominator == 0:
-                        angle = 0  # Default angle when denominator is zero
-                    else:
-                        angle = math.atan2(v_normal, denominator)
-
-                    # Apply rotation
-                    blender_accel_vel_obj.rotation_euler = (0, math.pi/2 + angle, sideslip * -1 )
-                    blender_accel_vel_obj.keyframe_insert(data_path="rotation_euler", frame=frame)
-                    blender_accel_vel_obj.scale = (1,1,veh_obj_data['VehAccelVTotal'][frame])
-                    blender_accel_vel_obj.keyframe_insert(data_path="scale",index=2, frame=frame)
-                
-                frame = 0
-                locationx = veh_obj_data['VehAccelX'][frame]*scale_factor
-                locationy = veh_obj_data['VehAccelY'][frame]*scale_factor*-1
-                if 'VehAccelZ' in veh_obj_data.keys():
-                    locationz = veh_obj_data['VehAccelZ'][frame]*scale_factor*-1
-                else:
-                    locationz = blender_CG_obj.location[2]
-                
-                
-                blender_accel_vel_obj.location = (locationx,locationy,locationz)
+                # Order needs to be YXZ
+                blender_accel_vel_obj.rotation_mode = 'YXZ'
+                # Extract velocity components (missing ones stay zero)
+                v_long = variable_or_zeros(veh_obj_data, 'VehAccelVLong')
+                v_side = variable_or_zeros(veh_obj_data, 'VehAccelVSide')
+                v_normal = variable_or_zeros(veh_obj_data, 'VehAccelVNormal')
+                sideslip = np.where(v_long == 0, 0.0, np.arctan2(v_side, v_long))
+                # Elevation angle, zero where the planar speed is zero
+                denominator = np.hypot(v_long, v_side)
+                angle = np.where(denominator == 0, 0.0, np.arctan2(v_normal, denominator))
+                # Key the rotation and length for every frame, resting flat with a length of 1 on frame -1
+                keyframe_from_rest(blender_accel_vel_obj, "rotation_euler", (np.zeros(numframes), math.pi/2 + angle, sideslip * -1))
+                keyframe_from_rest(blender_accel_vel_obj, "scale", (None, None, veh_obj_data['VehAccelVTotal']), rest=(1.0, 1.0, 1.0))
+
+                blender_accel_vel_obj.location = accel_location_start
 
                 parent_keep_transform(blender_accel_vel_obj, blender_accel_obj)
      
                 blender_accel_vel_obj.rotation_euler = (0,0,0)
-                blender_accel_vel_obj.keyframe_insert(data_path="rotation_euler", frame=-1)
                 blender_accel_vel_obj.scale = (20, 20, 1)
-                blender_accel_vel_obj.keyframe_insert(data_path="scale", index=2,frame=-1)
                 assign_objects_to_subcollection(extras_collection_name, vehicle_collection, blender_accel_vel_obj)  
                 assign_objects_to_collection(overall_velocity_collection_name, blender_accel_vel_obj)     
 
@@ -1989,53 +2060,42 @@ def add_vehicle(context, vehicle_name, vehicles, scale_factor, numframes, name_m
     assign_objects_to_collection(overall_cameras_collection_name, cam_object)
 
     if 'DriverOut' in vehicles[vehicle_name]:
+        driver_data = vehicles[vehicle_name]['DriverOut']
         #Steering Wheel
-        if 'VehDriverSteerAngle' in vehicles[vehicle_name]['DriverOut'].keys():
+        if 'VehDriverSteerAngle' in driver_data:
             obj, exists = create_obj(f"Steering: {vehicle_name}: {filename}")
             obj.empty_display_type = 'SPHERE'    
             obj.empty_display_size = scale_factor * .6
             obj.scale.y = 0
             obj.location = (.75,.25,.25)
-            frame = -1
-            while frame < numframes-1:
-                frame = frame + 1
-                obj.rotation_euler = (0, -1*vehicles[vehicle_name]['DriverOut']['VehDriverSteerAngle'][frame]*deg2rad,  math.pi/2)
-                obj.keyframe_insert(data_path="rotation_euler", frame=frame)
+            steer_angle = driver_data['VehDriverSteerAngle'][:numframes]
+            keyframe_from_rest(obj, "rotation_euler", (np.zeros(numframes), -1*steer_angle*deg2rad, np.full(numframes, math.pi/2)), rest=(0.0, 0.0, math.pi/2))
             obj.parent = blender_CG_obj
             obj.rotation_euler = (0,0, math.pi/2)
-            obj.keyframe_insert(data_path="rotation_euler", frame=-1)
             assign_objects_to_subcollection(extras_collection_name, vehicle_collection, obj)
     
         #Brake Pedal
-        if 'VehDriverBrakePdlForce' in vehicles[vehicle_name]['DriverOut'].keys():
+        if 'VehDriverBrakePdlForce' in driver_data:
             obj, exists = create_obj(f"Brake: {vehicle_name}: {filename}")
             obj.empty_display_type = 'SINGLE_ARROW'    
-            obj.empty_display_size = scale_factor * 1.5
+            obj.empty_display_size = pedal_display_size
             obj.location = (.75,.25,-.5)
-            frame = -1
-            while frame < numframes-1:
-                frame = frame + 1
-                obj.scale = (1,1,vehicles[vehicle_name]['DriverOut']['VehDriverBrakePdlForce'][frame]/100)
-                obj.keyframe_insert(data_path="scale", frame=frame)
+            brake_force = driver_data['VehDriverBrakePdlForce'][:numframes]
+            keyframe_from_rest(obj, "scale", (np.ones(numframes), np.ones(numframes), brake_force/100), rest=(1.0, 1.0, 1.0))
             obj.parent = blender_CG_obj
             obj.scale = (1,1,1)
-            obj.keyframe_insert(data_path="scale", frame=-1)
             assign_objects_to_subcollection(extras_collection_name, vehicle_collection, obj)
             
         #Throttle DriverOut
-        if 'VehDriverThrottlePos' in vehicles[vehicle_name]['DriverOut'].keys():
+        if 'VehDriverThrottlePos' in driver_data:
             obj, exists = create_obj(f"Throttle Posn: {vehicle_name}: {filename}")
             obj.empty_display_type = 'SINGLE_ARROW'    
-            obj.empty_display_size = scale_factor * 1.5
+            obj.empty_display_size = pedal_display_size
             obj.location = (.75,.3,-.5)
-            frame = -1
-            while frame < numframes-1:
-                frame = frame + 1
-                obj.scale = (1,1,vehicles[vehicle_name]['DriverOut']['VehDriverThrottlePos'][frame])
-                obj.keyframe_insert(data_path="scale", frame=frame)
+            throttle = driver_data['VehDriverThrottlePos'][:numframes]
+            keyframe_from_rest(obj, "scale", (np.ones(numframes), np.ones(numframes), throttle), rest=(1.0, 1.0, 1.0))
             obj.parent = blender_CG_obj
             obj.scale = (1,1,1)
-            obj.keyframe_insert(data_path="scale", frame=-1)
             assign_objects_to_subcollection(extras_collection_name, vehicle_collection, obj)
     
 def load(context,
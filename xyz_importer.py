@@ -1,6 +1,5 @@
 import bpy
 import csv
-import os
 import math
 import mathutils  # Blender's math utilities library
 from bpy.props import (
@@ -268,8 +267,6 @@ def load(context,
 
     if bpy.ops.object.mode_set.poll():
         bpy.ops.object.mode_set(mode='OBJECT') 
-        
-    dirname = os.path.dirname(filepath)        
 
     import_points_and_create_circles(context, 
             filepath, 